@@ -0,0 +1,98 @@
+"""
+Compares formatting temperature, dewpoint, humidity and precipitation columns row by row with the scalar
+formatters against the batch formatters, with NumPy (when installed) and with the array.array fallback.
+
+Usage: python -m benchmarks.bench_batch_formatters [--periods 10000] [--repeat 10]
+"""
+import argparse
+import math
+import time
+from array import array
+from utils import formatters, temperature_conversion
+from utils import format_temperature, format_dewpoint, format_precipitation_probability, format_relative_humidity, \
+    format_number, format_temperatures, format_dewpoints, format_precipitation_probabilities, \
+    format_relative_humidities
+from .payloads import hourly_payload
+
+
+def _best_of(repeat: int, function) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _columns(periods: int) -> dict[str, array]:
+    """Builds float columns (NaN for missing values) from a synthetic hourly forecast, as a ForecastStore holds them."""
+    payload = hourly_payload(days=math.ceil(periods / 24))["properties"]["periods"][:periods]
+    columns = {name: array("d") for name in ("temperature", "dewpoint", "relative_humidity", "precipitation")}
+    for index, period in enumerate(payload):
+        columns["temperature"].append(period["temperature"])
+        # Leave some values missing so both paths have to handle them
+        columns["dewpoint"].append(math.nan if index % 50 == 0 else period["dewpoint"]["value"])
+        columns["relative_humidity"].append(period["relativeHumidity"]["value"])
+        columns["precipitation"].append(period["probabilityOfPrecipitation"]["value"])
+    return columns
+
+
+def _scalar(columns: dict[str, array]) -> list:
+    def number(value):
+        return None if math.isnan(value) else value
+
+    return [
+        [format_temperature(value, "F") for value in columns["temperature"]],
+        [format_dewpoint(number(value), "wmoUnit:degC") for value in columns["dewpoint"]],
+        [format_relative_humidity(format_number(number(value))) for value in columns["relative_humidity"]],
+        [format_precipitation_probability(format_number(number(value))) for value in columns["precipitation"]],
+    ]
+
+
+def _batch(columns: dict[str, array]) -> list:
+    return [
+        list(zip(*format_temperatures(columns["temperature"], "F"))),
+        list(zip(*format_dewpoints(columns["dewpoint"], "wmoUnit:degC"))),
+        format_relative_humidities(columns["relative_humidity"]),
+        format_precipitation_probabilities(columns["precipitation"]),
+    ]
+
+
+def _clear_scalar_caches() -> None:
+    # The scalar formatters keep lru_caches; clear them so every timed run does the same work
+    for function in (formatters._format_celsius, formatters._format_fahrenheit,
+                     formatters.format_precipitation_probability, formatters.format_relative_humidity):
+        function.cache_clear()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--periods", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    columns = _columns(args.periods)
+    expected = _scalar(columns)
+
+    timings = {"scalar, row by row": _best_of(args.repeat, lambda: (_clear_scalar_caches(), _scalar(columns)))}
+
+    numpy = temperature_conversion.load_numpy()
+    if numpy is not None:
+        assert _batch(columns) == expected, "NumPy batch output differs from the scalar formatters"
+        timings["batch, NumPy"] = _best_of(args.repeat, lambda: _batch(columns))
+
+    temperature_conversion.numpy = None
+    try:
+        assert _batch(columns) == expected, "array.array batch output differs from the scalar formatters"
+        timings["batch, array.array"] = _best_of(args.repeat, lambda: _batch(columns))
+    finally:
+        temperature_conversion.numpy = numpy
+
+    print(f"{args.periods} periods x 4 columns, best of {args.repeat}"
+          f"{'' if numpy is not None else ' (NumPy not installed)'}")
+    for name, seconds in timings.items():
+        print(f"  {name:<22} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compares loading hourly forecasts from CSV with loading them from a memory-mapped ForecastStore.
+
+Usage: python -m benchmarks.bench_forecast_store [--days 7] [--repeat 50]
+"""
+import argparse
+import os
+import tempfile
+import time
+from models import HourlyForecastManager
+from models.forecast_store import ForecastStore, convert_csv_to_store
+from services.forecast_export import CsvForecastExporter
+from services.forecast_rows import hourly_forecast_rows
+from .payloads import hourly_payload
+
+
+def _best_of(repeat: int, function) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = hourly_forecast_rows(hourly_payload(args.days))
+    with tempfile.TemporaryDirectory() as directory:
+        csv_file = os.path.join(directory, "hourly_forecast_data.csv")
+        store_file = os.path.join(directory, "hourly_forecast_data" + ForecastStore.EXTENSION)
+        CsvForecastExporter._write(csv_file, list(rows[0]), rows)
+        convert_csv_to_store(csv_file, store_file)
+
+        def open_store_columns():
+            store = ForecastStore.open(store_file)
+            sum(store.columns["temperature"])
+            store.close()
+
+        timings = {
+            "csv -> HourlyForecastManager": _best_of(
+                args.repeat, lambda: HourlyForecastManager(csv_file, "").load_forecasts()),
+            "store -> HourlyForecastManager": _best_of(
+                args.repeat, lambda: HourlyForecastManager(None, "").load_store(store_file)),
+            "store -> mmap + scan temperature column": _best_of(args.repeat, open_store_columns),
+        }
+
+        print(f"{len(rows)} hourly periods, best of {args.repeat}")
+        print(f"  CSV size:   {os.path.getsize(csv_file):>8} bytes")
+        print(f"  Store size: {os.path.getsize(store_file):>8} bytes")
+        for name, seconds in timings.items():
+            print(f"  {name:<42} {seconds * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Measures how long HourlyForecastTab.update_data takes to populate and paint, and how many widgets it holds.
+
+Usage: QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_hourly_tab [--days 7] [--repeat 5]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QWidget
+from models import HourlyForecastManager
+from services.forecast_rows import hourly_forecast_rows
+from ui.hourly_forecast import HourlyForecastTab
+from ui.theme import apply_theme
+from .payloads import hourly_payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    apply_theme(app=app)
+    manager = HourlyForecastManager.from_rows(hourly_forecast_rows(hourly_payload(args.days)), "")
+
+    tab = HourlyForecastTab()
+    tab.resize(580, 550)
+    tab.show()
+    app.processEvents()
+
+    populate_times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        tab.update_data("", manager.time_index)
+        tab.grab()  # Forces layout and a full paint of the visible area
+        app.processEvents()
+        populate_times.append(time.perf_counter() - start)
+
+    print(f"{len(manager.forecasts)} hourly periods, {args.repeat} populates")
+    print(f"  first populate + paint: {populate_times[0] * 1000:8.1f} ms")
+    print(f"  best populate + paint:  {min(populate_times) * 1000:8.1f} ms")
+    print(f"  widgets in tab:         {len(tab.findChildren(QWidget)):8d}")
+
+
+if __name__ == "__main__":
+    main()
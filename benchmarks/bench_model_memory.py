@@ -0,0 +1,56 @@
+"""
+Measures how much memory the hourly forecast models hold per period, using tracemalloc.
+
+Usage: python -m benchmarks.bench_model_memory [--days 7]
+"""
+import argparse
+import sys
+import tracemalloc
+from models.hourly_forecast_class import HourlyForecast
+from services.forecast_rows import hourly_forecast_rows
+from .payloads import hourly_payload
+
+
+def _traced_bytes(function):
+    """Returns what function() returned and the bytes it left allocated."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=7)
+    args = parser.parse_args()
+
+    payload = hourly_payload(args.days)
+    rows, rows_bytes = _traced_bytes(lambda: hourly_forecast_rows(payload))
+
+    def build_and_display():
+        # Build the models and read every field the UI shows, keeping whatever the models hold on to afterwards
+        built = [HourlyForecast.from_dict(row) for row in rows]
+        for forecast in built:
+            (forecast.date, forecast.time, forecast.temperature_fahrenheit, forecast.precipitation_probability,
+             forecast.dewpoint_fahrenheit, forecast.relative_humidity, forecast.wind, forecast.weather_emoji,
+             forecast.short_forecast)
+        return built
+
+    # The first load fills the shared icon and string caches; measure a refresh, when they are already warm
+    _, first_load_bytes = _traced_bytes(build_and_display)
+    forecasts, forecasts_bytes = _traced_bytes(lambda: [HourlyForecast.from_dict(row) for row in rows])
+    _, displayed_bytes = _traced_bytes(build_and_display)
+
+    count = len(forecasts)
+    print(f"{count} hourly periods")
+    print(f"  HourlyForecast instance (shallow): {sys.getsizeof(forecasts[0]):>6} bytes")
+    print(f"  models per period:                 {forecasts_bytes / count:>8.1f} bytes")
+    print(f"  models per period, fields read:    {displayed_bytes / count:>8.1f} bytes")
+    print(f"  first load, shared caches filling: {first_load_bytes / count:>8.1f} bytes")
+    print(f"  CSV-layout rows per period:        {rows_bytes / count:>8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Measures the application's cold start: time from launching the interpreter to the main window's first paint, and
+what `python -X importtime` reports for the imports done before it.
+
+Each run starts a fresh interpreter under QT_QPA_PLATFORM=offscreen that starts up the way main.py does and exits
+at the first paint event of the window.
+
+Usage: python -m benchmarks.bench_startup [--repeat 10] [--top 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Starts up like main.py and prints the wall-clock time of the window's first paint
+_PROBE = """
+import sys, time
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QApplication
+from ui import WeatherMainWindow, apply_theme
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            print(time.time())
+            app.quit()
+        return False
+
+
+app = QApplication(sys.argv)
+apply_theme(app=app)
+window = WeatherMainWindow()
+first_paint = FirstPaint()
+window.installEventFilter(first_paint)
+window.show()
+app.exec_()
+"""
+
+# Modules worth knowing about when they are imported before the first paint
+_WATCHED_MODULES = ("ui", "services", "models", "utils", "requests", "geopy", "numpy", "PyQt5.QtNetwork",
+                    "ui.hourly_forecast")
+
+
+def _run_once() -> tuple[float, dict[str, tuple[int, int]]]:
+    """Returns the seconds to first paint and the -X importtime (self, cumulative) microseconds by module."""
+    environment = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    start = time.time()
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", _PROBE], cwd=root, env=environment,
+                             capture_output=True, text=True, check=True)
+    first_paint = float(process.stdout.split()[-1])
+
+    imports = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        imports[name.strip()] = (int(own), int(cumulative))
+    return first_paint - start, imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to list")
+    args = parser.parse_args()
+
+    _run_once()  # Warms the OS file cache and the bytecode caches
+    runs = [_run_once() for _ in range(args.repeat)]
+    paint_times = [seconds for seconds, _ in runs]
+    imports = runs[-1][1]
+
+    print(f"Time to first paint over {args.repeat} runs: median {statistics.median(paint_times) * 1000:.1f} ms, "
+          f"min {min(paint_times) * 1000:.1f} ms")
+    total = sum(own for own, _ in imports.values())
+    print(f"Imports before first paint (last run): {len(imports)} modules, {total / 1000:.1f} ms")
+
+    print("Watched modules (cumulative import time):")
+    for name in _WATCHED_MODULES:
+        cumulative = f"{imports[name][1] / 1000:7.1f} ms" if name in imports else "    not imported"
+        print(f"  {name:<18} {cumulative}")
+
+    print("Slowest imports by own time:")
+    for name, (own, cumulative) in sorted(imports.items(), key=lambda item: item[1][0], reverse=True)[:args.top]:
+        print(f"  {name:<40} {own / 1000:7.1f} ms (cumulative {cumulative / 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
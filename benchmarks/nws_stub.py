@@ -0,0 +1,364 @@
+"""
+A local stand-in for the NWS API (api.weather.gov), for offline benchmarks and load tests of the fetch pipeline.
+
+Serves /points/{latitude},{longitude}, the daily and hourly gridpoint forecasts it links to, and weather icons,
+from recorded fixture files when a fixtures directory is given and from the synthetic payloads otherwise. URLs in
+the responses point back at the stub, so every request a client makes stays local. Latency, injected errors
+(500, 503 and timeouts) and ETag revalidation are configurable.
+
+Point the app or the batch command at it with NWS_API_BASE_URL (or --api-base-url):
+
+    python -m benchmarks.nws_stub --port 8080 --latency 0.05 --error-rate 0.1
+    NWS_API_BASE_URL=http://127.0.0.1:8080 python main.py
+
+Fixtures are recorded from the live API with:
+
+    python -m benchmarks.nws_stub --record 39.7456,-97.0892 --fixtures benchmarks/fixtures
+
+Usage: python -m benchmarks.nws_stub [--port 8080] [--fixtures DIR] [--days 7] [--latency 0] [--latency-jitter 0]
+                                     [--error-rate 0] [--errors 500,503,timeout] [--timeout-delay 15]
+                                     [--no-etag] [--max-age 0] [--seed 0] [--record LAT,LON]
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Self
+from .payloads import daily_payload, hourly_payload
+
+NWS_API_BASE_URL = "https://api.weather.gov"
+
+# Fixture file names in a fixtures directory, by kind of response
+FIXTURE_FILES = {
+    "points": "points.json",
+    "forecast": "forecast.json",
+    "forecast_hourly": "forecast_hourly.json",
+    "icon": "icon.png"
+}
+
+ERROR_KINDS = ("500", "503", "timeout")
+
+_POINTS_PATH = re.compile(r"^/points/(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)$")
+_FORECAST_PATH = re.compile(r"^/gridpoints/(\w+)/(-?\d+),(-?\d+)/forecast(/hourly)?$")
+
+
+def _placeholder_icon(size: int = 86) -> bytes:
+    """Returns a plain PNG image to serve when no icon was recorded."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    pixels = b"".join(b"\x00" + b"\x5b\x8d\xd6" * size for _ in range(size))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(pixels)) + chunk(b"IEND", b""))
+
+
+class NwsStubServer:
+    """
+    A threaded HTTP server imitating the NWS API. Use start() and stop(), or a with block, to run it in the
+    background; base_url is the value to use as NWS_API_BASE_URL.
+
+    Every response waits `latency` seconds plus up to `latency_jitter` more. Each request fails with probability
+    `error_rate`, picking one of `errors`: a 500 or 503 response, or a "timeout" that holds the connection for
+    `timeout_delay` seconds and closes it without answering. fail_next() queues failures for the next requests
+    instead, and slow_down() delays the requests for some paths. With `etag`, responses carry an ETag and a
+    matching If-None-Match gets a 304; `max_age` is the Cache-Control max-age sent with forecasts.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, fixtures_dir: str | None = None, days: int = 7,
+                 latency: float = 0.0, latency_jitter: float = 0.0, error_rate: float = 0.0,
+                 errors: tuple[str, ...] = ERROR_KINDS, timeout_delay: float = 15.0, etag: bool = True,
+                 max_age: int = 0, seed: int = 0) -> None:
+        unknown = set(errors) - set(ERROR_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown error kinds: {', '.join(sorted(unknown))}")
+
+        self.fixtures_dir = fixtures_dir
+        self.days = days
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.errors = tuple(errors)
+        self.timeout_delay = timeout_delay
+        self.etag = etag
+        self.max_age = max_age
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._queued_failures: list[str] = []
+        self._stats = {"requests": 0, "in_flight": 0, "peak_in_flight": 0, "not_modified": 0}
+        self._status_counts: dict[str, int] = {}
+        self._request_log: list[str] = []
+        self._path_delays: dict[str, float] = {}
+        self._bodies: dict[str, bytes] = {}
+
+        self._server = ThreadingHTTPServer((host, port), _NwsStubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> Self:
+        """Starts serving on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="nws-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self) -> None:
+        """Serves on the calling thread until interrupted, then closes the listening socket."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def fail_next(self, count: int = 1, kind: str = "500") -> None:
+        """Makes the next `count` requests fail with the given error kind."""
+        if kind not in ERROR_KINDS:
+            raise ValueError(f"Unknown error kind: {kind}")
+        with self._lock:
+            self._queued_failures.extend([kind] * count)
+
+    def slow_down(self, path_prefix: str, seconds: float) -> None:
+        """Adds `seconds` of latency to every request whose path starts with `path_prefix`."""
+        with self._lock:
+            self._path_delays[path_prefix] = seconds
+
+    def stats(self) -> dict:
+        """Returns request counters, the peak number of concurrent requests and the responses sent by status."""
+        with self._lock:
+            return dict(self._stats, statuses=dict(self._status_counts))
+
+    def request_log(self) -> list[str]:
+        """Returns the path of every request received, in arrival order."""
+        with self._lock:
+            return list(self._request_log)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.update(requests=0, peak_in_flight=self._stats["in_flight"], not_modified=0)
+            self._status_counts.clear()
+            self._request_log.clear()
+
+    def body(self, kind: str) -> bytes:
+        """Returns the forecast or icon body of a kind, loaded (or generated) once."""
+        with self._lock:
+            body = self._bodies.get(kind)
+        if body is None:
+            body = self._load_body(kind)
+            with self._lock:
+                self._bodies[kind] = body
+        return body
+
+    def points_body(self, latitude: str, longitude: str) -> bytes:
+        """Returns the /points response for coordinates, linking to the stub's forecasts for their grid point."""
+        data = json.loads(self.body("points"))
+        # Nearby coordinates share a grid point, as they do on the NWS grid (about 2.5 km)
+        grid_x, grid_y = round(float(latitude) * 40), round(float(longitude) * 40)
+        gridpoint_url = f"{self.base_url}/gridpoints/STB/{grid_x},{grid_y}"
+        data.setdefault("properties", {}).update(forecast=f"{gridpoint_url}/forecast",
+                                                 forecastHourly=f"{gridpoint_url}/forecast/hourly")
+        return json.dumps(data).encode()
+
+    def _load_body(self, kind: str) -> bytes:
+        if self.fixtures_dir is not None:
+            path = os.path.join(self.fixtures_dir, FIXTURE_FILES[kind])
+            if os.path.exists(path):
+                with open(path, "rb") as file:
+                    body = file.read()
+                return body if kind == "icon" else self._point_urls_at_stub(body)
+
+        if kind == "icon":
+            return _placeholder_icon()
+        if kind == "points":
+            return b'{"properties": {}}'
+        payload = hourly_payload(self.days) if kind == "forecast_hourly" else daily_payload(self.days)
+        return self._point_urls_at_stub(json.dumps(payload).encode())
+
+    def _point_urls_at_stub(self, body: bytes) -> bytes:
+        # Icon (and any other API) URLs in the responses lead back to the stub
+        return body.replace(NWS_API_BASE_URL.encode(), self.base_url.encode())
+
+    def _next_failure(self) -> str | None:
+        with self._lock:
+            if self._queued_failures:
+                return self._queued_failures.pop(0)
+            if self.errors and self.error_rate > 0 and self._random.random() < self.error_rate:
+                return self._random.choice(self.errors)
+            return None
+
+    def _delay(self, path: str) -> float:
+        with self._lock:
+            extra = sum(seconds for prefix, seconds in self._path_delays.items() if path.startswith(prefix))
+            return self.latency + extra + (self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+
+    def _record(self, name: str, change: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += change
+            self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._stats["in_flight"])
+
+    def _log_request(self, path: str) -> None:
+        with self._lock:
+            self._request_log.append(path)
+
+    def _record_status(self, status: str) -> None:
+        with self._lock:
+            self._status_counts[status] = self._status_counts.get(status, 0) + 1
+
+
+class _NwsStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        pass  # Keeps benchmark output quiet
+
+    def do_GET(self) -> None:
+        stub = self.server.stub
+        stub._record("requests")
+        stub._record("in_flight")
+        stub._log_request(self.path)
+        try:
+            delay = stub._delay(self.path)
+            if delay:
+                time.sleep(delay)
+
+            failure = stub._next_failure()
+            if failure == "timeout":
+                stub._record_status("timeout")
+                time.sleep(stub.timeout_delay)
+                self.close_connection = True
+                return
+            if failure is not None:
+                self._send(int(failure), b"")
+                return
+
+            self._serve(stub)
+        finally:
+            stub._record("in_flight", -1)
+
+    def _serve(self, stub: NwsStubServer) -> None:
+        path = self.path.split("?", 1)[0]
+        if path.startswith("/icons/"):
+            self._send_cacheable(stub.body("icon"), "image/png", 24 * 60 * 60)
+            return
+
+        match = _POINTS_PATH.match(path)
+        if match:
+            self._send_cacheable(stub.points_body(*match.groups()), "application/geo+json", stub.max_age)
+            return
+
+        match = _FORECAST_PATH.match(path)
+        if match:
+            kind = "forecast_hourly" if match.group(4) else "forecast"
+            self._send_cacheable(stub.body(kind), "application/geo+json", stub.max_age)
+            return
+
+        self._send(404, b'{"title": "Not Found"}', "application/problem+json")
+
+    def _send_cacheable(self, body: bytes, content_type: str, max_age: int) -> None:
+        headers = {"Cache-Control": f"public, max-age={max_age}"}
+        stub = self.server.stub
+        if stub.etag:
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                stub._record("not_modified")
+                self._send(304, b"", headers=headers)
+                return
+        self._send(200, body, content_type, headers)
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/plain",
+              headers: dict[str, str] | None = None) -> None:
+        self.server.stub._record_status(str(status))
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if body:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def record_fixtures(latitude: float, longitude: float, fixtures_dir: str) -> None:
+    """Saves live NWS responses for one location (and one of its icons) as fixtures."""
+    import requests
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": "weather_app", "Accept": "application/geo+json"})
+
+    def fetch(url: str) -> bytes:
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
+        return response.content
+
+    os.makedirs(fixtures_dir, exist_ok=True)
+    points = fetch(f"{NWS_API_BASE_URL}/points/{latitude},{longitude}")
+    properties = json.loads(points)["properties"]
+    bodies = {"points": points, "forecast": fetch(properties["forecast"]),
+              "forecast_hourly": fetch(properties["forecastHourly"])}
+    bodies["icon"] = fetch(json.loads(bodies["forecast"])["properties"]["periods"][0]["icon"])
+
+    for kind, body in bodies.items():
+        with open(os.path.join(fixtures_dir, FIXTURE_FILES[kind]), "wb") as file:
+            file.write(body)
+        print(f"Recorded {FIXTURE_FILES[kind]} ({len(body)} bytes)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fixtures", help="directory of recorded responses (synthetic payloads if missing)")
+    parser.add_argument("--days", type=int, default=7, help="days in the synthetic forecasts")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="random extra latency, up to seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability that a request fails")
+    parser.add_argument("--errors", default=",".join(ERROR_KINDS), help="comma-separated 500, 503 and timeout")
+    parser.add_argument("--timeout-delay", type=float, default=15.0, help="seconds a timed-out request is held")
+    parser.add_argument("--no-etag", action="store_true", help="send no ETag and never answer 304")
+    parser.add_argument("--max-age", type=int, default=0, help="Cache-Control max-age of forecast responses")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency jitter and error injection")
+    parser.add_argument("--record", metavar="LAT,LON", help="record fixtures from the live API and exit")
+    args = parser.parse_args()
+
+    if args.record:
+        latitude, longitude = (float(value) for value in args.record.split(","))
+        record_fixtures(latitude, longitude, args.fixtures or os.path.join(os.path.dirname(__file__), "fixtures"))
+        return
+
+    stub = NwsStubServer(args.host, args.port, args.fixtures, args.days, args.latency, args.latency_jitter,
+                         args.error_rate, tuple(kind for kind in args.errors.split(",") if kind),
+                         args.timeout_delay, not args.no_etag, args.max_age, args.seed)
+    print(f"Serving the NWS stub at {stub.base_url} (Ctrl+C to stop)")
+    print(f"  NWS_API_BASE_URL={stub.base_url} python main.py")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
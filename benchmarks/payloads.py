@@ -0,0 +1,79 @@
+"""Synthetic NWS forecast payloads shaped like api.weather.gov responses, for reproducible benchmarks."""
+import random
+from datetime import datetime, timedelta, timezone
+
+_CONDITIONS = [
+    ("skc", "Sunny"), ("few", "Mostly Sunny"), ("sct", "Partly Cloudy"), ("bkn", "Mostly Cloudy"),
+    ("ovc", "Cloudy"), ("rain_showers", "Chance Rain Showers"), ("tsra", "Chance Showers And Thunderstorms"),
+    ("rain", "Rain"), ("fog", "Patchy Fog"), ("snow", "Snow")
+]
+_DIRECTIONS = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+_GENERATED_AT = "2025-04-28T14:00:00+00:00"
+_START = datetime(2025, 4, 28, 10, tzinfo=timezone(timedelta(hours=-5)))
+
+
+def _icon_url(index: int, condition: str, is_daytime: bool, probability: int) -> str:
+    time_of_day = "day" if is_daytime else "night"
+    if index % 5 == 0 and probability:
+        # Split icons carry two conditions, each with its probability
+        return f"https://api.weather.gov/icons/land/{time_of_day}/{condition},{probability}/rain,{min(probability + 20, 100)}?size=small"
+    suffix = f",{probability}" if probability else ""
+    return f"https://api.weather.gov/icons/land/{time_of_day}/{condition}{suffix}?size=small"
+
+
+def hourly_payload(days: int = 7, seed: int = 0) -> dict:
+    """Returns an hourly forecast response with 24 periods per day."""
+    generator = random.Random(seed)
+    periods = []
+    for index in range(days * 24):
+        start = _START + timedelta(hours=index)
+        condition, short_forecast = _CONDITIONS[generator.randrange(len(_CONDITIONS))]
+        probability = generator.choice([0, 0, 0, 10, 20, 40, 60, 80])
+        is_daytime = 6 <= start.hour < 18
+        periods.append({
+            "number": index + 1,
+            "name": "",
+            "startTime": start.isoformat(),
+            "endTime": (start + timedelta(hours=1)).isoformat(),
+            "isDaytime": is_daytime,
+            "temperature": generator.randint(40, 95),
+            "temperatureUnit": "F",
+            "probabilityOfPrecipitation": {"unitCode": "wmoUnit:percent", "value": probability},
+            "dewpoint": {"unitCode": "wmoUnit:degC", "value": round(generator.uniform(-5, 25), 4)},
+            "relativeHumidity": {"unitCode": "wmoUnit:percent", "value": generator.randint(20, 100)},
+            "windSpeed": f"{generator.randint(0, 25)} mph",
+            "windDirection": generator.choice(_DIRECTIONS),
+            "icon": _icon_url(index, condition, is_daytime, probability),
+            "shortForecast": short_forecast,
+            "detailedForecast": ""
+        })
+    return {"properties": {"generatedAt": _GENERATED_AT, "periods": periods}}
+
+
+def daily_payload(days: int = 7, seed: int = 0) -> dict:
+    """Returns a daily forecast response with a day and a night period per day."""
+    generator = random.Random(seed)
+    periods = []
+    for index in range(days * 2):
+        start = _START + timedelta(hours=12 * index)
+        condition, short_forecast = _CONDITIONS[generator.randrange(len(_CONDITIONS))]
+        probability = generator.choice([0, 0, 20, 40, 60])
+        is_daytime = index % 2 == 0
+        name = start.strftime("%A") + ("" if is_daytime else " Night")
+        periods.append({
+            "number": index + 1,
+            "name": name,
+            "startTime": start.isoformat(),
+            "endTime": (start + timedelta(hours=12)).isoformat(),
+            "isDaytime": is_daytime,
+            "temperature": generator.randint(40, 95),
+            "temperatureUnit": "F",
+            "probabilityOfPrecipitation": {"unitCode": "wmoUnit:percent", "value": probability},
+            "windSpeed": f"{generator.randint(0, 10)} to {generator.randint(10, 25)} mph",
+            "windDirection": generator.choice(_DIRECTIONS),
+            "icon": _icon_url(index, condition, is_daytime, probability),
+            "shortForecast": short_forecast,
+            "detailedForecast": f"{short_forecast}. High near {generator.randint(60, 95)}, "
+                                f"with winds around {generator.randint(5, 15)} mph."
+        })
+    return {"properties": {"generatedAt": _GENERATED_AT, "periods": periods}}
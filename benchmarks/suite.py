@@ -0,0 +1,320 @@
+"""
+Runs the benchmark suite (parse, model load, format and UI populate, for 7-day and 14-day synthetic forecasts)
+and compares it with a JSON baseline, exiting with status 1 if anything regressed past the thresholds.
+
+Every case records its best wall time, the peak memory it allocates (tracemalloc) and, for the UI cases, the
+number of widgets it leaves in the tab. Wall times are compared relative to a fixed reference workload timed
+alongside each case, which keeps them comparable while the machine's speed drifts. The UI cases render offscreen,
+with icons served by benchmarks.nws_stub.
+
+benchmarks/baseline.json is the committed baseline. Wall times only compare on similar machines, so re-record it
+when you benchmark elsewhere, then compare later runs on the same machine against it:
+
+    python -m benchmarks.suite --update-baseline
+    python -m benchmarks.suite
+
+Usage: python -m benchmarks.suite [--days 7 14] [--repeat 20] [--only NAME] [--no-ui] [--baseline FILE]
+                                  [--update-baseline] [--time-threshold 0.25] [--memory-threshold 0.1]
+"""
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, NamedTuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from models import HourlyForecastManager, DailyForecastManager, weather_icon
+from models.hourly_forecast_class import HourlyForecast
+from services.forecast_rows import HOURLY_FIELDNAMES, daily_forecast_rows, hourly_forecast_rows
+from utils import formatters
+from .nws_stub import NWS_API_BASE_URL, NwsStubServer
+from .payloads import daily_payload, hourly_payload
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Relative times are compared with this much slack on top of the threshold, for the shortest cases
+TIME_NOISE = 0.02
+
+
+class Case(NamedTuple):
+    """
+    One benchmark: setup() builds fresh inputs for each repetition (untimed) and run(inputs) is the measured work.
+    widgets(inputs), for UI cases, counts the widgets left afterwards.
+    """
+    name: str
+    setup: Callable[[], object]
+    run: Callable[[object], object]
+    widgets: Callable[[object], int] | None = None
+
+
+def _clear_shared_caches() -> None:
+    """Empties the formatter and icon caches, so every repetition pays for a first load."""
+    for value in vars(formatters).values():
+        if hasattr(value, "cache_clear"):
+            value.cache_clear()
+    weather_icon.parse_icon_url.cache_clear()
+
+
+def _read_display_fields(forecasts: list[HourlyForecast]) -> None:
+    # Every field the hourly view shows
+    for forecast in forecasts:
+        (forecast.date, forecast.time, forecast.temperature_fahrenheit, forecast.precipitation_probability,
+         forecast.dewpoint_fahrenheit, forecast.relative_humidity, forecast.wind, forecast.weather_emoji,
+         forecast.short_forecast)
+
+
+def model_cases(days: int, work_dir: str) -> list[Case]:
+    """Cases for parsing responses, building and loading models and formatting their display strings."""
+    hourly_body = json.dumps(hourly_payload(days)).encode()
+    hourly_rows = hourly_forecast_rows(json.loads(hourly_body))
+
+    csv_file = os.path.join(work_dir, f"hourly_{days}d.csv")
+    with open(csv_file, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=HOURLY_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(hourly_rows)
+
+    def fresh_models():
+        _clear_shared_caches()
+        forecasts = [HourlyForecast.from_dict(row) for row in hourly_rows]
+        _clear_shared_caches()
+        return forecasts
+
+    return [
+        Case(f"parse hourly response ({days}d)", lambda: hourly_body,
+             lambda body: hourly_forecast_rows(json.loads(body))),
+        Case(f"HourlyForecast.from_dict ({days}d)", _clear_shared_caches,
+             lambda _: [HourlyForecast.from_dict(row) for row in hourly_rows]),
+        Case(f"format hourly display fields ({days}d)", fresh_models, _read_display_fields),
+        Case(f"HourlyForecastManager.load_forecasts ({days}d)",
+             lambda: (_clear_shared_caches(), HourlyForecastManager(csv_file, ""))[1],
+             lambda manager: manager.load_forecasts()),
+    ]
+
+
+def ui_cases(days: int, icon_base_url: str, work_dir: str) -> list[Case]:
+    """Cases for populating and painting the hourly and daily tabs offscreen."""
+    from PyQt5.QtCore import qInstallMessageHandler
+    from PyQt5.QtWidgets import QApplication, QWidget
+    from ui.daily_forecast import DailyForecastTab
+    from ui.hourly_forecast import HourlyForecastTab
+    from ui.icon_loader import IconLoader, set_icon_loader
+    from ui.theme import apply_theme
+
+    app = QApplication.instance() or QApplication([])
+    apply_theme(app=app)
+    # Downloaded icons are cached in the run's temporary directory, not the app's data/icon_cache
+    set_icon_loader(IconLoader(cache_directory=os.path.join(work_dir, "icon_cache")))
+    # The offscreen platform warns about every top-level window it shows
+    qInstallMessageHandler(lambda mode, context, message: None if "propagateSizeHints" in message
+                           else print(message, file=sys.stderr))
+
+    def local_icons(rows):
+        # Icons are fetched from the stub, so the daily cards never reach the network
+        return [dict(row, weather_icon_url=row["weather_icon_url"].replace(NWS_API_BASE_URL, icon_base_url))
+                for row in rows]
+
+    hourly_manager = HourlyForecastManager.from_rows(local_icons(hourly_forecast_rows(hourly_payload(days))), "")
+    daily_manager = DailyForecastManager.from_rows(local_icons(daily_forecast_rows(daily_payload(days))), "")
+
+    # Tabs are kept alive until the run ends, since icon replies can still arrive for them
+    tabs = []
+
+    def shown(tab):
+        tabs.append(tab)
+        tab.resize(580, 550)
+        tab.show()
+        app.processEvents()
+        return tab
+
+    def populate(update):
+        update()
+        app.processEvents()
+
+    def hourly_run(tab):
+        populate(lambda: tab.update_data("", hourly_manager.time_index))
+        tab.grab()  # Forces layout and a full paint of the visible area
+
+    def daily_run(tab):
+        populate(lambda: tab.update_data("", daily_manager.get_forecasts()))
+        tab.grab()
+
+    def count_widgets(tab):
+        return len(tab.findChildren(QWidget))
+
+    # Load the icons once beforehand, so the timed runs do not depend on when the stub's replies arrive
+    icon_tab = shown(DailyForecastTab())
+    icon_tab.update_data("", daily_manager.get_forecasts())
+    deadline = time.perf_counter() + 5
+    while time.perf_counter() < deadline and \
+            any(card.icon_label.pixmap() is None for card in icon_tab.forecast_cards):
+        app.processEvents()
+
+    return [
+        Case(f"HourlyForecastTab.update_data + paint ({days}d)", lambda: shown(HourlyForecastTab()), hourly_run,
+             count_widgets),
+        Case(f"DailyForecastTab.update_data + paint ({days}d)", lambda: shown(DailyForecastTab()), daily_run,
+             count_widgets),
+    ]
+
+
+def _reference_work() -> int:
+    """A fixed pure-Python workload, timed alongside every case to gauge how fast the machine is running."""
+    total = 0
+    for value in range(20000):
+        total += value * value % 7
+    return total
+
+
+def _timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def measure(case: Case, repeat: int) -> dict:
+    """
+    Returns the best wall time of a case, its time relative to the reference workload, the peak allocation of one
+    extra run and its widget count.
+    """
+    # One untimed run first, so one-off work (imports, Qt's font and style caches) is not measured
+    case.run(case.setup())
+
+    # The reference workload runs between the repetitions, so both best times come from the same stretch of time
+    # and their ratio stays comparable when the machine's speed drifts
+    best = reference = float("inf")
+    for _ in range(repeat):
+        inputs = case.setup()
+        gc.collect()
+        reference = min(reference, _timed(_reference_work))
+        best = min(best, _timed(lambda: case.run(inputs)))
+
+    # Allocations are measured in a separate run, since tracing slows everything down
+    inputs = case.setup()
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    case.run(inputs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    result = {"time_ms": round(best * 1000, 3), "relative_time": round(best / reference, 3),
+              "peak_alloc_bytes": peak - before}
+    if case.widgets is not None:
+        result["widgets"] = case.widgets(inputs)
+    return result
+
+
+def _slower(result: dict, expected: dict | None, time_threshold: float) -> bool:
+    return expected is not None and \
+        result["relative_time"] > expected["relative_time"] * (1 + time_threshold + TIME_NOISE)
+
+
+def regressions(results: dict, baseline: dict, time_threshold: float, memory_threshold: float) -> list[str]:
+    """Describes every metric that got worse than its baseline by more than the thresholds allow."""
+    found = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if _slower(result, expected, time_threshold):
+            found.append(f"{name}: {result['relative_time']:.2f}x the reference workload, "
+                         f"baseline {expected['relative_time']:.2f}x ({result['time_ms']:.2f} ms, "
+                         f"baseline {expected['time_ms']:.2f} ms)")
+        if result["peak_alloc_bytes"] > expected["peak_alloc_bytes"] * (1 + memory_threshold):
+            found.append(f"{name}: {result['peak_alloc_bytes']} bytes allocated, "
+                         f"baseline {expected['peak_alloc_bytes']}")
+        if "widgets" in expected and result.get("widgets", 0) > expected["widgets"]:
+            found.append(f"{name}: {result['widgets']} widgets, baseline {expected['widgets']}")
+    return found
+
+
+def _environment() -> dict:
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def _change(value: float, expected: float | None) -> str:
+    if not expected:
+        return ""
+    return f"{(value - expected) / expected * 100:+7.1f}%"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=[7, 14])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--only", help="run only the cases whose name contains this text")
+    parser.add_argument("--no-ui", action="store_true", help="skip the Qt cases")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="save this run as the baseline")
+    parser.add_argument("--time-threshold", type=float, default=0.25, help="allowed wall time increase")
+    parser.add_argument("--memory-threshold", type=float, default=0.1, help="allowed allocation increase")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            saved = json.load(file)
+        baseline = saved["results"]
+        if saved.get("environment") != _environment():
+            print(f"Note: the baseline was recorded on {saved.get('environment')}; wall times may not compare.")
+
+    results = {}
+    measured = []
+    with tempfile.TemporaryDirectory() as work_dir, NwsStubServer() as stub:
+        cases = []
+        for days in args.days:
+            cases += model_cases(days, work_dir)
+            if not args.no_ui:
+                cases += ui_cases(days, stub.base_url, work_dir)
+
+        print(f"{'case':<52} {'time':>10} {'peak alloc':>12} {'widgets':>8}  vs baseline (time, alloc)")
+        for case in cases:
+            if args.only and args.only not in case.name:
+                continue
+            result = results[case.name] = measure(case, args.repeat)
+            measured.append(case)
+            expected = baseline.get(case.name, {})
+            widgets = result.get("widgets", "")
+            print(f"{case.name:<52} {result['time_ms']:>7.2f} ms {result['peak_alloc_bytes'] / 1024:>8.1f} KiB "
+                  f"{widgets:>8}  {_change(result['relative_time'], expected.get('relative_time'))} "
+                  f"{_change(result['peak_alloc_bytes'], expected.get('peak_alloc_bytes'))}")
+
+        # Wall times are noisy, so a case that looks slower is measured again and keeps its better time
+        for case in measured:
+            if not args.update_baseline and _slower(results[case.name], baseline.get(case.name), args.time_threshold):
+                retry = measure(case, args.repeat)
+                print(f"{case.name:<52} {retry['time_ms']:>7.2f} ms (measured again)")
+                if retry["relative_time"] < results[case.name]["relative_time"]:
+                    results[case.name].update(time_ms=retry["time_ms"], relative_time=retry["relative_time"])
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({"environment": _environment(), "results": {**baseline, **results}}, file, indent=2)
+        print(f"Saved the baseline to {args.baseline}")
+        return 0
+
+    if not baseline:
+        # Nothing to compare with is a failure, so a missing baseline never lets regressions through
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return 1
+
+    found = regressions(results, baseline, args.time_threshold, args.memory_threshold)
+    for regression in found:
+        print(f"REGRESSION {regression}")
+    if not found:
+        print(f"No regressions (thresholds: time +{args.time_threshold:.0%}, allocations "
+              f"+{args.memory_threshold:.0%}, widgets +0)")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,10 @@
 import sys
 from PyQt5.QtWidgets import QApplication
-from ui import WeatherMainWindow
+from ui import WeatherMainWindow, apply_theme
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    apply_theme(app=app)
     window = WeatherMainWindow()
     window.setWindowTitle("Weather App")
     window.show()
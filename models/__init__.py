@@ -1,7 +1,15 @@
 from .daily_forecast_manager_class import DailyForecastManager
+from .forecast_store import ForecastStore
 from .hourly_forecast_manager_class import HourlyForecastManager
+from .hourly_time_index import HourlyTimeIndex
+from .weather_icon import IconCondition, WeatherIcon, parse_icon_url
 
 __all__ = [
     'DailyForecastManager',
-    'HourlyForecastManager'
+    'ForecastStore',
+    'HourlyForecastManager',
+    'HourlyTimeIndex',
+    'IconCondition',
+    'WeatherIcon',
+    'parse_icon_url'
 ]
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Converts daily or hourly forecast CSV files to ForecastStore files.
+
+Usage: python -m models.convert_forecast_csv <forecast.csv> [<forecast.fcst>]
+"""
+import os
+import sys
+from .forecast_store import ForecastStore, convert_csv_to_store
+
+
+def main(arguments: list[str]) -> int:
+    if not arguments:
+        print(__doc__.strip())
+        return 2
+
+    source = arguments[0]
+    target = arguments[1] if len(arguments) > 1 else os.path.splitext(source)[0] + ForecastStore.EXTENSION
+    print(f"Wrote {convert_csv_to_store(source, target)} periods to {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
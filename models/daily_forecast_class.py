@@ -1,41 +1,84 @@
+import sys
 from typing import Self
-from utils.formatters import format_temperature, format_precipitation_probability
+from utils import format_temperature_fahrenheit, format_temperature_celsius, format_precipitation_probability, \
+    format_number, parse_number, parse_start_time
+from .forecast_store import ForecastStore
+from .memoized_slot import memoized_slot
+from .weather_icon import WeatherIcon, parse_icon_url
 
 
 class DailyForecast:
     """
-    A class representing a single daily forecast period with formatted data.
-    Stores:
+    A class representing a single daily forecast period.
+    Stores the raw values (missing numbers are None):
       - period_name (e.g. "Tonight" or "Tomorrow")
-      - temperature_fahrenheit (e.g. "88°F")
-      - temperature_celsius (e.g. "31.1°C")
-      - precipitation_probability (e.g. "💧0%" or "💧50%")
-      - icon_url "picture from api.weather.gov"
+      - start_epoch and utc_offset (start time as epoch seconds and its UTC offset in seconds)
+      - temperature and temperature_unit (e.g. 88.0 and "F")
+      - precipitation_probability_value (percent, e.g. 50.0)
+      - weather_icon_url "picture from api.weather.gov" and icon (the decoded URL, see WeatherIcon)
       - detailed_forecast
+    The display strings the UI shows are derived from them when first read and then kept:
+      - temperature_fahrenheit (e.g. "88°F") and temperature_celsius (e.g. "31.1°C")
+      - precipitation_probability (e.g. "💧0%" or "💧50%")
     """
 
-    def __init__(self, period_name: str, temperature_fahrenheit: str, temperature_celsius: str,
-                 precipitation_probability: str, weather_icon_url: str, detailed_forecast: str) -> None:
+    __slots__ = ("period_name", "start_epoch", "utc_offset", "temperature", "temperature_unit",
+                 "precipitation_probability_value", "weather_icon_url", "icon", "detailed_forecast",
+                 # Display strings, formatted on first read (see memoized_slot)
+                 "_temperature_fahrenheit", "_temperature_celsius", "_precipitation_probability")
+
+    def __init__(self, period_name: str, start_epoch: int | None, utc_offset: int, temperature: float | None,
+                 temperature_unit: str, precipitation_probability_value: float | None, weather_icon_url: str,
+                 icon: WeatherIcon, detailed_forecast: str) -> None:
         self.period_name = period_name
-        self.temperature_fahrenheit = temperature_fahrenheit
-        self.temperature_celsius = temperature_celsius
-        self.precipitation_probability = precipitation_probability
+        self.start_epoch = start_epoch
+        self.utc_offset = utc_offset
+        self.temperature = temperature
+        self.temperature_unit = temperature_unit
+        self.precipitation_probability_value = precipitation_probability_value
         self.weather_icon_url = weather_icon_url
+        self.icon = icon
         self.detailed_forecast = detailed_forecast
 
     @classmethod
     def from_dict(cls, forecast_dict: dict[str, str]) -> Self:
-        temperature_value = forecast_dict.get("temperature", "")
-        temperature_unit = forecast_dict.get("temperature_unit", "")
-        temperature_celsius, temperature_fahrenheit = format_temperature(temperature_value, temperature_unit)
-
-        precipitation_probability = format_precipitation_probability(forecast_dict.get('precipitation_probability_value', ""))
+        start_epoch, utc_offset = parse_start_time(forecast_dict.get("start_time", ""))
+        weather_icon_url = sys.intern(forecast_dict.get("weather_icon_url", "N/A"))
 
         return cls(
             period_name=forecast_dict.get("period_name", "N/A"),
-            temperature_fahrenheit=temperature_fahrenheit,
-            temperature_celsius=temperature_celsius,
-            precipitation_probability=precipitation_probability,
-            weather_icon_url=forecast_dict.get("weather_icon_url", "N/A"),
+            start_epoch=start_epoch,
+            utc_offset=utc_offset,
+            temperature=parse_number(forecast_dict.get("temperature", "")),
+            temperature_unit=sys.intern(forecast_dict.get("temperature_unit", "")),
+            precipitation_probability_value=parse_number(forecast_dict.get("precipitation_probability_value", "")),
+            weather_icon_url=weather_icon_url,
+            icon=parse_icon_url(weather_icon_url),
             detailed_forecast=forecast_dict.get("detailed_forecast", "N/A")
         )
+
+    @classmethod
+    def from_store(cls, store: ForecastStore) -> list[Self]:
+        """Builds every period of a ForecastStore straight from its typed columns, without a text step."""
+        columns = zip(store.strings("period_name"), store.integers("start_epoch"),
+                      store.columns["utc_offset"].tolist(), store.numbers("temperature"),
+                      store.strings("temperature_unit"), store.numbers("precipitation_probability"),
+                      store.strings("weather_icon_url"), store.strings("detailed_forecast"))
+
+        return [cls(period_name, start_epoch, utc_offset, temperature, temperature_unit,
+                    precipitation_probability_value, weather_icon_url, parse_icon_url(weather_icon_url),
+                    detailed_forecast)
+                for (period_name, start_epoch, utc_offset, temperature, temperature_unit,
+                     precipitation_probability_value, weather_icon_url, detailed_forecast) in columns]
+
+    @memoized_slot("_temperature_fahrenheit")
+    def temperature_fahrenheit(self) -> str:
+        return format_temperature_fahrenheit(self.temperature, self.temperature_unit)
+
+    @memoized_slot("_temperature_celsius")
+    def temperature_celsius(self) -> str:
+        return format_temperature_celsius(self.temperature, self.temperature_unit)
+
+    @memoized_slot("_precipitation_probability")
+    def precipitation_probability(self) -> str:
+        return format_precipitation_probability(format_number(self.precipitation_probability_value))
@@ -1,27 +1,60 @@
 import csv
+from typing import Iterable, Self
 from .daily_forecast_class import DailyForecast
+from .forecast_store import ForecastStore
 
 
 class DailyForecastManager:
     """
-    A manager class to load and store all daily forecast data from a CSV file.
-    It also stores the forecast generation time and the forecast URL.
+    A manager class to load and store all daily forecast data, either from rows already in memory or from a CSV file.
+    It also stores the forecast generation time and the rows the forecasts were built from.
     """
 
-    def __init__(self, csv_file: str, generated_at: str) -> None:
+    def __init__(self, csv_file: str | None, generated_at: str) -> None:
         self.csv_file = csv_file
         self.generated_at = generated_at
+        # When the forecast was generated and when its response expires (epoch seconds), if known
+        self.generated_epoch: float | None = None
+        self.expires_at: float | None = None
+        self.rows: list[dict[str, str]] = []
         self.forecasts: list[DailyForecast] = []
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, str]], generated_at: str) -> Self:
+        """Creates a manager loaded with forecasts built from rows in the CSV layout, without touching disk."""
+        manager = cls(None, generated_at)
+        manager.load_rows(rows)
+        return manager
+
+    def load_rows(self, rows: Iterable[dict[str, str]]) -> None:
+        self.rows = list(rows)
+        self.forecasts = [DailyForecast.from_dict(row) for row in self.rows]
+
     def load_forecasts(self) -> bool:
         try:
             with open(self.csv_file, mode='r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                self.forecasts = [DailyForecast.from_dict(row) for row in reader]
+                self.load_rows(csv.DictReader(file))
             return True
         except Exception as e:
             print(f"Error loading daily forecasts: {e}")
             return False
 
+    def load_store(self, store_file: str) -> bool:
+        """
+        Loads the forecasts from a memory-mapped ForecastStore file, building them straight from its typed columns
+        instead of parsing CSV text. rows stays empty; the store's rows() gives them back when needed.
+        """
+        try:
+            store = ForecastStore.open(store_file)
+            try:
+                self.rows = []
+                self.forecasts = DailyForecast.from_store(store)
+            finally:
+                store.close()
+            return True
+        except Exception as e:
+            print(f"Error loading daily forecast store: {e}")
+            return False
+
     def get_forecasts(self) -> list[DailyForecast]:
         return self.forecasts
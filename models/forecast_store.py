@@ -0,0 +1,316 @@
+import csv
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, Self
+
+DAILY_FIELDNAMES = [
+    "period_number", "period_name", "start_time", "temperature", "temperature_unit",
+    "precipitation_probability_unit", "precipitation_probability_value", "wind_speed", "wind_direction",
+    "weather_icon_url", "short_forecast", "detailed_forecast"
+]
+
+HOURLY_FIELDNAMES = [
+    "period_number", "start_time", "temperature", "temperature_unit", "precipitation_probability_unit",
+    "precipitation_probability_value", "dewpoint_unit", "dewpoint_value", "relative_humidity_unit",
+    "relative_humidity_value", "wind_speed", "wind_direction", "weather_icon_url", "short_forecast"
+]
+
+
+class ForecastStore:
+    """
+    A compact, columnar, memory-mappable file of forecast periods.
+
+    Numbers are stored as typed arrays (missing values are NaN), start times as an epoch column plus a UTC offset
+    column, and every text field as an index into an interned string table. Opening a store maps the file and
+    exposes each column as a zero-copy memoryview over the mapping.
+
+    Layout (little-endian byte order on every host, every section aligned to 8 bytes):
+      - header: magic, version, layout (daily or hourly), row count, column count, string count
+      - column directory: name, typecode and offset of each column
+      - string table: offsets array (string count + 1 entries) followed by the UTF-8 blob
+      - column data
+    Big-endian hosts byte-swap the arrays when writing, and read swapped copies of them instead of views.
+    """
+
+    MAGIC = b"WXFS"
+    VERSION = 2
+    EXTENSION = ".fcst"
+
+    # CSV layouts a store can hold, in header order; rows() gives back exactly the fields of the store's layout
+    LAYOUTS = {"daily": DAILY_FIELDNAMES, "hourly": HOURLY_FIELDNAMES}
+
+    # Columns in file order: numeric columns with their array typecodes, then string-table references
+    NUMERIC_COLUMNS = [
+        ("period_number", "q"),
+        ("start_epoch", "q"),
+        ("utc_offset", "i"),
+        ("temperature", "d"),
+        ("precipitation_probability", "d"),
+        ("dewpoint", "d"),
+        ("relative_humidity", "d"),
+    ]
+    STRING_COLUMNS = [
+        "period_name", "temperature_unit", "precipitation_probability_unit", "dewpoint_unit",
+        "relative_humidity_unit", "wind_speed", "wind_direction", "weather_icon_url", "short_forecast",
+        "detailed_forecast"
+    ]
+
+    _HEADER = struct.Struct("<4sHBxIII")
+    _DIRECTORY_ENTRY = struct.Struct("<32s1s7xQ")
+    _MISSING_INTEGER = -(2 ** 63)
+
+    def __init__(self, buffer, columns: dict[str, memoryview], string_offsets: memoryview,
+                 string_blob: memoryview, row_count: int, layout: str, mapping: mmap.mmap | None = None) -> None:
+        self._buffer = buffer
+        self._mapping = mapping
+        self.layout = layout
+        self.fieldnames = self.LAYOUTS[layout]
+        self.columns = columns
+        self.row_count = row_count
+        self._string_offsets = string_offsets
+        self._string_blob = string_blob
+        self._strings: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    @classmethod
+    def open(cls, store_file: str) -> Self:
+        """Memory-maps a store file; columns are views over the mapping, so nothing is copied or parsed."""
+        with open(store_file, mode='rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(mapping, mapping)
+
+    @classmethod
+    def from_buffer(cls, buffer, mapping: mmap.mmap | None = None) -> Self:
+        """Reads a store from any buffer (bytes, bytearray or mmap) without copying it."""
+        view = memoryview(buffer)
+        magic, version, layout_code, row_count, column_count, string_count = cls._HEADER.unpack_from(view, 0)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a forecast store file, or an unsupported version")
+        layouts = list(cls.LAYOUTS)
+        if layout_code >= len(layouts):
+            raise ValueError(f"Unknown forecast store layout {layout_code}")
+
+        columns = {}
+        position = cls._HEADER.size
+        for _ in range(column_count):
+            name, typecode, offset = cls._DIRECTORY_ENTRY.unpack_from(view, position)
+            position += cls._DIRECTORY_ENTRY.size
+            itemsize = array(typecode.decode()).itemsize
+            columns[name.rstrip(b"\0").decode()] = cls._host_order(
+                view[offset:offset + row_count * itemsize].cast(typecode.decode()))
+
+        string_offsets_start = cls._align(position)
+        string_offsets_end = string_offsets_start + (string_count + 1) * 8
+        string_offsets = cls._host_order(view[string_offsets_start:string_offsets_end].cast("q"))
+        string_blob = view[string_offsets_end:string_offsets_end + string_offsets[string_count]]
+
+        return cls(buffer, columns, string_offsets, string_blob, row_count, layouts[layout_code], mapping)
+
+    def close(self) -> None:
+        """Releases the column views and the file mapping."""
+        for column in self.columns.values():
+            column.release()
+        self._string_offsets.release()
+        self._string_blob.release()
+        self.columns = {}
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def string(self, index: int) -> str:
+        """Returns an interned string from the string table, decoding it on first use."""
+        text = self._strings.get(index)
+        if text is None:
+            text = sys.intern(bytes(self._string_blob[self._string_offsets[index]:
+                                                      self._string_offsets[index + 1]]).decode("utf-8"))
+            self._strings[index] = text
+        return text
+
+    def integers(self, name: str) -> list[int | None]:
+        """Returns an integer column as Python values, with missing values as None."""
+        missing = self._MISSING_INTEGER
+        return [None if value == missing else value for value in self.columns[name].tolist()]
+
+    def numbers(self, name: str) -> list[float | None]:
+        """Returns a numeric column as Python values, with missing values (NaN) as None."""
+        return [None if math.isnan(value) else value for value in self.columns[name].tolist()]
+
+    def strings(self, name: str) -> list[str]:
+        """Returns a string column as interned Python strings."""
+        string = self.string
+        return [string(index) for index in self.columns[name].tolist()]
+
+    def rows(self) -> Iterator[dict[str, str]]:
+        """
+        Yields each period as a row in the store's CSV layout (exactly the keys of fieldnames), for exporting the
+        store back to CSV.
+        """
+        string = self.string
+        number_text = self._number_text
+        fieldnames = self.fieldnames
+        string_columns = [(name, self.columns[name]) for name in self.STRING_COLUMNS if name in fieldnames]
+        period_numbers = self.columns["period_number"]
+        start_epochs = self.columns["start_epoch"]
+        utc_offsets = self.columns["utc_offset"]
+        temperatures = self.columns["temperature"]
+        precipitation_probabilities = self.columns["precipitation_probability"]
+        dewpoints = self.columns["dewpoint"]
+        relative_humidities = self.columns["relative_humidity"]
+        timezones: dict[int, timezone] = {}
+
+        for index in range(self.row_count):
+            row = {name: string(column[index]) for name, column in string_columns}
+            row["period_number"] = self._integer_text(period_numbers[index])
+            row["start_time"] = self._start_time_text(start_epochs[index], utc_offsets[index], timezones)
+            row["temperature"] = number_text(temperatures[index])
+            row["precipitation_probability_value"] = number_text(precipitation_probabilities[index])
+            row["dewpoint_value"] = number_text(dewpoints[index])
+            row["relative_humidity_value"] = number_text(relative_humidities[index])
+            yield {name: row[name] for name in fieldnames}
+
+    @classmethod
+    def write(cls, store_file: str, rows: Iterable[dict[str, str]], layout: str) -> None:
+        """
+        Writes rows in the daily or hourly CSV layout to a store file, recording the layout in its header (the
+        columns a layout lacks are left empty).
+        """
+        if layout not in cls.LAYOUTS:
+            raise ValueError(f"layout must be one of {', '.join(cls.LAYOUTS)}, got {layout!r}")
+        numeric = {name: array(typecode) for name, typecode in cls.NUMERIC_COLUMNS}
+        references = {name: array("I") for name in cls.STRING_COLUMNS}
+        string_indexes: dict[str, int] = {}
+
+        row_count = 0
+        for row in rows:
+            row_count += 1
+            start_epoch, utc_offset = cls._parse_start_time(row.get("start_time", ""))
+            numeric["period_number"].append(cls._parse_integer(row.get("period_number", "")))
+            numeric["start_epoch"].append(start_epoch)
+            numeric["utc_offset"].append(utc_offset)
+            numeric["temperature"].append(cls._parse_number(row.get("temperature", "")))
+            numeric["precipitation_probability"].append(
+                cls._parse_number(row.get("precipitation_probability_value", "")))
+            numeric["dewpoint"].append(cls._parse_number(row.get("dewpoint_value", "")))
+            numeric["relative_humidity"].append(cls._parse_number(row.get("relative_humidity_value", "")))
+            for name in cls.STRING_COLUMNS:
+                references[name].append(string_indexes.setdefault(row.get(name) or "", len(string_indexes)))
+
+        encoded_strings = [text.encode("utf-8") for text in string_indexes]
+        string_offsets = array("q", [0])
+        for encoded in encoded_strings:
+            string_offsets.append(string_offsets[-1] + len(encoded))
+        string_blob = b"".join(encoded_strings)
+
+        ordered_columns = [(name, numeric[name]) for name, _ in cls.NUMERIC_COLUMNS] + \
+                          [(name, references[name]) for name in cls.STRING_COLUMNS]
+
+        # Work out where every section lands before writing anything
+        position = cls._align(cls._HEADER.size + len(ordered_columns) * cls._DIRECTORY_ENTRY.size)
+        position = cls._align(position + len(string_offsets) * 8 + len(string_blob))
+        column_offsets = []
+        for _, values in ordered_columns:
+            column_offsets.append(position)
+            position = cls._align(position + len(values) * values.itemsize)
+
+        temporary_file = f"{store_file}.tmp"
+        with open(temporary_file, mode='wb') as file:
+            file.write(cls._HEADER.pack(cls.MAGIC, cls.VERSION, list(cls.LAYOUTS).index(layout), row_count,
+                                        len(ordered_columns), len(encoded_strings)))
+            for (name, values), offset in zip(ordered_columns, column_offsets):
+                file.write(cls._DIRECTORY_ENTRY.pack(name.encode(), values.typecode.encode(), offset))
+            cls._pad(file)
+            cls._little_endian(string_offsets).tofile(file)
+            file.write(string_blob)
+            cls._pad(file)
+            for _, values in ordered_columns:
+                cls._little_endian(values).tofile(file)
+                cls._pad(file)
+        os.replace(temporary_file, store_file)
+
+    @staticmethod
+    def _little_endian(values: array) -> array:
+        """Returns the values in little-endian byte order (a byte-swapped copy on big-endian hosts)."""
+        if sys.byteorder == "little":
+            return values
+        swapped = array(values.typecode, values)
+        swapped.byteswap()
+        return swapped
+
+    @classmethod
+    def _host_order(cls, column: memoryview) -> memoryview:
+        """Returns a little-endian column in host byte order (the view itself on little-endian hosts)."""
+        if sys.byteorder == "little":
+            return column
+        values = cls._little_endian(array(column.format, column))
+        column.release()
+        return memoryview(values)
+
+    @staticmethod
+    def _align(position: int) -> int:
+        return (position + 7) & ~7
+
+    @classmethod
+    def _pad(cls, file) -> None:
+        position = file.tell()
+        file.write(b"\0" * (cls._align(position) - position))
+
+    @classmethod
+    def _parse_start_time(cls, start_time: str) -> tuple[int, int]:
+        try:
+            moment = datetime.fromisoformat(start_time)
+        except (TypeError, ValueError):
+            return cls._MISSING_INTEGER, 0
+        offset = moment.utcoffset()
+        return int(moment.timestamp()), int(offset.total_seconds()) if offset else 0
+
+    @classmethod
+    def _parse_integer(cls, value: str) -> int:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return cls._MISSING_INTEGER
+
+    @staticmethod
+    def _parse_number(value: str) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+
+    @classmethod
+    def _start_time_text(cls, start_epoch: int, utc_offset: int, timezones: dict[int, timezone]) -> str:
+        if start_epoch == cls._MISSING_INTEGER:
+            return ""
+        zone = timezones.get(utc_offset)
+        if zone is None:
+            zone = timezones[utc_offset] = timezone(timedelta(seconds=utc_offset))
+        return datetime.fromtimestamp(start_epoch, zone).isoformat()
+
+    @classmethod
+    def _integer_text(cls, value: int) -> str:
+        return "" if value == cls._MISSING_INTEGER else str(value)
+
+    @staticmethod
+    def _number_text(value: float) -> str:
+        if math.isnan(value):
+            return ""
+        return str(int(value)) if value.is_integer() else repr(value)
+
+
+def convert_csv_to_store(csv_file: str, store_file: str) -> int:
+    """Converts a daily or hourly forecast CSV file to a forecast store and returns the number of periods."""
+    with open(csv_file, mode='r', newline='', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        rows = list(reader)
+    # Only the daily layout names its periods
+    layout = "daily" if "period_name" in (reader.fieldnames or []) else "hourly"
+    ForecastStore.write(store_file, rows, layout)
+    return len(rows)
+
@@ -1,123 +1,149 @@
+import sys
 from typing import Self
-from utils import format_start_time, format_temperature, format_precipitation_probability, \
-    format_dewpoint, format_relative_humidity, format_wind
+from utils import format_start_epoch, format_temperature_fahrenheit, format_temperature_celsius, \
+    format_precipitation_probability, format_dewpoint_fahrenheit, format_dewpoint_celsius, format_relative_humidity, \
+    format_wind, format_number, format_wind_speed, parse_number, parse_start_time, parse_wind_speed
+from .forecast_store import ForecastStore
+from .memoized_slot import memoized_slot
+from .weather_icon import WeatherIcon, parse_icon_url
 
 
 class HourlyForecast:
     """
-    A class representing a single hourly forecast period with formatted data.
-    Stores:
-      - date (e.g. Monday, Apr 28")
-      - time (e.g. "10:00 AM"
-      - temperature_fahrenheit (e.g. "75.0°F" or "N/A")
-      - temperature_celsius (e.g. "23.9°C" or "N/A")
+    A class representing a single hourly forecast period.
+    Stores the raw values (missing numbers are None):
+      - start_epoch and utc_offset (start time as epoch seconds and its UTC offset in seconds)
+      - temperature and temperature_unit (e.g. 75.0 and "F")
+      - precipitation_probability_value (percent, e.g. 20.0)
+      - dewpoint and dewpoint_unit (e.g. 12.8 and "wmoUnit:degC")
+      - relative_humidity_value (percent, e.g. 60.0)
+      - wind_speed (the forecast's own text, e.g. "10 mph", "5 to 10 mph" or "Calm")
+      - wind_speed_low, wind_speed_high (parsed from wind_speed in mph, equal unless the forecast gives a range, both
+        None when it is not a speed in mph) and wind_direction (e.g. "NW")
+      - icon (the decoded NWS icon: day/night, conditions with their probabilities and emoji, see WeatherIcon)
+      - short_forecast (e.g. "Sunny" or "Mostly Cloudy")
+    The display strings the UI shows are derived from them when first read and then kept:
+      - date (e.g. "Monday, Apr 28") and time (e.g. "10:00 AM"), shared by every period with the same date or time
+      - temperature_fahrenheit (e.g. "75°F" or "N/A") and temperature_celsius (e.g. "23.9°C" or "N/A")
       - precipitation_probability (formatted with an emoji, e.g. "💧20%")
-      - dewpoint_fahrenheit (e.g. "55.0°F" or "N/A")
-      - dewpoint_celsius (e.g. "12.8°C" or "N/A")
-      - relative_humidity (combined value and unit, e.g. "60%" or "N/A")
-      - wind (combined wind speed and direction, e.g. "10 mph NW" or "N/A")
+      - dewpoint_fahrenheit (e.g. "55°F" or "N/A") and dewpoint_celsius (e.g. "12.8°C" or "N/A")
+      - relative_humidity (e.g. "60%")
+      - wind (combined wind speed and direction, e.g. "10 mph NW", "Calm" or "N/A"; wind_speed as given when it
+        could not be parsed)
       - weather_emoji (e.g. "⛅" or "⛈️")
-      - short_forecast (e.g. "Sunny" or "Mostly Cloudy")
     """
 
-    def __init__(self, date: str, time: str, temperature_fahrenheit: str, temperature_celsius: str,
-                 precipitation_probability: str, dewpoint_fahrenheit: str, dewpoint_celsius: str,
-                 relative_humidity: str, wind: str, weather_emoji: str, short_forecast: str) -> None:
-        self.date = date
-        self.time = time
-        self.temperature_fahrenheit = temperature_fahrenheit
-        self.temperature_celsius = temperature_celsius
-        self.precipitation_probability = precipitation_probability
-        self.dewpoint_fahrenheit = dewpoint_fahrenheit
-        self.dewpoint_celsius = dewpoint_celsius
-        self.relative_humidity = relative_humidity
-        self.wind = wind
-        self.weather_emoji = weather_emoji
+    __slots__ = ("start_epoch", "utc_offset", "temperature", "temperature_unit", "precipitation_probability_value",
+                 "dewpoint", "dewpoint_unit", "relative_humidity_value", "wind_speed", "wind_speed_low",
+                 "wind_speed_high", "wind_direction", "icon", "short_forecast",
+                 # Display strings, formatted on first read (see memoized_slot)
+                 "_temperature_fahrenheit", "_temperature_celsius", "_precipitation_probability",
+                 "_dewpoint_fahrenheit", "_dewpoint_celsius", "_relative_humidity", "_wind")
+
+    def __init__(self, start_epoch: int | None, utc_offset: int, temperature: float | None, temperature_unit: str,
+                 precipitation_probability_value: float | None, dewpoint: float | None, dewpoint_unit: str,
+                 relative_humidity_value: float | None, wind_speed: str, wind_speed_low: float | None,
+                 wind_speed_high: float | None, wind_direction: str, icon: WeatherIcon, short_forecast: str) -> None:
+        self.start_epoch = start_epoch
+        self.utc_offset = utc_offset
+        self.temperature = temperature
+        self.temperature_unit = temperature_unit
+        self.precipitation_probability_value = precipitation_probability_value
+        self.dewpoint = dewpoint
+        self.dewpoint_unit = dewpoint_unit
+        self.relative_humidity_value = relative_humidity_value
+        self.wind_speed = wind_speed
+        self.wind_speed_low = wind_speed_low
+        self.wind_speed_high = wind_speed_high
+        self.wind_direction = wind_direction
+        self.icon = icon
         self.short_forecast = short_forecast
 
     @classmethod
     def from_dict(cls, forecast_dict: dict[str, str]) -> Self:
-        date, time = format_start_time(forecast_dict.get("start_time", ""))
-
-        temperature_value = forecast_dict.get("temperature", "")
-        temperature_unit = forecast_dict.get("temperature_unit", "")
-        temperature_celsius, temperature_fahrenheit = format_temperature(temperature_value, temperature_unit)
-
-        precipitation_probability = format_precipitation_probability(forecast_dict.get('precipitation_probability_value', ""))
-
-        dewpoint_value = forecast_dict.get("dewpoint_value", "")
-        dewpoint_unit = forecast_dict.get("dewpoint_unit", "")
-        dewpoint_celsius, dewpoint_fahrenheit = format_dewpoint(dewpoint_value, dewpoint_unit)
-
-        relative_humidity = format_relative_humidity(forecast_dict.get("relative_humidity_value", ""))
-
-        wind_speed = forecast_dict.get("wind_speed", "")
-        wind_direction = forecast_dict.get("wind_direction", "")
-        wind = format_wind(wind_speed, wind_direction)
-
-        weather_emoji = HourlyForecast.icon_url_to_emoji(forecast_dict.get("weather_icon_url", ""))
-
+        start_epoch, utc_offset = parse_start_time(forecast_dict.get("start_time", ""))
+        wind_speed = sys.intern(forecast_dict.get("wind_speed", ""))
+        wind_speed_low, wind_speed_high = parse_wind_speed(wind_speed)
 
+        # Units, directions and forecasts repeat across periods, so every period shares one copy of each
         return cls(
-            date=date,
-            time=time,
-            temperature_fahrenheit=temperature_fahrenheit,
-            temperature_celsius=temperature_celsius,
-            precipitation_probability=precipitation_probability,
-            dewpoint_fahrenheit=dewpoint_fahrenheit,
-            dewpoint_celsius=dewpoint_celsius,
-            relative_humidity=relative_humidity,
-            wind=wind,
-            weather_emoji=weather_emoji,
-            short_forecast=forecast_dict.get("short_forecast", "")
+            start_epoch=start_epoch,
+            utc_offset=utc_offset,
+            temperature=parse_number(forecast_dict.get("temperature", "")),
+            temperature_unit=sys.intern(forecast_dict.get("temperature_unit", "")),
+            precipitation_probability_value=parse_number(forecast_dict.get("precipitation_probability_value", "")),
+            dewpoint=parse_number(forecast_dict.get("dewpoint_value", "")),
+            dewpoint_unit=sys.intern(forecast_dict.get("dewpoint_unit", "")),
+            relative_humidity_value=parse_number(forecast_dict.get("relative_humidity_value", "")),
+            wind_speed=wind_speed,
+            wind_speed_low=wind_speed_low,
+            wind_speed_high=wind_speed_high,
+            wind_direction=sys.intern(forecast_dict.get("wind_direction", "")),
+            icon=parse_icon_url(forecast_dict.get("weather_icon_url", "")),
+            short_forecast=sys.intern(forecast_dict.get("short_forecast", ""))
         )
 
+    @classmethod
+    def from_store(cls, store: ForecastStore) -> list[Self]:
+        """Builds every period of a ForecastStore straight from its typed columns, without a text step."""
+        wind_speeds = store.strings("wind_speed")
+        parsed_wind_speeds = {wind_speed: parse_wind_speed(wind_speed) for wind_speed in set(wind_speeds)}
+        columns = zip(store.integers("start_epoch"), store.columns["utc_offset"].tolist(),
+                      store.numbers("temperature"), store.strings("temperature_unit"),
+                      store.numbers("precipitation_probability"), store.numbers("dewpoint"),
+                      store.strings("dewpoint_unit"), store.numbers("relative_humidity"), wind_speeds,
+                      store.strings("wind_direction"), store.strings("weather_icon_url"),
+                      store.strings("short_forecast"))
+
+        return [cls(start_epoch, utc_offset, temperature, temperature_unit, precipitation_probability_value,
+                    dewpoint, dewpoint_unit, relative_humidity_value, wind_speed, *parsed_wind_speeds[wind_speed],
+                    wind_direction, parse_icon_url(weather_icon_url), short_forecast)
+                for (start_epoch, utc_offset, temperature, temperature_unit, precipitation_probability_value,
+                     dewpoint, dewpoint_unit, relative_humidity_value, wind_speed, wind_direction, weather_icon_url,
+                     short_forecast) in columns]
+
+    @property
+    def date(self) -> str:
+        return format_start_epoch(self.start_epoch, self.utc_offset)[0]
+
+    @property
+    def time(self) -> str:
+        return format_start_epoch(self.start_epoch, self.utc_offset)[1]
+
+    @memoized_slot("_temperature_fahrenheit")
+    def temperature_fahrenheit(self) -> str:
+        return format_temperature_fahrenheit(self.temperature, self.temperature_unit)
+
+    @memoized_slot("_temperature_celsius")
+    def temperature_celsius(self) -> str:
+        return format_temperature_celsius(self.temperature, self.temperature_unit)
+
+    @memoized_slot("_precipitation_probability")
+    def precipitation_probability(self) -> str:
+        return format_precipitation_probability(format_number(self.precipitation_probability_value))
+
+    @memoized_slot("_dewpoint_fahrenheit")
+    def dewpoint_fahrenheit(self) -> str:
+        return format_dewpoint_fahrenheit(self.dewpoint, self.dewpoint_unit)
+
+    @memoized_slot("_dewpoint_celsius")
+    def dewpoint_celsius(self) -> str:
+        return format_dewpoint_celsius(self.dewpoint, self.dewpoint_unit)
+
+    @memoized_slot("_relative_humidity")
+    def relative_humidity(self) -> str:
+        return format_relative_humidity(format_number(self.relative_humidity_value))
+
+    @memoized_slot("_wind")
+    def wind(self) -> str:
+        # Wind the forecast does not give in mph (such as "Calm") is shown as given
+        wind_speed = format_wind_speed(self.wind_speed_low, self.wind_speed_high) or self.wind_speed
+        return format_wind(wind_speed, self.wind_direction)
+
+    @property
+    def weather_emoji(self) -> str:
+        return self.icon.emoji
+
     @staticmethod
     def icon_url_to_emoji(url: str) -> str:
-        if not url:
-            return "N/A"
-
-        # Extract the condition part of the URL after the last '/' and before any query string
-        base = url.split('?')[0]
-        condition = base.split('/')[-1].lower().split(',')[0]
-
-        # Mapping of conditions to emojis
-        mapping = {
-            "skc": "☀️",  # Fair/clear
-            "few": "🌤️",  # A few clouds
-            "sct": "⛅",  # Partly cloudy
-            "bkn": "🌥️",  # Mostly cloudy
-            "ovc": "☁️",  # Overcast
-            "wind_skc": "🌬️",  # Fair/clear and windy
-            "wind_few": "🌬️",  # A few clouds and windy
-            "wind_sct": "🌬️",  # Partly cloudy and windy
-            "wind_bkn": "🌬️",  # Mostly cloudy and windy
-            "wind_ovc": "🌬️",  # Overcast and windy
-            "snow": "❄️",  # Snow
-            "rain_snow": "🌨️",  # Rain/snow
-            "rain_sleet": "🌨️",  # Rain/sleet
-            "snow_sleet": "🌨️",  # Snow/sleet
-            "fzra": "🧊",  # Freezing rain
-            "rain_fzra": "🧊",  # Rain/freezing rain
-            "snow_fzra": "🧊",  # Freezing rain/snow
-            "sleet": "🧊",  # Sleet
-            "rain": "🌧️",  # Rain
-            "rain_showers": "🌦️",  # Rain showers (high cloud cover)
-            "rain_showers_hi": "🌦️",  # Rain showers (low cloud cover)
-            "tsra": "⛈️",  # Thunderstorm (high cloud cover)
-            "tsra_sct": "⛈️",  # Thunderstorm (medium cloud cover)
-            "tsra_hi": "⛈️",  # Thunderstorm (low cloud cover)
-            "tornado": "🌪️",  # Tornado
-            "hurricane": "🌀",  # Hurricane conditions
-            "tropical_storm": "🌀",  # Tropical storm conditions
-            "dust": "🌪️",  # Dust
-            "smoke": "💨",  # Smoke
-            "haze": "🌫️",  # Haze
-            "hot": "🔥",  # Hot
-            "cold": "🧊",  # Cold
-            "blizzard": "🌨️",  # Blizzard
-            "fog": "🌁"  # Fog/mist
-        }
-
-        # Return the matching emoji or fallback if not found
-        return mapping.get(condition, "❓")
+        return parse_icon_url(url).emoji
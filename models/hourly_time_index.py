@@ -0,0 +1,74 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Iterator
+from .hourly_forecast_class import HourlyForecast
+
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+class HourlyTimeIndex:
+    """
+    A time axis over hourly forecast periods for O(log n) lookups by time and by day.
+
+    Start times are kept as an integer epoch column, and the periods of each local calendar day as a contiguous
+    range whose offsets are computed once, so queries are bisections instead of date string comparisons.
+    Periods without a start time cannot be placed on the axis and are left out.
+    """
+
+    # How long the last period lasts, since there is no following period to end it
+    PERIOD_SECONDS = 3600
+
+    def __init__(self, forecasts: list[HourlyForecast]) -> None:
+        self.forecasts = sorted((forecast for forecast in forecasts if forecast.start_epoch is not None),
+                                key=lambda forecast: forecast.start_epoch)
+        self.start_epochs = array("q", [forecast.start_epoch for forecast in self.forecasts])
+
+        # Local day numbers (days since 1970-01-01 in each period's own UTC offset) and where each day starts
+        self.days = array("q")
+        self.day_offsets = array("q")
+        for position, forecast in enumerate(self.forecasts):
+            day = (forecast.start_epoch + forecast.utc_offset) // 86400
+            if not self.days or day != self.days[-1]:
+                self.days.append(day)
+                self.day_offsets.append(position)
+        self.day_offsets.append(len(self.forecasts))
+
+    def __len__(self) -> int:
+        return len(self.forecasts)
+
+    def period_at(self, epoch: float) -> HourlyForecast | None:
+        """Returns the period in effect at an epoch time, or None if the time is outside the forecast."""
+        position = bisect_right(self.start_epochs, epoch) - 1
+        if position < 0:
+            return None
+
+        if position + 1 < len(self.start_epochs):
+            end = self.start_epochs[position + 1]
+        else:
+            end = self.start_epochs[position] + self.PERIOD_SECONDS
+        return self.forecasts[position] if epoch < end else None
+
+    def periods_for_day(self, day: date | int) -> list[HourlyForecast]:
+        """Returns the periods of a local calendar day, given as a date or as a day number since 1970-01-01."""
+        if isinstance(day, date):
+            day = (day - _EPOCH_DATE).days
+
+        position = bisect_left(self.days, day)
+        if position == len(self.days) or self.days[position] != day:
+            return []
+        return self.forecasts[self.day_offsets[position]:self.day_offsets[position + 1]]
+
+    def next_hours(self, count: int, epoch: float) -> list[HourlyForecast]:
+        """Returns up to count periods starting with the one in effect at an epoch time (or the first one after it)."""
+        position = max(bisect_right(self.start_epochs, epoch) - 1, 0)
+        if self.period_at(epoch) is None and position < len(self.start_epochs) \
+                and self.start_epochs[position] <= epoch:
+            # The time is past the end of the forecast
+            return []
+        return self.forecasts[position:position + count]
+
+    def day_ranges(self) -> Iterator[tuple[int, int, int]]:
+        """Yields (day number, start position, end position) for each local day, in order."""
+        for index, day in enumerate(self.days):
+            yield day, self.day_offsets[index], self.day_offsets[index + 1]
@@ -0,0 +1,21 @@
+from typing import Callable
+
+
+def memoized_slot(slot_name: str) -> Callable[[Callable], property]:
+    """
+    Turns a method into a read-only property that is computed on first read and then kept in a __slots__ slot.
+    The slot starts out unset, so instances pay nothing for values that are never read.
+    """
+
+    def decorator(function: Callable) -> property:
+        def getter(self):
+            try:
+                return getattr(self, slot_name)
+            except AttributeError:
+                value = function(self)
+                setattr(self, slot_name, value)
+                return value
+
+        return property(getter, doc=function.__doc__)
+
+    return decorator
@@ -0,0 +1,102 @@
+import sys
+from functools import lru_cache
+from typing import NamedTuple
+
+# Mapping of NWS icon condition codes to emojis
+ICON_EMOJIS = {
+    "skc": "☀️",  # Fair/clear
+    "few": "🌤️",  # A few clouds
+    "sct": "⛅",  # Partly cloudy
+    "bkn": "🌥️",  # Mostly cloudy
+    "ovc": "☁️",  # Overcast
+    "wind_skc": "🌬️",  # Fair/clear and windy
+    "wind_few": "🌬️",  # A few clouds and windy
+    "wind_sct": "🌬️",  # Partly cloudy and windy
+    "wind_bkn": "🌬️",  # Mostly cloudy and windy
+    "wind_ovc": "🌬️",  # Overcast and windy
+    "snow": "❄️",  # Snow
+    "rain_snow": "🌨️",  # Rain/snow
+    "rain_sleet": "🌨️",  # Rain/sleet
+    "snow_sleet": "🌨️",  # Snow/sleet
+    "fzra": "🧊",  # Freezing rain
+    "rain_fzra": "🧊",  # Rain/freezing rain
+    "snow_fzra": "🧊",  # Freezing rain/snow
+    "sleet": "🧊",  # Sleet
+    "rain": "🌧️",  # Rain
+    "rain_showers": "🌦️",  # Rain showers (high cloud cover)
+    "rain_showers_hi": "🌦️",  # Rain showers (low cloud cover)
+    "tsra": "⛈️",  # Thunderstorm (high cloud cover)
+    "tsra_sct": "⛈️",  # Thunderstorm (medium cloud cover)
+    "tsra_hi": "⛈️",  # Thunderstorm (low cloud cover)
+    "tornado": "🌪️",  # Tornado
+    "hurricane": "🌀",  # Hurricane conditions
+    "tropical_storm": "🌀",  # Tropical storm conditions
+    "dust": "🌪️",  # Dust
+    "smoke": "💨",  # Smoke
+    "haze": "🌫️",  # Haze
+    "hot": "🔥",  # Hot
+    "cold": "🧊",  # Cold
+    "blizzard": "🌨️",  # Blizzard
+    "fog": "🌁"  # Fog/mist
+}
+
+
+class IconCondition(NamedTuple):
+    """One condition of an NWS icon, e.g. ("tsra", 40) for a 40% chance of thunderstorms."""
+    code: str
+    probability: int | None
+
+
+class WeatherIcon(NamedTuple):
+    """
+    The decoded form of an NWS icon URL such as "https://api.weather.gov/icons/land/day/tsra,40/rain,60?size=small".
+    Stores:
+      - is_day (True for day icons, False for night icons, None if the URL does not say)
+      - conditions (one IconCondition, or two for split icons, in URL order)
+      - emoji (for the last condition, the one in effect at the end of the period, e.g. "⛈️"; "N/A" without an icon
+        and "❓" for unknown conditions)
+    """
+    is_day: bool | None
+    conditions: tuple[IconCondition, ...]
+    emoji: str
+
+    @property
+    def code(self) -> str:
+        """The code the emoji was resolved from, or an empty string without an icon."""
+        return self.conditions[-1].code if self.conditions else ""
+
+    @property
+    def probability(self) -> int | None:
+        """The highest probability given for any condition, or None if the icon has none."""
+        probabilities = [condition.probability for condition in self.conditions if condition.probability is not None]
+        return max(probabilities) if probabilities else None
+
+
+NO_ICON = WeatherIcon(None, (), "N/A")
+
+
+@lru_cache(maxsize=512)
+def parse_icon_url(url: str) -> WeatherIcon:
+    """
+    Decodes an NWS icon URL into a WeatherIcon.
+    Results are cached, so periods with the same icon share one record and a URL is only parsed once.
+    """
+    if not url or url == "N/A":
+        return NO_ICON
+
+    # Path segments after the last "day"/"night" segment are the conditions; older URLs only have one segment
+    segments = [segment for segment in url.split("?")[0].split("/") if segment]
+    is_day = None
+    condition_segments = segments[-1:]
+    for index in range(len(segments) - 1, -1, -1):
+        if segments[index] in ("day", "night"):
+            is_day = segments[index] == "day"
+            condition_segments = segments[index + 1:] or [""]
+            break
+
+    conditions = []
+    for segment in condition_segments:
+        code, _, probability = segment.lower().partition(",")
+        conditions.append(IconCondition(sys.intern(code), int(probability) if probability.isdigit() else None))
+
+    return WeatherIcon(is_day, tuple(conditions), ICON_EMOJIS.get(conditions[-1].code, "❓"))
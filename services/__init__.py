@@ -1,7 +1,54 @@
-from .forecast_worker import ForecastWorker
-from .geolocator import GeolocatorService
+import importlib
+
+# Names are imported from their modules on first use, so the Qt-free parts (ForecastEngine, the caches and the
+# HTTP session) can be used, e.g. by services.fetch_forecasts, without importing PyQt5 or geopy
+_EXPORTS = {
+    'CsvForecastExporter': '.forecast_export',
+    'ForecastCancelled': '.forecast_engine',
+    'ForecastEngine': '.forecast_engine',
+    'ForecastExporter': '.forecast_export',
+    'ForecastResult': '.forecast_engine',
+    'ForecastWorker': '.forecast_worker',
+    'GeocodeCache': '.geocode_cache',
+    'GeocodeWorker': '.geocode_worker',
+    'GeolocatorService': '.geolocator',
+    'HttpCache': '.http_cache',
+    'HttpSession': '.http_session',
+    'PointsCache': '.points_cache',
+    'RefreshScheduler': '.refresh_scheduler',
+    'RequestCancelled': '.http_session',
+    'StoreForecastExporter': '.forecast_export',
+    'TokenBucket': '.rate_limiter',
+    'get_shared_engine': '.forecast_engine',
+    'get_shared_session': '.http_session'
+}
 
 __all__ = [
+    'CsvForecastExporter',
+    'ForecastCancelled',
+    'ForecastEngine',
+    'ForecastExporter',
+    'ForecastResult',
     'ForecastWorker',
-    'GeolocatorService'
-]
\ No newline at end of file
+    'GeocodeCache',
+    'GeocodeWorker',
+    'GeolocatorService',
+    'HttpCache',
+    'HttpSession',
+    'PointsCache',
+    'RefreshScheduler',
+    'RequestCancelled',
+    'StoreForecastExporter',
+    'TokenBucket',
+    'get_shared_engine',
+    'get_shared_session'
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
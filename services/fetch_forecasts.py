@@ -0,0 +1,209 @@
+"""
+Fetches forecasts for a list of locations concurrently, without Qt, and streams them as JSON Lines or CSV.
+
+Each line of the input names one location: "latitude,longitude" (or "latitude longitude"), or a place name to
+geocode. Blank lines and lines starting with "#" are skipped. Results are written to stdout as soon as each
+location completes; errors are reported on stderr and make the exit status 1.
+
+Usage: python -m services.fetch_forecasts <locations.txt | -> [--format jsonl|csv] [--forecast both|daily|hourly]
+                                          [--concurrency 4] [--rate 5] [--api-base-url URL]
+"""
+import argparse
+import contextlib
+import csv
+import json
+import re
+import sys
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, NamedTuple, TextIO
+from .forecast_engine import ForecastEngine, ForecastResult
+from .forecast_rows import DAILY_FIELDNAMES, HOURLY_FIELDNAMES
+
+_COORDINATES_PATTERN = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*[,\s]\s*(-?\d+(?:\.\d+)?)\s*$")
+
+LOCATION_FIELDNAMES = ["query", "latitude", "longitude"]
+
+# Numeric fields of the CSV layouts, with the forecast model attributes that hold them as numbers (None if missing)
+_NUMERIC_FIELDS = {
+    "temperature": "temperature",
+    "precipitation_probability_value": "precipitation_probability_value",
+    "dewpoint_value": "dewpoint",
+    "relative_humidity_value": "relative_humidity_value"
+}
+
+
+class LocationQuery(NamedTuple):
+    """One input location: the line it came from and its coordinates."""
+    query: str
+    latitude: float
+    longitude: float
+
+
+def read_queries(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the location queries in the input, skipping blank lines and comments."""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def parse_coordinates(query: str) -> tuple[float, float] | None:
+    """Returns the (latitude, longitude) in a query such as "39.74,-104.99", or None for a place name."""
+    match = _COORDINATES_PATTERN.match(query)
+    if match is None:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
+def resolve_locations(queries: Iterable[str]) -> tuple[list[LocationQuery], list[str]]:
+    """
+    Turns queries into LocationQuery objects, geocoding place names.
+    Returns the locations and the queries that could not be resolved.
+    """
+    locations = []
+    unresolved = []
+    geolocator = None
+    for query in queries:
+        coordinates = parse_coordinates(query)
+        if coordinates is None:
+            if geolocator is None:
+                # geopy is only needed (and imported) when the input has place names
+                from .geolocator import GeolocatorService
+                geolocator = GeolocatorService()
+            location = geolocator.get_location(query)
+            coordinates = None if location is None else (location.latitude, location.longitude)
+
+        if coordinates is None:
+            unresolved.append(query)
+        else:
+            locations.append(LocationQuery(query, *coordinates))
+    return locations, unresolved
+
+
+def _positive_integer(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be a whole number greater than 0, got {text!r}")
+    return value
+
+
+def _positive_number(text: str) -> float:
+    try:
+        value = float(text)
+    except ValueError:
+        value = 0.0
+    if not value > 0:  # Also rejects NaN
+        raise argparse.ArgumentTypeError(f"must be a number greater than 0, got {text!r}")
+    return value
+
+
+def _generated_at(manager) -> str:
+    return datetime.fromtimestamp(manager.generated_epoch, timezone.utc).isoformat()
+
+
+def _period_number(text: str) -> int | None:
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def json_periods(manager) -> list[dict]:
+    """
+    Returns a manager's periods with the fields of its CSV layout, but with the numbers as JSON numbers (null when
+    missing), taken from the forecast models rather than the CSV text.
+    """
+    periods = []
+    for row, forecast in zip(manager.rows, manager.forecasts):
+        period = dict(row, period_number=_period_number(row.get("period_number", "")))
+        for field, attribute in _NUMERIC_FIELDS.items():
+            if field in period:
+                period[field] = getattr(forecast, attribute)
+        periods.append(period)
+    return periods
+
+
+class JsonLinesWriter:
+    """Writes one JSON object per location, holding the periods of the requested forecasts."""
+
+    def __init__(self, output: TextIO, forecast: str) -> None:
+        self.output = output
+        self.forecast = forecast
+
+    def write(self, result: ForecastResult) -> None:
+        record = dict(zip(LOCATION_FIELDNAMES, result.location))
+        if result.error is not None:
+            record["error"] = str(result.error)
+        else:
+            for name, manager in (("daily", result.daily_manager), ("hourly", result.hourly_manager)):
+                if self.forecast in ("both", name):
+                    record[name] = {"generated_at": _generated_at(manager), "periods": json_periods(manager)}
+        self.output.write(json.dumps(record) + "\n")
+        self.output.flush()
+
+
+class CsvWriter:
+    """Writes one CSV row per forecast period, prefixed with the location it belongs to."""
+
+    def __init__(self, output: TextIO, forecast: str) -> None:
+        self.output = output
+        self.forecast = forecast
+        fieldnames = DAILY_FIELDNAMES if forecast == "daily" else HOURLY_FIELDNAMES
+        self._writer = csv.DictWriter(output, fieldnames=LOCATION_FIELDNAMES + ["generated_at"] + fieldnames)
+        self._writer.writeheader()
+
+    def write(self, result: ForecastResult) -> None:
+        if result.error is not None:
+            return
+        manager = result.daily_manager if self.forecast == "daily" else result.hourly_manager
+        location = dict(zip(LOCATION_FIELDNAMES, result.location), generated_at=_generated_at(manager))
+        for row in manager.rows:
+            self._writer.writerow({**location, **row})
+        self.output.flush()
+
+
+def main(arguments: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("locations", help='file with one location per line, or "-" for stdin')
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--forecast", choices=("both", "daily", "hourly"), default="both",
+                        help="forecasts to output (CSV holds one of them, hourly unless daily is chosen)")
+    parser.add_argument("--concurrency", type=_positive_integer, default=4, help="maximum HTTP requests in flight")
+    parser.add_argument("--rate", type=_positive_number, default=5, help="maximum requests per second to each host")
+    parser.add_argument("--api-base-url", help="NWS API to fetch from (default: $NWS_API_BASE_URL or "
+                                               "https://api.weather.gov)")
+    args = parser.parse_args(arguments)
+
+    if args.locations == "-":
+        queries = list(read_queries(sys.stdin))
+    else:
+        with open(args.locations, encoding="utf-8") as file:
+            queries = list(read_queries(file))
+
+    # GeolocatorService prints its errors; they belong on stderr, since stdout only carries results
+    with contextlib.redirect_stdout(sys.stderr):
+        locations, unresolved = resolve_locations(queries)
+    for query in unresolved:
+        print(f"Location not found: {query}", file=sys.stderr)
+
+    writer_class = CsvWriter if args.format == "csv" else JsonLinesWriter
+    writer = writer_class(sys.stdout, args.forecast)
+    failed = len(unresolved)
+    engine = ForecastEngine(max_concurrency=args.concurrency, requests_per_second=args.rate,
+                            api_base_url=args.api_base_url)
+    try:
+        for result in engine.fetch_all(locations):
+            if result.error is not None:
+                failed += 1
+                print(f"Forecast fetch failed for {result.location.query}: {result.error}", file=sys.stderr)
+            writer.write(result)
+    finally:
+        engine.shutdown()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
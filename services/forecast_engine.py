@@ -0,0 +1,231 @@
+import json
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime
+from typing import Iterable, Iterator, NamedTuple
+from urllib.parse import urlsplit
+import requests
+from models import DailyForecastManager, HourlyForecastManager
+from .forecast_rows import daily_forecast_rows, hourly_forecast_rows
+from .http_cache import CachedResponse, HttpCache
+from .http_session import HttpSession, RequestCancelled, get_shared_session
+from .points_cache import PointsCache
+from .rate_limiter import TokenBucket
+
+
+class ForecastCancelled(Exception):
+    """Raised inside ForecastEngine.fetch when the caller cancelled the fetch before it finished."""
+
+
+class ForecastResult(NamedTuple):
+    """The outcome of fetching one location: its loaded managers, or the error that stopped it."""
+    location: object
+    daily_manager: DailyForecastManager | None
+    hourly_manager: HourlyForecastManager | None
+    error: Exception | None = None
+
+
+class ForecastEngine:
+    """
+    Fetches the /points lookup, daily and hourly forecasts for any number of locations concurrently, without Qt.
+
+    Locations are anything with latitude and longitude attributes (such as a geopy Location). At most
+    max_concurrency HTTP requests are in flight at once across all locations, and each host is limited to
+    requests_per_second (with bursts of up to that many, and at least one); responses served from the HTTP cache
+    take no rate-limit token.
+    """
+
+    # The NWS API, or a stand-in such as benchmarks.nws_stub when NWS_API_BASE_URL is set
+    API_BASE_URL = os.environ.get("NWS_API_BASE_URL", "https://api.weather.gov").rstrip("/")
+
+    # Timeout in seconds for each HTTP call, and for the parallel daily/hourly download of a location as a whole
+    REQUEST_TIMEOUT = 10
+    FORECAST_TIMEOUT = 30
+
+    def __init__(self, max_concurrency: int = 4, requests_per_second: float = 5, session: HttpSession | None = None,
+                 points_cache: PointsCache | None = None, http_cache: HttpCache | None = None,
+                 api_base_url: str | None = None) -> None:
+        self.api_base_url = (api_base_url or self.API_BASE_URL).rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        # Every engine shares one pooled, keep-alive session unless told otherwise
+        self.session = session or get_shared_session()
+        self.points_cache = points_cache or PointsCache()
+        self.http_cache = http_cache or HttpCache()
+
+        self._request_slots = threading.BoundedSemaphore(max_concurrency)
+        self._rate_limiters: dict[str, TokenBucket] = {}
+        self._rate_limiters_lock = threading.Lock()
+        # Locations wait on their downloads, so the two run on separate pools and can never starve each other
+        self._location_executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                                     thread_name_prefix="forecast-location")
+        self._download_executor = ThreadPoolExecutor(max_workers=2 * max_concurrency,
+                                                     thread_name_prefix="forecast-download")
+
+    def fetch(self, location, cancelled: threading.Event | None = None) -> tuple[DailyForecastManager,
+                                                                                 HourlyForecastManager]:
+        """
+        Fetches one location on the calling thread (its daily and hourly downloads still run in parallel).
+        Raises requests exceptions for network errors, KeyError/TypeError/ValueError for unexpected responses and
+        IOError/OSError/sqlite3.Error if a cache cannot be used.
+        Setting `cancelled` stops the fetch cooperatively: no further HTTP request is started and no downloaded
+        response is parsed, and ForecastCancelled is raised instead.
+        """
+        # Step 1: Get location info (the forecast URLs for this grid point), from the cache when possible
+        latitude = round(location.latitude, 4)
+        longitude = round(location.longitude, 4)
+        forecast_urls = self.points_cache.get(latitude, longitude)
+        if forecast_urls is not None and not forecast_urls["forecast"].startswith(self.api_base_url):
+            # Cached while pointing at another API (such as a local stub), so look it up again
+            forecast_urls = None
+        from_cache = forecast_urls is not None
+        if not from_cache:
+            forecast_urls = self._get_forecast_urls(latitude, longitude, cancelled)
+
+        # Steps 2 and 3: Get the daily and hourly forecasts in parallel, since they are independent
+        try:
+            return self._fetch_forecasts(forecast_urls["forecast"], forecast_urls["forecastHourly"], cancelled)
+        except requests.exceptions.HTTPError as e:
+            # A 404 means the cached grid point is no longer valid, so look it up again and retry once.
+            # The stored /points response would give the same stale URLs, so it is dropped as well
+            if not from_cache or e.response is None or e.response.status_code != 404:
+                raise
+            self.points_cache.invalidate(latitude, longitude)
+            self.http_cache.invalidate(self._points_url(latitude, longitude))
+            forecast_urls = self._get_forecast_urls(latitude, longitude, cancelled)
+            return self._fetch_forecasts(forecast_urls["forecast"], forecast_urls["forecastHourly"], cancelled)
+
+    def submit(self, location) -> Future:
+        """Starts fetching a location in the background; the future resolves to a ForecastResult."""
+        return self._location_executor.submit(self._fetch_result, location)
+
+    def fetch_all(self, locations: Iterable) -> Iterator[ForecastResult]:
+        """Fetches every location concurrently and yields each ForecastResult as soon as it completes."""
+        for future in as_completed([self.submit(location) for location in locations]):
+            yield future.result()
+
+    def shutdown(self) -> None:
+        """Waits for running fetches to finish and stops the worker threads."""
+        self._location_executor.shutdown(wait=True, cancel_futures=True)
+        self._download_executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_result(self, location) -> ForecastResult:
+        try:
+            daily_manager, hourly_manager = self.fetch(location)
+            return ForecastResult(location, daily_manager, hourly_manager)
+        except Exception as e:
+            return ForecastResult(location, None, None, e)
+
+    def _get_forecast_urls(self, latitude: float, longitude: float, cancelled: threading.Event | None) -> dict:
+        """Looks up the forecast URLs for the coordinates with the /points API and caches them"""
+        location_url = self._points_url(latitude, longitude)
+        location_response = self._get_api_data(location_url, (cancelled,))
+        self._raise_if_cancelled((cancelled,))
+        location_data = json.loads(location_response.body)
+        forecast_urls = {
+            "forecast": location_data["properties"]["forecast"],
+            "forecastHourly": location_data["properties"]["forecastHourly"]
+        }
+        self.points_cache.put(latitude, longitude, forecast_urls["forecast"], forecast_urls["forecastHourly"])
+        return forecast_urls
+
+    def _points_url(self, latitude: float, longitude: float) -> str:
+        return f"{self.api_base_url}/points/{latitude},{longitude}"
+
+    def _fetch_forecasts(self, daily_forecast_url: str, hourly_forecast_url: str,
+                         cancelled: threading.Event | None) -> tuple[DailyForecastManager, HourlyForecastManager]:
+        """
+        Downloads the daily and hourly forecasts and builds their models concurrently.
+        If either side fails or the overall timeout expires, the other side is cancelled before it builds anything
+        and the original error is raised.
+        """
+        # Either side stops when the other one fails or when the caller cancels the whole fetch
+        sibling_failed = threading.Event()
+        stop_events = (sibling_failed, cancelled)
+        daily_future = self._download_executor.submit(self._fetch_forecast, daily_forecast_url, daily_forecast_rows,
+                                                      DailyForecastManager, stop_events)
+        hourly_future = self._download_executor.submit(self._fetch_forecast, hourly_forecast_url,
+                                                       hourly_forecast_rows, HourlyForecastManager, stop_events)
+        done, not_done = wait([daily_future, hourly_future], timeout=self.FORECAST_TIMEOUT,
+                              return_when=FIRST_EXCEPTION)
+
+        failed = [future for future in done if future.exception() is not None]
+        if failed or not_done:
+            # Do not block on a cancelled download; it exits on its own once its request times out
+            sibling_failed.set()
+            for future in not_done:
+                future.cancel()
+            if failed:
+                raise failed[0].exception()
+            raise requests.exceptions.Timeout(f"Forecast download timed out after {self.FORECAST_TIMEOUT}s")
+
+        return daily_future.result(), hourly_future.result()
+
+    def _fetch_forecast(self, url: str, forecast_rows, manager_class, stop_events: tuple):
+        """
+        Downloads one forecast and, unless stopped, returns a manager loaded with its forecasts.
+        The manager also records when the forecast was generated and when the response expires, for scheduling
+        the next refresh.
+        """
+        forecast_response = self._get_api_data(url, stop_events)
+        # A stale response is dropped before it is parsed
+        self._raise_if_cancelled(stop_events)
+        forecast_data = json.loads(forecast_response.body)
+
+        generated = datetime.fromisoformat(forecast_data["properties"].get("generatedAt"))
+        generated_time = generated.astimezone().strftime("%B %d, %Y, %I:%M %p")
+        manager = manager_class.from_rows(forecast_rows(forecast_data), generated_time)
+        manager.generated_epoch = generated.timestamp()
+        manager.expires_at = forecast_response.expires_at
+        return manager
+
+    def _get_api_data(self, url: str, stop_events: tuple) -> CachedResponse:
+        """Helper method to get the raw JSON body (with its validators and expiry) from an API endpoint"""
+        # Served from the HTTP cache while fresh, otherwise revalidated with a conditional GET.
+        # Raises an error if the request failed after retrying transient errors
+        self._raise_if_cancelled(stop_events)
+        rate_limiter = self._rate_limiter(url)
+        with self._request_slots:
+            # Waiting for a free request slot can take a while, so check again before going out; the session also
+            # checks before every retry
+            self._raise_if_cancelled(stop_events)
+            try:
+                return self.session.get_response(url, timeout=self.REQUEST_TIMEOUT, cache=self.http_cache,
+                                                 rate_limiter=rate_limiter,
+                                                 should_stop=lambda: self._is_cancelled(stop_events))
+            except RequestCancelled as e:
+                raise ForecastCancelled("Forecast fetch cancelled") from e
+
+    @staticmethod
+    def _is_cancelled(stop_events: tuple) -> bool:
+        return any(event is not None and event.is_set() for event in stop_events)
+
+    @classmethod
+    def _raise_if_cancelled(cls, stop_events: tuple) -> None:
+        if cls._is_cancelled(stop_events):
+            raise ForecastCancelled("Forecast fetch cancelled")
+
+    def _rate_limiter(self, url: str) -> TokenBucket:
+        """Returns the token bucket of the URL's host, creating it on first use."""
+        host = urlsplit(url).netloc
+        with self._rate_limiters_lock:
+            rate_limiter = self._rate_limiters.get(host)
+            if rate_limiter is None:
+                # Bursts of up to one second's worth of requests, and at least one request at a time
+                rate_limiter = self._rate_limiters[host] = TokenBucket(self.requests_per_second,
+                                                                       max(1, self.requests_per_second))
+            return rate_limiter
+
+
+_shared_engine: ForecastEngine | None = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_shared_engine() -> ForecastEngine:
+    """Returns the application-wide ForecastEngine, creating it on first use."""
+    global _shared_engine
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            _shared_engine = ForecastEngine()
+        return _shared_engine
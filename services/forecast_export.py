@@ -0,0 +1,94 @@
+import csv
+import logging
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from models.forecast_store import ForecastStore
+from .forecast_rows import DAILY_FIELDNAMES, HOURLY_FIELDNAMES
+
+logger = logging.getLogger(__name__)
+
+
+class ForecastExporter(ABC):
+    """
+    Base class for optional, asynchronous sinks that persist forecast rows.
+    Writes run one at a time on a background thread, and each file is replaced atomically so readers never see a
+    partially written export. A failed export is logged, whatever the error.
+    """
+
+    def __init__(self, daily_file: str, hourly_file: str) -> None:
+        self.daily_file = daily_file
+        self.hourly_file = hourly_file
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="forecast-export")
+
+    def export(self, daily_rows: list[dict[str, str]], hourly_rows: list[dict[str, str]]) -> Future:
+        """
+        Queues both files for writing and returns a future that completes once they are on disk, or holds the error
+        that stopped the export.
+        """
+        future = self._executor.submit(self._write_both, daily_rows, hourly_rows)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def shutdown(self) -> None:
+        """Waits for queued exports to finish."""
+        self._executor.shutdown(wait=True)
+
+    def _write_both(self, daily_rows: list[dict[str, str]], hourly_rows: list[dict[str, str]]) -> None:
+        for file_name in (self.daily_file, self.hourly_file):
+            directory = os.path.dirname(file_name)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+        self._write_daily(daily_rows)
+        self._write_hourly(hourly_rows)
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        # Runs once the export finishes; nobody may be waiting on the future, so errors would otherwise go unseen
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Forecast export failed", exc_info=future.exception())
+
+    @abstractmethod
+    def _write_daily(self, rows: list[dict[str, str]]) -> None:
+        """Writes the daily rows to daily_file."""
+
+    @abstractmethod
+    def _write_hourly(self, rows: list[dict[str, str]]) -> None:
+        """Writes the hourly rows to hourly_file."""
+
+
+class CsvForecastExporter(ForecastExporter):
+    """Exports the forecasts to the daily and hourly CSV files."""
+
+    def __init__(self, daily_csv_file: str = "data/daily_forecast_data.csv",
+                 hourly_csv_file: str = "data/hourly_forecast_data.csv") -> None:
+        super().__init__(daily_csv_file, hourly_csv_file)
+
+    def _write_daily(self, rows: list[dict[str, str]]) -> None:
+        self._write(self.daily_file, DAILY_FIELDNAMES, rows)
+
+    def _write_hourly(self, rows: list[dict[str, str]]) -> None:
+        self._write(self.hourly_file, HOURLY_FIELDNAMES, rows)
+
+    @staticmethod
+    def _write(csv_file: str, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
+        temporary_file = f"{csv_file}.tmp"
+        with open(temporary_file, mode='w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(temporary_file, csv_file)
+
+
+class StoreForecastExporter(ForecastExporter):
+    """Exports the forecasts to compact, memory-mappable ForecastStore files."""
+
+    def __init__(self, daily_store_file: str = "data/daily_forecast_data.fcst",
+                 hourly_store_file: str = "data/hourly_forecast_data.fcst") -> None:
+        super().__init__(daily_store_file, hourly_store_file)
+
+    def _write_daily(self, rows: list[dict[str, str]]) -> None:
+        ForecastStore.write(self.daily_file, rows, "daily")
+
+    def _write_hourly(self, rows: list[dict[str, str]]) -> None:
+        ForecastStore.write(self.hourly_file, rows, "hourly")
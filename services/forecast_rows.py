@@ -0,0 +1,50 @@
+from models.forecast_store import DAILY_FIELDNAMES, HOURLY_FIELDNAMES
+
+
+def _text(value) -> str:
+    """Converts a JSON value to the text the CSV files have always held (None becomes an empty string)."""
+    return "" if value is None else str(value)
+
+
+def daily_forecast_rows(daily_forecast_data: dict) -> list[dict[str, str]]:
+    """Flattens the periods of an NWS daily forecast response into rows with the daily CSV layout."""
+    rows = []
+    for period in daily_forecast_data["properties"]["periods"]:
+        rows.append({
+            "period_number": _text(period.get("number", "")),
+            "period_name": _text(period.get("name", "")),
+            "start_time": _text(period.get("startTime", "")),
+            "temperature": _text(period.get("temperature", "")),
+            "temperature_unit": _text(period.get("temperatureUnit", "")),
+            "precipitation_probability_unit": _text(period.get("probabilityOfPrecipitation", {}).get("unitCode", "")),
+            "precipitation_probability_value": _text(period.get("probabilityOfPrecipitation", {}).get("value", "")),
+            "wind_speed": _text(period.get("windSpeed", "")),
+            "wind_direction": _text(period.get("windDirection", "")),
+            "weather_icon_url": _text(period.get("icon", "")),
+            "short_forecast": _text(period.get("shortForecast", "")),
+            "detailed_forecast": _text(period.get("detailedForecast", ""))
+        })
+    return rows
+
+
+def hourly_forecast_rows(hourly_forecast_data: dict) -> list[dict[str, str]]:
+    """Flattens the periods of an NWS hourly forecast response into rows with the hourly CSV layout."""
+    rows = []
+    for period in hourly_forecast_data["properties"]["periods"]:
+        rows.append({
+            "period_number": _text(period.get("number", "")),
+            "start_time": _text(period.get("startTime", "")),
+            "temperature": _text(period.get("temperature", "")),
+            "temperature_unit": _text(period.get("temperatureUnit", "")),
+            "precipitation_probability_unit": _text(period.get("probabilityOfPrecipitation", {}).get("unitCode", "")),
+            "precipitation_probability_value": _text(period.get("probabilityOfPrecipitation", {}).get("value", "")),
+            "dewpoint_unit": _text(period.get("dewpoint", {}).get("unitCode", "")),
+            "dewpoint_value": _text(period.get("dewpoint", {}).get("value", "")),
+            "relative_humidity_unit": _text(period.get("relativeHumidity", {}).get("unitCode", "")),
+            "relative_humidity_value": _text(period.get("relativeHumidity", {}).get("value", "")),
+            "wind_speed": _text(period.get("windSpeed", "")),
+            "wind_direction": _text(period.get("windDirection", "")),
+            "weather_icon_url": _text(period.get("icon", "")),
+            "short_forecast": _text(period.get("shortForecast", ""))
+        })
+    return rows
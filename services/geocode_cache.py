@@ -0,0 +1,103 @@
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from geopy.location import Location
+from .sqlite_database import SqliteDatabase
+
+# Marks a cached "not found" answer, so repeated misses do not reach the geocoder
+NOT_FOUND = object()
+
+
+class GeocodeCache:
+    """
+    A two-tier geocoding cache: a bounded in-memory LRU in front of a persistent SQLite store.
+    Queries are normalised before lookup, and "not found" answers are cached for a shorter time than locations.
+    """
+
+    LOCATION_TTL = 90 * 24 * 60 * 60  # 90 days
+    NOT_FOUND_TTL = 24 * 60 * 60  # 1 day
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS geocodes (query TEXT PRIMARY KEY, address TEXT, latitude REAL, longitude REAL, "
+        "altitude REAL, raw TEXT, expires_at REAL)"
+    )
+
+    def __init__(self, db_file: str = "data/geocode_cache.sqlite3", max_memory_entries: int = 256) -> None:
+        self.db_file = db_file
+        self._database = SqliteDatabase(db_file, self.SCHEMA)
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, tuple[object, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "negative_hits": 0, "misses": 0}
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalises a query so that trivially different spellings share a cache entry."""
+        query = unicodedata.normalize("NFKC", query).casefold().strip()
+        query = re.sub(r"\s*,\s*", ", ", query)
+        query = re.sub(r"\s+", " ", query)
+        return query.strip(" ,.")
+
+    def get(self, query: str):
+        """Returns a cached Location, NOT_FOUND for a cached miss, or None if the query is not cached."""
+        key = self.normalize_query(query)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[1] > now:
+                self._memory.move_to_end(key)
+                self._count("negative_hits" if entry[0] is NOT_FOUND else "memory_hits")
+                return entry[0]
+
+        with self._database.connect() as connection:
+            row = connection.execute(
+                "SELECT address, latitude, longitude, altitude, raw, expires_at FROM geocodes WHERE query = ?", (key,)
+            ).fetchone()
+
+        if row is None or row[5] <= now:
+            with self._lock:
+                self._count("misses")
+            return None
+
+        result = NOT_FOUND if row[0] is None else Location(row[0], (row[1], row[2], row[3]), json.loads(row[4]))
+        with self._lock:
+            self._remember(key, result, row[5])
+            self._count("negative_hits" if result is NOT_FOUND else "disk_hits")
+        return result
+
+    def put(self, query: str, location: Location | None) -> None:
+        """Caches a geocoding result; None is cached as "not found"."""
+        key = self.normalize_query(query)
+        if location is None:
+            expires_at = time.time() + self.NOT_FOUND_TTL
+            values = (key, None, None, None, None, None, expires_at)
+        else:
+            expires_at = time.time() + self.LOCATION_TTL
+            values = (key, location.address, location.latitude, location.longitude, location.altitude,
+                      json.dumps(location.raw), expires_at)
+
+        with self._lock:
+            self._remember(key, NOT_FOUND if location is None else location, expires_at)
+        with self._database.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO geocodes (query, address, latitude, longitude, altitude, raw, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", values
+            )
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns a copy of the hit/miss counters, taken under the lock so they are consistent."""
+        with self._lock:
+            return dict(self.stats)
+
+    def _remember(self, key: str, result, expires_at: float) -> None:
+        self._memory[key] = (result, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _count(self, counter: str) -> None:
+        self.stats[counter] += 1
@@ -0,0 +1,23 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from .geolocator import GeolocatorService
+
+
+class GeocodeWorker(QThread):
+    """A worker that geocodes a search query in the background."""
+
+    # Emits the search id, the query and the resulting location (None if not found)
+    geocode_finished = pyqtSignal(int, str, object)
+
+    def __init__(self, geo_service: GeolocatorService, search_id: int, query: str) -> None:
+        super().__init__()
+        self.geo_service = geo_service
+        self.search_id = search_id
+        self.query = query
+
+    def run(self) -> None:
+        """Looks up the query unless a newer search has already superseded this one"""
+        if self.isInterruptionRequested():
+            self.geocode_finished.emit(self.search_id, self.query, None)
+            return
+        location = self.geo_service.get_location(self.query)
+        self.geocode_finished.emit(self.search_id, self.query, location)
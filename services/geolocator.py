@@ -1,16 +1,44 @@
 from geopy import Nominatim
+from .geocode_cache import NOT_FOUND, GeocodeCache
+from .rate_limiter import TokenBucket
 
 
 class GeolocatorService:
-    """Handles geolocation queries using geopy."""
+    """
+    Handles geolocation queries using geopy.
+    Results (including "not found") are cached in memory and on disk, and live Nominatim requests are limited to
+    one per second as its usage policy requires.
+    """
 
-    def __init__(self):
+    def __init__(self, cache: GeocodeCache | None = None, rate_limiter: TokenBucket | None = None):
         self.geolocator = Nominatim(user_agent="weather_app")
+        self.cache = cache or GeocodeCache()
+        self.rate_limiter = rate_limiter or TokenBucket(rate=1, capacity=1)
 
     def get_location(self, query):
         """Returns a location object from a search query."""
         try:
-            return self.geolocator.geocode(query)
+            cached = self.cache.get(query)
         except Exception as e:
+            print(f"Geocode cache error: {e}")
+            cached = None
+        if cached is not None:
+            return None if cached is NOT_FOUND else cached
+
+        try:
+            self.rate_limiter.acquire()
+            location = self.geolocator.geocode(query)
+        except Exception as e:
+            # Errors are not cached, so the query is retried next time
             print(f"Geocoder error: {e}")
             return None
+
+        try:
+            self.cache.put(query, location)
+        except Exception as e:
+            print(f"Geocode cache error: {e}")
+        return location
+
+    def cache_stats(self):
+        """Returns a snapshot of the geocode cache hit/miss counters."""
+        return self.cache.get_stats()
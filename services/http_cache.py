@@ -0,0 +1,97 @@
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple
+from .sqlite_database import SqliteDatabase
+
+
+_MAX_AGE_PATTERN = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+def response_expires_at(headers) -> float | None:
+    """Computes a response's absolute expiry time, preferring Cache-Control max-age over Expires."""
+    cache_control = headers.get("Cache-Control") or ""
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return None
+
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    if match:
+        return time.time() + int(match.group(1))
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class CachedResponse(NamedTuple):
+    """A stored response body together with its validators and freshness lifetime."""
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    expires_at: float | None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Whether the response can still be served without contacting the server."""
+        return self.expires_at is not None and (now or time.time()) < self.expires_at
+
+    def validator_headers(self) -> dict[str, str]:
+        """Returns the conditional request headers that revalidate this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    A persistent, validator-aware HTTP response cache stored in SQLite.
+    Each response body is stored with its ETag, Last-Modified and expiry time (from Cache-Control max-age or
+    Expires), so requests can be served locally while fresh and revalidated with a conditional GET afterwards.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, body BLOB, etag TEXT, last_modified TEXT, "
+        "expires_at REAL)"
+    )
+
+    def __init__(self, db_file: str = "data/http_cache.sqlite3") -> None:
+        self.db_file = db_file
+        self._database = SqliteDatabase(db_file, self.SCHEMA)
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Returns the stored response for the URL, fresh or not, or None."""
+        with self._database.connect() as connection:
+            row = connection.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def store(self, url: str, body: bytes, headers) -> CachedResponse:
+        """Stores a full (200) response body with the validators and expiry found in its headers."""
+        entry = CachedResponse(body, headers.get("ETag"), headers.get("Last-Modified"), response_expires_at(headers))
+        with self._database.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (url, *entry)
+            )
+        return entry
+
+    def refresh(self, url: str, entry: CachedResponse, headers) -> CachedResponse:
+        """Updates a stored response after a 304, keeping its body but taking any new validators and expiry."""
+        return self.store(url, entry.body, {
+            "ETag": headers.get("ETag") or entry.etag,
+            "Last-Modified": headers.get("Last-Modified") or entry.last_modified,
+            "Cache-Control": headers.get("Cache-Control", ""),
+            "Expires": headers.get("Expires", "")
+        })
+
+    def invalidate(self, url: str) -> None:
+        """Removes the stored response for the URL."""
+        with self._database.connect() as connection:
+            connection.execute("DELETE FROM responses WHERE url = ?", (url,))
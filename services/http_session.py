@@ -0,0 +1,172 @@
+import json
+import random
+import threading
+import time
+from typing import Callable
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from .http_cache import CachedResponse, HttpCache, response_expires_at
+from .rate_limiter import TokenBucket
+
+
+class RequestCancelled(Exception):
+    """Raised by HttpSession when its caller asked it to stop before the request completed."""
+
+
+class HttpSession:
+    """
+    A thread-safe, pooled HTTP session shared by every ForecastWorker.
+    Connections are kept alive per host, and transient failures (5xx responses, timeouts and dropped
+    connections) are retried with bounded exponential backoff and full jitter.
+    """
+
+    RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 8, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 8.0, timeout: float = 10) -> None:
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+        # requests.Session is safe to share for plain GETs once it is configured;
+        # the lock only guards the statistics below.
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": "weather_app", "Accept": "application/geo+json"})
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+        self._lock = threading.Lock()
+        self._host_stats: dict[str, dict[str, int]] = {}
+
+    def get(self, url: str, headers: dict[str, str] | None = None, timeout: float | None = None,
+            rate_limiter: TokenBucket | None = None,
+            should_stop: Callable[[], bool] | None = None) -> requests.Response:
+        """
+        Performs a GET request, retrying transient failures. Raises for non-retryable HTTP errors.
+        With a rate limiter, every attempt (retries included) waits for a token before it goes out.
+        should_stop is checked before every attempt, so a caller that no longer needs the response stops the
+        retries (and their backoff) with RequestCancelled.
+        """
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            self._raise_if_stopped(should_stop)
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+                # Waiting for a token can take a while, so check again before going out
+                self._raise_if_stopped(should_stop)
+            self._record(host, "requests")
+            try:
+                response = self._session.get(url, headers=headers, timeout=timeout or self.timeout)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                self._record(host, "errors")
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    if response.status_code >= 400:
+                        self._record(host, "errors")
+                    response.raise_for_status()
+                    return response
+                self._record(host, "errors")
+                response.close()
+
+            self._record(host, "retries")
+            time.sleep(self._backoff_delay(attempt))
+            attempt += 1
+            # The next pass checks should_stop again, so a stopped caller makes no request after the backoff
+
+    def get_json(self, url: str, headers: dict[str, str] | None = None, timeout: float | None = None,
+                 cache: HttpCache | None = None, rate_limiter: TokenBucket | None = None,
+                 should_stop: Callable[[], bool] | None = None) -> dict:
+        """Performs a GET request (see get_body) and decodes the JSON body."""
+        return json.loads(self.get_body(url, headers=headers, timeout=timeout, cache=cache, rate_limiter=rate_limiter,
+                                        should_stop=should_stop))
+
+    def get_body(self, url: str, headers: dict[str, str] | None = None, timeout: float | None = None,
+                 cache: HttpCache | None = None, rate_limiter: TokenBucket | None = None,
+                 should_stop: Callable[[], bool] | None = None) -> bytes:
+        """Performs a GET request (see get_response) and returns the raw body, so callers can decide to parse it."""
+        return self.get_response(url, headers=headers, timeout=timeout, cache=cache, rate_limiter=rate_limiter,
+                                 should_stop=should_stop).body
+
+    def get_response(self, url: str, headers: dict[str, str] | None = None, timeout: float | None = None,
+                     cache: HttpCache | None = None, rate_limiter: TokenBucket | None = None,
+                     should_stop: Callable[[], bool] | None = None) -> CachedResponse:
+        """
+        Performs a GET request and returns the response body with its validators and expiry time.
+        With a cache, a fresh stored response is returned without touching the network, and a stale one is
+        revalidated with If-None-Match/If-Modified-Since so a 304 reuses the stored body.
+        Cache hits do not take a token from the rate limiter.
+        """
+        if cache is None:
+            response = self.get(url, headers=headers, timeout=timeout, rate_limiter=rate_limiter,
+                                should_stop=should_stop)
+            return CachedResponse(response.content, response.headers.get("ETag"),
+                                  response.headers.get("Last-Modified"), response_expires_at(response.headers))
+
+        entry = cache.get(url)
+        if entry is not None and entry.is_fresh():
+            self._record(urlsplit(url).netloc, "cache_hits")
+            return entry
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.validator_headers())
+
+        response = self.get(url, headers=request_headers, timeout=timeout, rate_limiter=rate_limiter,
+                            should_stop=should_stop)
+        if response.status_code == 304 and entry is not None:
+            self._record(urlsplit(url).netloc, "not_modified")
+            return cache.refresh(url, entry, response.headers)
+        return cache.store(url, response.content, response.headers)
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Returns request, retry and connection pool counters for every host contacted so far."""
+        with self._lock:
+            stats = {host: dict(counters) for host, counters in self._host_stats.items()}
+
+        for pool_key in list(self._adapter.poolmanager.pools.keys()):
+            pool = self._adapter.poolmanager.pools.get(pool_key)
+            if pool is None:
+                continue
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            counters = stats.setdefault(host, {"requests": 0, "retries": 0, "errors": 0})
+            counters["connections_opened"] = counters.get("connections_opened", 0) + pool.num_connections
+            counters["idle_connections"] = counters.get("idle_connections", 0) + sum(
+                1 for conn in list(pool.pool.queue) if conn is not None)
+        return stats
+
+    def close(self) -> None:
+        """Closes every pooled connection."""
+        self._session.close()
+
+    @staticmethod
+    def _raise_if_stopped(should_stop: Callable[[], bool] | None) -> None:
+        if should_stop is not None and should_stop():
+            raise RequestCancelled("Request cancelled")
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff: a random delay between 0 and the capped exponential step."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _record(self, host: str, counter: str) -> None:
+        with self._lock:
+            counters = self._host_stats.setdefault(host, {"requests": 0, "retries": 0, "errors": 0})
+            counters[counter] = counters.get(counter, 0) + 1
+
+
+_shared_session: HttpSession | None = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> HttpSession:
+    """Returns the application-wide HttpSession, creating it on first use."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = HttpSession()
+        return _shared_session
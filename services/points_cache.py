@@ -0,0 +1,53 @@
+import time
+from .sqlite_database import SqliteDatabase
+
+
+class PointsCache:
+    """
+    A persistent SQLite cache of NWS /points metadata (the forecast and forecastHourly URLs for a location).
+    Entries are keyed by the 4-decimal rounded latitude/longitude and expire after a long TTL, since the grid a
+    location belongs to almost never changes.
+    """
+
+    DEFAULT_TTL = 30 * 24 * 60 * 60  # 30 days
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS points (latitude REAL, longitude REAL, forecast_url TEXT, "
+        "forecast_hourly_url TEXT, fetched_at REAL, PRIMARY KEY (latitude, longitude))"
+    )
+
+    def __init__(self, db_file: str = "data/points_cache.sqlite3", ttl: float = DEFAULT_TTL) -> None:
+        self.db_file = db_file
+        self.ttl = ttl
+        self._database = SqliteDatabase(db_file, self.SCHEMA)
+
+    def get(self, latitude: float, longitude: float) -> dict | None:
+        """Returns the cached forecast URLs for the coordinates, or None if missing or expired."""
+        with self._database.connect() as connection:
+            row = connection.execute(
+                "SELECT forecast_url, forecast_hourly_url, fetched_at FROM points WHERE latitude = ? AND longitude = ?",
+                self._key(latitude, longitude)
+            ).fetchone()
+
+        if row is None or time.time() - row[2] > self.ttl:
+            return None
+        return {"forecast": row[0], "forecastHourly": row[1]}
+
+    def put(self, latitude: float, longitude: float, forecast_url: str, forecast_hourly_url: str) -> None:
+        """Stores the forecast URLs for the coordinates."""
+        with self._database.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO points (latitude, longitude, forecast_url, forecast_hourly_url, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*self._key(latitude, longitude), forecast_url, forecast_hourly_url, time.time())
+            )
+
+    def invalidate(self, latitude: float, longitude: float) -> None:
+        """Removes the entry for the coordinates, e.g. after one of its forecast URLs returned 404."""
+        with self._database.connect() as connection:
+            connection.execute("DELETE FROM points WHERE latitude = ? AND longitude = ?",
+                               self._key(latitude, longitude))
+
+    @staticmethod
+    def _key(latitude: float, longitude: float) -> tuple[float, float]:
+        return round(latitude, 4), round(longitude, 4)
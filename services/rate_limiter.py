@@ -0,0 +1,39 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A thread-safe token-bucket rate limiter.
+    Tokens refill continuously at `rate` per second up to `capacity`; each call to acquire() takes one token,
+    waiting for it if the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        # acquire() needs a whole token, so a bucket that holds less than one could never hand one out
+        if not rate > 0:
+            raise ValueError(f"rate must be greater than 0, got {rate}")
+        if not capacity >= 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, blocking: bool = True, timeout: float | None = None) -> bool:
+        """Takes a token, waiting up to `timeout` seconds for one. Returns False if none became available."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+
+            if not blocking or (deadline is not None and now + wait > deadline):
+                return False
+            time.sleep(wait)
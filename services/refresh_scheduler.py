@@ -0,0 +1,125 @@
+import random
+import time
+from typing import Hashable
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class RefreshScheduler(QObject):
+    """
+    Schedules background forecast refreshes from how stale each location's forecast is, instead of on a fixed timer.
+
+    A location becomes due once its upstream forecast is expected to have changed: an update interval after the
+    forecast's generatedAt time, and never before its response expires (Cache-Control max-age or Expires), since
+    until then a refresh would only be served from the HTTP cache. Each due time gets a random delay added so many
+    locations do not refresh in lockstep, and locations falling due close together are refreshed as one batch.
+    While paused (the app is idle or hidden) nothing fires; on resume, locations that fell due meanwhile are
+    refreshed at once, in one batch.
+    """
+
+    # Emitted with the keys of the locations to refresh, as one coalesced batch
+    refreshDue = pyqtSignal(list)
+
+    # NWS regenerates gridpoint forecasts roughly once an hour
+    UPDATE_INTERVAL = 60 * 60
+
+    # Bounds in seconds on how soon and how late a refresh is scheduled, and the delay before retrying a failure
+    MIN_DELAY = 5 * 60
+    MAX_DELAY = 3 * 60 * 60
+    RETRY_DELAY = 10 * 60
+
+    # Random delay added to each due time: up to this share of the wait, but no more than MAX_JITTER seconds
+    JITTER = 0.1
+    MAX_JITTER = 5 * 60
+
+    # Locations due within this many seconds of the earliest one are refreshed together
+    COALESCE_WINDOW = 2 * 60
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._due: dict[Hashable, float] = {}
+        self._paused = False
+
+        # One timer for the earliest due location
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+
+    def schedule(self, key: Hashable, *managers) -> float:
+        """
+        Schedules the next refresh of a location from its forecast managers (anything with generated_epoch and
+        expires_at), replacing any refresh already scheduled for it. The location is due as soon as any of its
+        forecasts is. Returns the due time in epoch seconds.
+        """
+        now = time.time()
+        due = min((self.next_refresh_at(manager.generated_epoch, manager.expires_at, now) for manager in managers),
+                  default=now + self.UPDATE_INTERVAL)
+        return self._set_due(key, due + self._jitter(due - now))
+
+    def schedule_retry(self, key: Hashable) -> float:
+        """Schedules another attempt for a location whose refresh failed. Returns the due time in epoch seconds."""
+        return self._set_due(key, time.time() + self.RETRY_DELAY + self._jitter(self.RETRY_DELAY))
+
+    def remove(self, key: Hashable) -> None:
+        """Stops refreshing a location."""
+        if self._due.pop(key, None) is not None:
+            self._arm()
+
+    def clear(self) -> None:
+        """Stops refreshing every location."""
+        self._due.clear()
+        self._timer.stop()
+
+    def pause(self) -> None:
+        """Stops firing until resume() is called; due times are kept."""
+        self._paused = True
+        self._timer.stop()
+
+    def resume(self) -> None:
+        """Starts firing again, at once for any location that fell due while paused."""
+        self._paused = False
+        self._arm()
+
+    def is_paused(self) -> bool:
+        return self._paused
+
+    def due_at(self, key: Hashable) -> float | None:
+        """Returns when a location is due, in epoch seconds, or None if it is not scheduled."""
+        return self._due.get(key)
+
+    @classmethod
+    def next_refresh_at(cls, generated_epoch: float | None, expires_at: float | None,
+                        now: float | None = None) -> float:
+        """Returns when a forecast is expected to have changed upstream, in epoch seconds (without jitter)."""
+        now = time.time() if now is None else now
+        due = now + cls.UPDATE_INTERVAL if generated_epoch is None else generated_epoch + cls.UPDATE_INTERVAL
+        if expires_at is not None:
+            due = max(due, expires_at)
+        return min(max(due, now + cls.MIN_DELAY), now + cls.MAX_DELAY)
+
+    def _jitter(self, delay: float) -> float:
+        return random.uniform(0, min(self.MAX_JITTER, self.JITTER * max(delay, 0)))
+
+    def _set_due(self, key: Hashable, due: float) -> float:
+        self._due[key] = due
+        self._arm()
+        return due
+
+    def _arm(self) -> None:
+        """Points the timer at the earliest due location."""
+        if self._paused or not self._due:
+            self._timer.stop()
+            return
+        delay = max(min(self._due.values()) - time.time(), 0)
+        self._timer.start(int(delay * 1000))
+
+    def _fire(self) -> None:
+        """Emits every location due now or within the coalescing window of the earliest one."""
+        if self._paused or not self._due:
+            return
+        cutoff = max(time.time(), min(self._due.values())) + self.COALESCE_WINDOW
+        keys = [key for key, due in self._due.items() if due <= cutoff]
+        # Refreshed locations are rescheduled by the caller once their new forecasts arrive
+        for key in keys:
+            del self._due[key]
+        self._arm()
+        self.refreshDue.emit(keys)
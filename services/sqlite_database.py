@@ -0,0 +1,33 @@
+import os
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from typing import Iterator
+
+
+class SqliteDatabase:
+    """
+    A SQLite file shared by the persistent caches. The schema is created the first time a connection is opened,
+    along with the file's directory if it does not exist yet.
+    """
+
+    def __init__(self, db_file: str, schema: str) -> None:
+        self.db_file = db_file
+        self.schema = schema
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a short-lived connection (one per call, so the database can be used from any thread)."""
+        with self._lock:
+            if not self._initialized:
+                directory = os.path.dirname(self.db_file)
+                if directory and not os.path.exists(directory):
+                    os.makedirs(directory)
+                with closing(sqlite3.connect(self.db_file)) as connection, connection:
+                    connection.executescript(self.schema)
+                self._initialized = True
+
+        with closing(sqlite3.connect(self.db_file, timeout=5)) as connection, connection:
+            yield connection
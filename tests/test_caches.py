@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from services.geocode_cache import NOT_FOUND, GeocodeCache
+from services.geolocator import GeolocatorService
+from services.http_cache import HttpCache
+from services.points_cache import PointsCache
+
+
+class CachesTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        # A missing directory is created with the database
+        self.directory = os.path.join(directory.name, "data")
+
+    def test_each_cache_creates_its_schema_on_first_use(self):
+        geocode_cache = GeocodeCache(os.path.join(self.directory, "geocode_cache.sqlite3"))
+        http_cache = HttpCache(os.path.join(self.directory, "http_cache.sqlite3"))
+        points_cache = PointsCache(os.path.join(self.directory, "points_cache.sqlite3"))
+
+        geocode_cache.put("Nowhere", None)
+        http_cache.store("https://example.test/a", b"{}", {"ETag": '"1"', "Cache-Control": "max-age=60"})
+        points_cache.put(40.0, -75.0, "forecast", "forecast/hourly")
+
+        self.assertIs(NOT_FOUND, GeocodeCache(geocode_cache.db_file).get("nowhere"))
+        self.assertEqual(b"{}", HttpCache(http_cache.db_file).get("https://example.test/a").body)
+        self.assertEqual({"forecast": "forecast", "forecastHourly": "forecast/hourly"},
+                         PointsCache(points_cache.db_file).get(40.0, -75.0))
+
+    def test_cache_stats_returns_a_snapshot(self):
+        service = GeolocatorService(cache=GeocodeCache(os.path.join(self.directory, "geocode_cache.sqlite3")))
+        service.cache.put("Nowhere", None)
+        self.assertIsNone(service.get_location("Nowhere"))
+
+        stats = service.cache_stats()
+        stats["negative_hits"] = 100
+
+        self.assertEqual(1, service.cache_stats()["negative_hits"])
+
+
+if __name__ == "__main__":
+    unittest.main()
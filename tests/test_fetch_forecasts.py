@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from benchmarks.nws_stub import NwsStubServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FetchForecastsCommandTest(unittest.TestCase):
+    """Runs `python -m services.fetch_forecasts` against a local NWS stub, in a temporary working directory."""
+
+    def setUp(self):
+        self.stub = NwsStubServer().start()
+        self.addCleanup(self.stub.stop)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.work_dir = directory.name
+
+    def run_command(self, *arguments, locations="39.7456,-97.0892\n"):
+        environment = dict(os.environ, PYTHONPATH=ROOT)
+        return subprocess.run([sys.executable, "-m", "services.fetch_forecasts", "-", "--api-base-url",
+                               self.stub.base_url, *arguments], input=locations, capture_output=True, text=True,
+                              cwd=self.work_dir, env=environment, timeout=60)
+
+    def test_rate_below_one_request_per_second_finishes(self):
+        process = self.run_command("--rate", "0.5", "--forecast", "daily")
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        record = json.loads(process.stdout)
+        self.assertTrue(record["daily"]["periods"])
+
+    def test_json_lines_periods_hold_numbers(self):
+        process = self.run_command("--forecast", "hourly")
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        period = json.loads(process.stdout)["hourly"]["periods"][0]
+        self.assertIsInstance(period["period_number"], int)
+        for field in ("temperature", "precipitation_probability_value", "dewpoint_value", "relative_humidity_value"):
+            self.assertIsInstance(period[field], (float, type(None)), field)
+        self.assertIsInstance(period["temperature"], float)
+        self.assertIsInstance(period["short_forecast"], str)
+
+    def test_rates_that_are_not_positive_are_rejected(self):
+        for rate in ("0", "-1", "nan", "fast"):
+            process = self.run_command("--rate", rate)
+            self.assertEqual(process.returncode, 2)
+            self.assertIn("--rate", process.stderr)
+        self.assertEqual(self.stub.stats()["requests"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
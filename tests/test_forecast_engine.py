@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from benchmarks.nws_stub import NwsStubServer
+from services.forecast_engine import ForecastCancelled, ForecastEngine
+from services.http_cache import HttpCache
+from services.http_session import HttpSession
+from services.points_cache import PointsCache
+
+
+class ForecastEngineTest(unittest.TestCase):
+    """Fetches through a ForecastEngine against a local NWS stub, with caches in a temporary directory."""
+
+    def setUp(self):
+        self.stub = NwsStubServer(max_age=3600).start()
+        self.addCleanup(self.stub.stop)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.session = HttpSession(max_retries=0)
+        self.addCleanup(self.session.close)
+        self.http_cache = HttpCache(os.path.join(directory.name, "http_cache.sqlite3"))
+        self.points_cache = PointsCache(os.path.join(directory.name, "points_cache.sqlite3"))
+        self.engine = ForecastEngine(session=self.session, points_cache=self.points_cache,
+                                     http_cache=self.http_cache, api_base_url=self.stub.base_url)
+        self.addCleanup(self.engine.shutdown)
+
+    def test_fetch_loads_both_forecasts(self):
+        daily_manager, hourly_manager = self.engine.fetch(SimpleNamespace(latitude=39.7456, longitude=-97.0892))
+
+        self.assertTrue(daily_manager.get_forecasts())
+        self.assertTrue(hourly_manager.get_forecasts())
+
+    def test_moved_grid_point_is_looked_up_again(self):
+        # Both caches still hold a fresh /points answer that links to a grid point the API no longer serves
+        latitude, longitude = 39.7456, -97.0892
+        points_url = f"{self.stub.base_url}/points/{latitude},{longitude}"
+        moved = {"forecast": f"{self.stub.base_url}/gridpoints/OLD/1,1/gone",
+                 "forecastHourly": f"{self.stub.base_url}/gridpoints/OLD/1,1/gone/hourly"}
+        self.points_cache.put(latitude, longitude, moved["forecast"], moved["forecastHourly"])
+        self.http_cache.store(points_url, json.dumps({"properties": moved}).encode(),
+                              {"Cache-Control": "max-age=3600"})
+
+        daily_manager, hourly_manager = self.engine.fetch(SimpleNamespace(latitude=latitude, longitude=longitude))
+
+        self.assertTrue(daily_manager.get_forecasts())
+        self.assertTrue(hourly_manager.get_forecasts())
+        self.assertEqual(self.stub.request_log().count(f"/points/{latitude},{longitude}"), 1)
+        self.assertNotEqual(self.points_cache.get(latitude, longitude), moved)
+
+    def test_cancel_stops_retries(self):
+        # The API keeps failing, so the session would retry (with backoff) three more times if left alone
+        session = HttpSession(max_retries=3)
+        self.addCleanup(session.close)
+        session._backoff_delay = lambda attempt: 0.3
+        engine = ForecastEngine(session=session, points_cache=self.points_cache, http_cache=self.http_cache,
+                                api_base_url=self.stub.base_url)
+        self.addCleanup(engine.shutdown)
+        self.stub.fail_next(10, "503")
+        cancelled = threading.Event()
+        errors = []
+
+        def fetch():
+            try:
+                engine.fetch(SimpleNamespace(latitude=39.7456, longitude=-97.0892), cancelled)
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=fetch)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while not self.stub.request_log() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        cancelled.set()  # While the first attempt's backoff is still sleeping
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ForecastCancelled)
+        self.assertEqual(len(self.stub.request_log()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+from services.forecast_export import CsvForecastExporter, ForecastExporter, StoreForecastExporter
+
+
+class ForecastExporterTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_exporters_must_write_both_files(self):
+        with self.assertRaises(TypeError):
+            ForecastExporter(os.path.join(self.directory, "daily"), os.path.join(self.directory, "hourly"))
+
+    def test_any_export_error_is_logged_and_kept_in_the_future(self):
+        exporter = CsvForecastExporter(os.path.join(self.directory, "daily.csv"),
+                                       os.path.join(self.directory, "hourly.csv"))
+        self.addCleanup(exporter.shutdown)
+
+        # A field the CSV layout does not have makes csv.DictWriter raise ValueError
+        with self.assertLogs("services.forecast_export", level="ERROR") as logs:
+            future = exporter.export([{"unknown_field": "1"}], [])
+            with self.assertRaises(ValueError):
+                future.result(timeout=5)
+            exporter.shutdown()
+        self.assertIn("Forecast export failed", logs.output[0])
+
+    def test_successful_export_writes_both_files(self):
+        exporter = StoreForecastExporter(os.path.join(self.directory, "daily.fcst"),
+                                         os.path.join(self.directory, "hourly.fcst"))
+        self.addCleanup(exporter.shutdown)
+
+        exporter.export([{"period_name": "Tonight"}], [{"short_forecast": "Sunny"}]).result(timeout=5)
+
+        self.assertTrue(os.path.exists(exporter.daily_file))
+        self.assertTrue(os.path.exists(exporter.hourly_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
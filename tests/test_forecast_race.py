@@ -0,0 +1,120 @@
+import os
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from benchmarks.nws_stub import NwsStubServer
+from services import forecast_engine
+from services.forecast_engine import ForecastEngine
+from services.http_cache import HttpCache
+from services.http_session import HttpSession
+from services.points_cache import PointsCache
+from ui.icon_loader import IconLoader, set_icon_loader
+from ui.main_window import WeatherMainWindow
+
+
+class RecordingExporter:
+    """Stands in for a ForecastExporter and remembers what it was asked to export."""
+
+    def __init__(self):
+        self.exports = []
+
+    def export(self, daily_rows, hourly_rows):
+        self.exports.append((daily_rows, hourly_rows))
+
+
+class ForecastRaceTest(unittest.TestCase):
+    """
+    Confirms two locations back to back while the first one's /points lookup is held up by the NWS stub, so the
+    first worker is still running when it is superseded.
+    """
+
+    SLOW_LOCATION = SimpleNamespace(latitude=10.0, longitude=1.0, address="Slow location")
+    FAST_LOCATION = SimpleNamespace(latitude=20.0, longitude=2.0, address="Fast location")
+
+    # The stub's grid point for SLOW_LOCATION (see NwsStubServer.points_body)
+    SLOW_GRIDPOINT = "/gridpoints/STB/400,40/"
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.stub = NwsStubServer().start()
+        self.addCleanup(self.stub.stop)
+        self.stub.slow_down("/points/10.0,1.0", 1.0)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        session = HttpSession(max_retries=0)
+        self.addCleanup(session.close)
+        engine = ForecastEngine(session=session,
+                                points_cache=PointsCache(os.path.join(directory.name, "points_cache.sqlite3")),
+                                http_cache=HttpCache(os.path.join(directory.name, "http_cache.sqlite3")),
+                                api_base_url=self.stub.base_url)
+        self.addCleanup(engine.shutdown)
+        # Workers fetch through the shared engine, so point it (and the icon cache) at this test's stub and files
+        patcher = mock.patch.object(forecast_engine, "_shared_engine", engine)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        set_icon_loader(IconLoader(cache_directory=os.path.join(directory.name, "icon_cache")))
+        self.addCleanup(set_icon_loader, None)
+
+        self.window = WeatherMainWindow()
+        self.addCleanup(self.window.deleteLater)
+        self.window.forecast_exporter = RecordingExporter()
+
+        # Every result that reaches the window, by generation
+        self.handled_generations = []
+        handle_forecast_result = self.window.handle_forecast_result
+
+        def record_result(generation, *result):
+            self.handled_generations.append(generation)
+            handle_forecast_result(generation, *result)
+
+        self.window.handle_forecast_result = record_result
+
+    def wait_until(self, condition, timeout=10):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "Timed out waiting for the forecast workers")
+            self.app.processEvents()
+            time.sleep(0.01)
+
+    def slow_requests(self):
+        return [path for path in self.stub.request_log()
+                if path.startswith("/points/10.0,1.0") or path.startswith(self.SLOW_GRIDPOINT)]
+
+    def test_only_the_newer_location_is_shown_and_exported(self):
+        self.window.handle_location_confirmed(self.SLOW_LOCATION)
+        slow_worker = next(iter(self.window._forecast_workers))
+        # Wait until the slow worker's /points request is in flight, then supersede it
+        self.wait_until(lambda: self.slow_requests())
+
+        self.window.handle_location_confirmed(self.FAST_LOCATION)
+        requests_at_cancel = self.slow_requests()
+        self.wait_until(lambda: not self.window._forecast_workers)
+
+        self.assertTrue(slow_worker.isFinished())
+        self.assertEqual(self.handled_generations, [2])
+        self.assertEqual(len(self.window.forecast_exporter.exports), 1)
+        self.assertTrue(self.window.forecast_tabs_widget.daily_tab.forecast_cards)
+        # The cancelled worker made no request after its /points answer arrived: no forecast downloads
+        self.assertEqual(self.slow_requests(), requests_at_cancel)
+        self.assertEqual(requests_at_cancel, ["/points/10.0,1.0"])
+
+    def test_stale_generation_is_ignored(self):
+        self.window.handle_location_confirmed(self.FAST_LOCATION)
+        self.wait_until(lambda: not self.window._forecast_workers)
+        self.assertEqual(self.handled_generations, [1])
+
+        # A result carrying an older generation than the latest request changes nothing
+        self.window._forecast_generation += 1
+        self.window.handle_forecast_result(1, True, "Forecasts loaded", None, None)
+        self.assertEqual(len(self.window.forecast_exporter.exports), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
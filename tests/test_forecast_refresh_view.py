@@ -0,0 +1,80 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QPoint
+from PyQt5.QtWidgets import QApplication
+from benchmarks.payloads import daily_payload, hourly_payload
+from models import DailyForecastManager, HourlyForecastManager
+from services.forecast_rows import daily_forecast_rows, hourly_forecast_rows
+from ui.daily_forecast import DailyForecastTab
+from ui.hourly_forecast import HourlyForecastTab
+
+
+class ForecastRefreshViewTest(unittest.TestCase):
+    """A background refresh updates the tabs in place; a new location starts them afresh."""
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.hourly_rows = hourly_forecast_rows(hourly_payload(7))
+        self.daily_rows = daily_forecast_rows(daily_payload(7))
+
+    def hourly_tab(self):
+        tab = HourlyForecastTab()
+        self.addCleanup(tab.deleteLater)
+        tab.resize(580, 550)
+        tab.show()
+        tab.update_data("", HourlyForecastManager.from_rows(self.hourly_rows, "").time_index)
+        self.app.processEvents()
+        return tab
+
+    def top_row_key(self, tab):
+        return tab.forecast_model.row_key(tab.forecast_view.indexAt(QPoint(0, 0)).row())
+
+    def expanded_keys(self, tab):
+        return {tab.forecast_model.row_key(row) for row in tab.forecast_model._expanded}
+
+    def test_hourly_refresh_keeps_expanded_rows_and_scroll_position(self):
+        tab = self.hourly_tab()
+        tab.forecast_model.toggle_expanded(5)
+        tab.forecast_model.toggle_expanded(40)
+        tab.forecast_view.scrollTo(tab.forecast_model.index(30), tab.forecast_view.PositionAtTop)
+        self.app.processEvents()
+        top_row_key, expanded_keys = self.top_row_key(tab), self.expanded_keys(tab)
+
+        # An hour later, the first period has dropped out of the refreshed forecast
+        tab.update_data("", HourlyForecastManager.from_rows(self.hourly_rows[1:], "").time_index, refresh=True)
+        self.app.processEvents()
+
+        self.assertEqual(self.top_row_key(tab), top_row_key)
+        self.assertEqual(self.expanded_keys(tab), expanded_keys)
+
+    def test_hourly_update_for_a_new_location_starts_at_the_top(self):
+        tab = self.hourly_tab()
+        tab.forecast_model.toggle_expanded(5)
+        tab.forecast_view.scrollTo(tab.forecast_model.index(30), tab.forecast_view.PositionAtTop)
+
+        tab.update_data("", HourlyForecastManager.from_rows(self.hourly_rows, "").time_index)
+        self.app.processEvents()
+
+        self.assertEqual(tab.forecast_view.verticalScrollBar().value(), 0)
+        self.assertEqual(self.expanded_keys(tab), set())
+
+    def test_daily_refresh_keeps_the_selected_day(self):
+        tab = DailyForecastTab()
+        self.addCleanup(tab.deleteLater)
+        forecasts = DailyForecastManager.from_rows(self.daily_rows, "").get_forecasts()
+        tab.update_data("", forecasts)
+        tab.forecast_cards[3].on_show_more_clicked()
+        selected = forecasts[3].period_name
+
+        tab.update_data("", forecasts, refresh=True)
+        self.assertEqual(tab.selected_period_name, selected)
+
+        tab.update_data("", forecasts)
+        self.assertEqual(tab.selected_period_name, forecasts[0].period_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
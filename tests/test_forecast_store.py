@@ -0,0 +1,46 @@
+import csv
+import io
+import os
+import tempfile
+import unittest
+from benchmarks.payloads import daily_payload, hourly_payload
+from models.forecast_store import ForecastStore
+from services.forecast_rows import DAILY_FIELDNAMES, HOURLY_FIELDNAMES, daily_forecast_rows, hourly_forecast_rows
+
+
+class ForecastStoreTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store_file = os.path.join(directory.name, "forecast" + ForecastStore.EXTENSION)
+
+    def round_trip(self, rows, layout, fieldnames):
+        """Writes the rows to a store, reads them back with rows() and writes those as CSV."""
+        ForecastStore.write(self.store_file, rows, layout)
+        store = ForecastStore.open(self.store_file)
+        try:
+            self.assertEqual(layout, store.layout)
+            output = io.StringIO()
+            writer = csv.DictWriter(output, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(store.rows())
+        finally:
+            store.close()
+        output.seek(0)
+        return list(csv.DictReader(output))
+
+    def test_hourly_rows_round_trip_through_csv(self):
+        rows = hourly_forecast_rows(hourly_payload(2))
+        self.assertEqual(rows, self.round_trip(rows, "hourly", HOURLY_FIELDNAMES))
+
+    def test_daily_rows_round_trip_through_csv(self):
+        rows = daily_forecast_rows(daily_payload(7))
+        self.assertEqual(rows, self.round_trip(rows, "daily", DAILY_FIELDNAMES))
+
+    def test_unknown_layout_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ForecastStore.write(self.store_file, [], "weekly")
+
+
+if __name__ == "__main__":
+    unittest.main()
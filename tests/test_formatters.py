@@ -0,0 +1,50 @@
+import math
+import unittest
+from array import array
+from utils import format_dewpoint, format_dewpoints, format_number, format_precipitation_probabilities, \
+    format_precipitation_probability, format_relative_humidities, format_relative_humidity, format_temperature, \
+    format_temperatures
+
+
+class BatchFormattersTest(unittest.TestCase):
+    """The batch formatters give exactly what the scalar formatters give, value by value."""
+
+    VALUES = [21.5, None, math.nan, 0.0, -3.25, 100.0, math.nan]
+
+    def columns(self):
+        # Plain lists carry None for a missing value; float arrays can only carry NaN
+        return [self.VALUES, array("d", [math.nan if value is None else value for value in self.VALUES])]
+
+    def test_temperatures(self):
+        for unit in ("F", "C", ""):
+            expected = [format_temperature(value, unit) for value in self.VALUES]
+            for column in self.columns():
+                self.assertEqual(list(zip(*format_temperatures(column, unit))), expected)
+
+    def test_dewpoints(self):
+        for unit in ("wmoUnit:degC", "F", ""):
+            expected = [format_dewpoint(value, unit) for value in self.VALUES]
+            for column in self.columns():
+                self.assertEqual(list(zip(*format_dewpoints(column, unit))), expected)
+
+    def test_percentages(self):
+        for column in self.columns():
+            self.assertEqual(format_precipitation_probabilities(column),
+                             [format_precipitation_probability(format_number(value)) for value in self.VALUES])
+            self.assertEqual(format_relative_humidities(column),
+                             [format_relative_humidity(format_number(value)) for value in self.VALUES])
+
+    def test_missing_values(self):
+        self.assertEqual(format_temperature(math.nan, "F"), ("N/A", "N/A"))
+        self.assertEqual(format_number(math.nan), "")
+
+    def test_number_text(self):
+        self.assertEqual(format_number("40"), "40")
+        self.assertEqual(format_number("12.5"), "12.5")
+        self.assertEqual(format_number("2e1"), "20")
+        self.assertEqual(format_number("abc"), "")
+        self.assertEqual(format_number("nan"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+from models.hourly_forecast_class import HourlyForecast
+
+
+class HourlyForecastWindTest(unittest.TestCase):
+    def wind(self, wind_speed, wind_direction):
+        return HourlyForecast.from_dict({"wind_speed": wind_speed, "wind_direction": wind_direction}).wind
+
+    def test_speeds_in_mph_are_parsed(self):
+        forecast = HourlyForecast.from_dict({"wind_speed": "5 to 10 mph", "wind_direction": "S"})
+
+        self.assertEqual((forecast.wind_speed_low, forecast.wind_speed_high), (5.0, 10.0))
+        self.assertEqual(forecast.wind, "5 to 10 mph S")
+        self.assertEqual(self.wind("10 mph", "NW"), "10 mph NW")
+
+    def test_other_wind_text_is_shown_as_given(self):
+        self.assertEqual(self.wind("Calm", "").strip(), "Calm")
+        self.assertEqual(self.wind("10 to 15 km/h", "W"), "10 to 15 km/h W")
+
+    def test_missing_wind(self):
+        self.assertEqual(self.wind("", ""), "N/A")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import time
+import unittest
+from services.forecast_engine import ForecastEngine
+from services.rate_limiter import TokenBucket
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_buckets_that_cannot_hold_a_token_are_rejected(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0.5, capacity=0.5)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+    def test_fractional_rate_hands_out_tokens(self):
+        bucket = TokenBucket(rate=0.5, capacity=1)
+
+        self.assertTrue(bucket.acquire(timeout=0))
+        self.assertFalse(bucket.acquire(timeout=0))
+
+    def test_engine_serves_rates_below_one_request_per_second(self):
+        engine = ForecastEngine(requests_per_second=0.5)
+        self.addCleanup(engine.shutdown)
+        bucket = engine._rate_limiter("https://api.weather.gov/points/1,1")
+
+        start = time.monotonic()
+        self.assertTrue(bucket.acquire(timeout=1))
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
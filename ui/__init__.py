@@ -1 +1,2 @@
 from .main_window import WeatherMainWindow
+from .theme import apply_theme
\ No newline at end of file
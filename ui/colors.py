@@ -1,4 +1,4 @@
-TEXT = "#e9eaee;"
+TEXT = "#e9eaee"
 WINDOW_BACKGROUND = "#1e1f22"
 WIDGET_BACKGROUND = "#2b2c31"
 HIGHLIGHT_BACKGROUND = "#42454b"
\ No newline at end of file
@@ -1,4 +1,3 @@
-from .colors import WIDGET_BACKGROUND
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QFrame, QSizePolicy, QLabel, QHBoxLayout
@@ -12,7 +11,7 @@ class CurrentWeatherWidget(QFrame):
         super().__init__(parent)
 
         self.setFrameShape(QFrame.NoFrame)
-        self.setStyleSheet(f"background-color: {WIDGET_BACKGROUND}; border: none; padding: 7px;")
+        self.setObjectName("CurrentWeather")
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
         # Configure current temperature label
@@ -22,7 +21,6 @@ class CurrentWeatherWidget(QFrame):
 
         self.currentTempLabel = QLabel("", self)
         self.currentTempLabel.setFont(current_temp_font)
-        self.currentTempLabel.setStyleSheet("background-color: transparent;")
         self.currentTempLabel.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
         # Configure short forecast label
@@ -31,7 +29,6 @@ class CurrentWeatherWidget(QFrame):
 
         self.shortForecastLabel = QLabel("", self)
         self.shortForecastLabel.setFont(short_forecast_font)
-        self.shortForecastLabel.setStyleSheet("background-color: transparent;")
         self.shortForecastLabel.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
         # Layout setup
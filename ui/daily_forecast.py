@@ -1,8 +1,6 @@
-from PyQt5.QtCore import pyqtSignal, Qt, QUrl
-from PyQt5.QtGui import QFont, QPixmap
-from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
+from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QFrame, QLabel, QPushButton, QVBoxLayout, QWidget, QScrollArea, QHBoxLayout, QTextEdit
-from .colors import HIGHLIGHT_BACKGROUND, WIDGET_BACKGROUND, WINDOW_BACKGROUND
 
 
 class DailyForecastTab(QWidget):
@@ -12,7 +10,7 @@ class DailyForecastTab(QWidget):
         """Initializes the UI components and layout for displaying daily forecasts."""
         super().__init__(parent)
 
-        self.setStyleSheet(f"background-color: {WIDGET_BACKGROUND}; border: none;")
+        self.setObjectName("DailyForecastTab")
 
         # Initialize main layout
         self.daily_layout = QVBoxLayout(self)
@@ -22,28 +20,6 @@ class DailyForecastTab(QWidget):
         # Create and configure the top section (scroll area for daily forecast cards)
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet(f"""
-            QScrollBar:horizontal {{
-                background: {WIDGET_BACKGROUND};
-                height: 17px;
-                margin-left: 5px;
-                margin-right: 5px;
-                margin-bottom: 5px;
-                border: none;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {HIGHLIGHT_BACKGROUND};
-                min-width: 20px;
-                border-radius: 5px;;
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                background: none;
-                border: none;
-            }}
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-                background: none;
-            }}
-        """)
 
         # Create a container widget for the scroll area with a horizontal layout
         self.scroll_content = QWidget()
@@ -52,6 +28,13 @@ class DailyForecastTab(QWidget):
         self.scroll_layout.setSpacing(10)
         self.scroll_content.setLayout(self.scroll_layout)
 
+        # Forecast cards are pooled: they are rebound to new data on each refresh and hidden when not needed,
+        # and the stretch after them fills the remaining space
+        self.forecast_cards = []
+        self.scroll_layout.addStretch()
+        # The period whose detailed forecast is shown
+        self.selected_period_name = None
+
         # Set the scroll content widget to the scroll area
         self.scroll_area.setWidget(self.scroll_content)
 
@@ -60,82 +43,68 @@ class DailyForecastTab(QWidget):
         self.detailed_forecast_label.setReadOnly(True)
         self.detailed_forecast_label.setPlainText("")
         self.detailed_forecast_label.setFixedHeight(100)
-        self.detailed_forecast_label.setStyleSheet(f"""
-            QTextEdit {{
-                padding: 5px;
-            }}
-            QScrollBar:vertical {{
-                background: {WIDGET_BACKGROUND};
-                width: 12px;
-                margin: 0px;
-                border: none;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {HIGHLIGHT_BACKGROUND};
-                min-height: 20px;
-                border-radius: 5px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                background: none;
-                border: none;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-        """)
 
         # Create and configure the bottom section (text area for generated time)
         self.daily_generated_time = QTextEdit()
         self.daily_generated_time.setReadOnly(True)
         self.daily_generated_time.setPlainText("")
         self.daily_generated_time.setFixedHeight(37)
-        self.daily_generated_time.setStyleSheet("padding: 5px;")
 
         # Add all sections to the main layout
         self.daily_layout.addWidget(self.scroll_area)
         self.daily_layout.addWidget(self.detailed_forecast_label)
         self.daily_layout.addWidget(self.daily_generated_time)
 
-    def update_data(self, daily_forecast_generated_time, daily_forecasts):
+    def update_data(self, daily_forecast_generated_time, daily_forecasts, refresh=False):
         """
         Loads and updates the daily forecast data.
         This will update the scroll area with new forecast cards and show the detailed forecast for the first item.
+        A refresh of the same location keeps showing the selected period's detailed forecast while it is still in
+        the forecast.
         """
-        # Clear existing forecast cards in the scroll area
-        self._clear_forecast_cards()
-
-        # Add new forecast cards to the scroll layout
-        for forecast in daily_forecasts:
-            card = DailyForecastCard()
+        # Rebind pooled cards to the new forecasts, creating cards only when the pool is too small
+        for position, forecast in enumerate(daily_forecasts):
+            if position < len(self.forecast_cards):
+                card = self.forecast_cards[position]
+            else:
+                card = DailyForecastCard()
+                # Connect signal to show detailed forecast
+                card.showMoreClicked.connect(self.update_detailed_forecast_label)
+                card.setFixedWidth(150)
+                self.scroll_layout.insertWidget(position, card)
+                self.forecast_cards.append(card)
             card.update_data(forecast)
-            # Connect signal to show detailed forecast
-            card.showMoreClicked.connect(self.update_detailed_forecast_label)
-            card.setFixedWidth(150)
-            self.scroll_layout.addWidget(card)
+            card.show()
 
-        self.scroll_layout.addStretch()  # Stretch the layout to fill remaining space
+        # Hide the cards left over from a longer forecast
+        for card in self.forecast_cards[len(daily_forecasts):]:
+            card.hide()
 
-        # Display the detailed forecast of the first forecast card
-        self.update_detailed_forecast_label(daily_forecasts[0].period_name, daily_forecasts[0].detailed_forecast)
+        # Display the detailed forecast of the selected period on a refresh, or else of the first forecast card
+        selected = daily_forecasts[0]
+        if refresh:
+            selected = next((forecast for forecast in daily_forecasts
+                             if forecast.period_name == self.selected_period_name), selected)
+        self.update_detailed_forecast_label(selected.period_name, selected.detailed_forecast)
 
         # Update the generated time label
         self.daily_generated_time.setPlainText(f"Daily forecast generated at {daily_forecast_generated_time}")
 
     def _clear_forecast_cards(self):
-        """Clears all the forecast cards currently in the scroll layout."""
-        while self.scroll_layout.count():
-            child = self.scroll_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        """Hides all the forecast cards; they stay in the pool for the next update."""
+        for card in self.forecast_cards:
+            card.hide()
 
     def update_detailed_forecast_label(self, period_name, detailed_forecast):
         """Updates the detailed forecast text area with the provided period name and detailed forecast."""
+        self.selected_period_name = period_name
         text = f"{period_name}: {detailed_forecast}"
         self.detailed_forecast_label.setPlainText(text)
 
     def clear_data(self):
         """Clears the forecast cards, detailed forecast, and generated time."""
         self._clear_forecast_cards()
+        self.selected_period_name = None
         self.detailed_forecast_label.setPlainText("")
         self.daily_generated_time.setPlainText("")
 
@@ -151,7 +120,7 @@ class DailyForecastCard(QFrame):
         super().__init__(parent)
 
         # Initialize the UI components and set up the layout
-        self.setStyleSheet(f"background-color: {WINDOW_BACKGROUND};")
+        self.setObjectName("DailyForecastCard")
         self.uniform_font = QFont()
         self.uniform_font.setPixelSize(24)
 
@@ -177,17 +146,6 @@ class DailyForecastCard(QFrame):
         self.show_more_button = QPushButton("Show More", self)
         self.show_more_button.setFont(self.uniform_font)
         self.show_more_button.clicked.connect(self.on_show_more_clicked)
-        self.show_more_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {WIDGET_BACKGROUND};
-                border: none;
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: {HIGHLIGHT_BACKGROUND};
-            }}
-        """)
 
         # Set up the layout
         self.layout = QVBoxLayout(self)
@@ -203,13 +161,10 @@ class DailyForecastCard(QFrame):
 
         self.setLayout(self.layout)
 
-        # Set up the network manager for fetching weather icon images
-        self.manager = QNetworkAccessManager(self)
-        self.manager.finished.connect(self.on_image_loaded)
-
-        # Initialize period_name and detailed_forecast to None (to prevent crashes before it's set)
+        # Initialize period_name, detailed_forecast and weather_icon_url to None (to prevent crashes before it's set)
         self.period_name = None
         self.detailed_forecast = None
+        self.weather_icon_url = None
 
     def update_data(self, forecast):
         """Populate the card with forecast data and trigger the image fetch."""
@@ -219,22 +174,21 @@ class DailyForecastCard(QFrame):
         self.icon_label.setText(f"Icon: {forecast.weather_icon_url}")
         self.period_name = forecast.period_name
         self.detailed_forecast = forecast.detailed_forecast
+        self.weather_icon_url = forecast.weather_icon_url
 
-        # Request the weather icon image using the URL from forecast data
-        request = QNetworkRequest(QUrl(forecast.weather_icon_url))
-        self.manager.get(request)
+        # Request the weather icon image from the shared icon loader (imported on first use, with QtNetwork)
+        from .icon_loader import get_icon_loader
+        get_icon_loader().request(forecast.weather_icon_url, 100, self.on_image_loaded)
 
-    def on_image_loaded(self, reply):
+    def on_image_loaded(self, weather_icon_url, pixmap):
         """Handles the completion of the image fetch and sets it on the icon label."""
-        if reply.error():
+        if weather_icon_url != self.weather_icon_url:
+            return  # The card has been rebound to another forecast since this request was made
+
+        if pixmap is None:
             self.icon_label.setText("Failed to load image")
         else:
-            data = reply.readAll()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            self.icon_label.setPixmap(pixmap.scaled(100, 100, Qt.KeepAspectRatio))
-
-        reply.deleteLater()
+            self.icon_label.setPixmap(pixmap)
 
     def on_show_more_clicked(self):
         """Emits a signal with period name and detailed forecast when the button is clicked."""
@@ -1,46 +1,70 @@
-from PyQt5.QtWidgets import QTabWidget
-from .colors import HIGHLIGHT_BACKGROUND, WIDGET_BACKGROUND, WINDOW_BACKGROUND
+from PyQt5.QtWidgets import QTabWidget, QVBoxLayout, QWidget
 from .daily_forecast import DailyForecastTab
-from .hourly_forecast import HourlyForecastTab
 
 
 class ForecastTabsWidget(QTabWidget):
-    """A tab widget containing a 'Daily Forecast' tab and an 'Hourly Forecast' tab."""
+    """
+    A tab widget containing a 'Daily Forecast' tab and an 'Hourly Forecast' tab.
+    The Hourly tab is hidden at startup, so it is only built the first time it is selected; forecasts that arrive
+    before then are kept and shown when it is built.
+    """
+
+    HOURLY_TAB_INDEX = 1
 
     def __init__(self, parent=None):
         """Initializes the UI components and layout for displaying the tabs."""
         super().__init__(parent)
 
-        self.setStyleSheet(f"""
-            QTabWidget::pane {{
-                background: {WINDOW_BACKGROUND};
-                border: none;
-                padding-top: 3px;
-            }}
-            QTabBar::tab {{
-                background: {WIDGET_BACKGROUND};
-                min-width: 75px;
-                padding: 5px;
-            }}
-            QTabBar::tab:selected {{
-                background: {HIGHLIGHT_BACKGROUND};
-            }}
-        """)
+        self.setObjectName("ForecastTabs")
 
         # Create and initialize the forecast tabs
         self.daily_tab = DailyForecastTab()
-        self.hourly_tab = HourlyForecastTab()
+        self.hourly_tab = None
+        self._hourly_data = None
+
+        # The Hourly tab starts as an empty page that the HourlyForecastTab is added to when first selected
+        self.hourly_page = QWidget()
+        self.hourly_page_layout = QVBoxLayout(self.hourly_page)
+        self.hourly_page_layout.setContentsMargins(0, 0, 0, 0)
 
         # Add tabs to the widget
         self.addTab(self.daily_tab, "Daily")
-        self.addTab(self.hourly_tab, "Hourly")
+        self.addTab(self.hourly_page, "Hourly")
+        self.currentChanged.connect(self._handle_tab_changed)
 
-    def update_data(self, daily_generated_time, hourly_generated_time, daily_forecasts, hourly_forecasts):
-        """Updates both the Daily and Hourly forecast tabs with new forecast data."""
-        self.daily_tab.update_data(daily_generated_time, daily_forecasts)
-        self.hourly_tab.update_data(hourly_generated_time, hourly_forecasts)
+    def update_data(self, daily_generated_time, hourly_generated_time, daily_forecasts, hourly_time_index,
+                    refresh=False):
+        """
+        Updates both the Daily and Hourly forecast tabs with new forecast data.
+        A refresh of the same location keeps each tab's scroll position, expanded rows and selected day.
+        """
+        self.daily_tab.update_data(daily_generated_time, daily_forecasts, refresh)
+        if self.hourly_tab is None:
+            self._hourly_data = (hourly_generated_time, hourly_time_index)
+        else:
+            self.hourly_tab.update_data(hourly_generated_time, hourly_time_index, refresh)
 
     def clear_data(self):
         """Clears all forecast data from both tabs."""
         self.daily_tab.clear_data()
-        self.hourly_tab.clear_data()
+        if self.hourly_tab is None:
+            self._hourly_data = None
+        else:
+            self.hourly_tab.clear_data()
+
+    def build_hourly_tab(self):
+        """Builds the Hourly tab now (if it has not been built yet) and returns it."""
+        if self.hourly_tab is None:
+            # The hourly view and its delegate are only imported once the tab is needed
+            from .hourly_forecast import HourlyForecastTab
+
+            self.hourly_tab = HourlyForecastTab()
+            self.hourly_page_layout.addWidget(self.hourly_tab)
+            if self._hourly_data is not None:
+                self.hourly_tab.update_data(*self._hourly_data)
+                self._hourly_data = None
+        return self.hourly_tab
+
+    def _handle_tab_changed(self, index):
+        if index == self.HOURLY_TAB_INDEX:
+            self.build_hourly_tab()
@@ -1,6 +1,9 @@
-from PyQt5.QtGui import QFont
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QTextEdit, QLabel, QFrame, QPushButton, QHBoxLayout
-from .colors import HIGHLIGHT_BACKGROUND, WIDGET_BACKGROUND, WINDOW_BACKGROUND
+from PyQt5.QtCore import QAbstractListModel, QEvent, QModelIndex, QPoint, QRect, QSize, Qt
+from PyQt5.QtGui import QColor, QFont, QFontMetrics
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QListView, QStyledItemDelegate, QAbstractItemView, \
+    QStyle
+from models import HourlyTimeIndex
+from .theme import current_palette
 import sys
 
 
@@ -11,129 +14,163 @@ class HourlyForecastTab(QWidget):
         """Initializes the UI components and layout for displaying hourly forecasts."""
         super().__init__(parent)
 
-        self.setStyleSheet(f"background-color: {WIDGET_BACKGROUND}; border: none;")
+        self.setObjectName("HourlyForecastTab")
 
         # Initialize main layout
         self.hourly_layout = QVBoxLayout(self)
         self.hourly_layout.setContentsMargins(0, 0, 0, 0)
         self.hourly_layout.setSpacing(3)
 
-        # Create and configure the top section (scroll area for hourly forecast rows)
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet(f"""
-            QScrollBar:vertical {{
-                background: {WIDGET_BACKGROUND};
-                width: 17px;
-                margin-top: 5px;
-                margin-right: 5px;
-                margin-bottom: 5px;
-                border: none;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {HIGHLIGHT_BACKGROUND};
-                min-height: 50px;
-                border-radius: 5px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                background: none;
-                border: none;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-        """)
-
-        # Create a container widget for the scroll area with a vertical layout
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(5, 5, 5, 5)
-        self.scroll_layout.setSpacing(5)
-        self.scroll_content.setLayout(self.scroll_layout)
-
-        # Set the scroll content widget to the scroll area
-        self.scroll_area.setWidget(self.scroll_content)
+        # Create and configure the top section (a list view that only paints the visible hourly rows)
+        self.forecast_model = HourlyForecastListModel(self)
+        self.forecast_delegate = HourlyForecastDelegate(self)
+        self.forecast_view = QListView()
+        self.forecast_view.setModel(self.forecast_model)
+        self.forecast_view.setItemDelegate(self.forecast_delegate)
+        self.forecast_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.forecast_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.forecast_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.forecast_view.setFocusPolicy(Qt.NoFocus)
+        self.forecast_view.setMouseTracking(True)
 
         # Create and configure the bottom section (text area for generated time)
         self.hourly_generated_time = QTextEdit()
         self.hourly_generated_time.setReadOnly(True)
         self.hourly_generated_time.setPlainText("")
         self.hourly_generated_time.setFixedHeight(37)
-        self.hourly_generated_time.setStyleSheet("padding: 5px;")
-
 
         # Add all sections to the main layout
-        self.hourly_layout.addWidget(self.scroll_area)
+        self.hourly_layout.addWidget(self.forecast_view)
         self.hourly_layout.addWidget(self.hourly_generated_time)
 
-    def update_data(self, hourly_forecast_generated_time, hourly_forecasts):
-        # Clear existing rows in the scroll area
-        self._clear_forecast_rows()
-
-        forecast_date = ""
-
-        # Add new forecast row to the scroll layout
-        for forecast in hourly_forecasts:
-            row = HourlyForecastRow()
-            row.update_data(forecast)
-
-            if forecast.date != forecast_date:
-                forecast_date = forecast.date
-                header_row = HourlyForecastHeaderRow()
-                header_row.update_data(forecast_date)
-                self.scroll_layout.addWidget(header_row)
-            # Connect signal to show extra details
-            # row.showMoreClicked.connect(self.update_detailed_forecast_label)
-            self.scroll_layout.addWidget(row)
+    def update_data(self, hourly_forecast_generated_time, hourly_time_index, refresh=False):
+        """
+        Shows new hourly forecasts. A refresh of the same location keeps the expanded rows and the scroll position,
+        matching rows by start time; otherwise every row is collapsed and the list starts at the top.
+        """
+        # Replace the rows in the model; the view only paints the ones that are visible
+        if refresh:
+            anchor = self._top_visible_row()
+            self.forecast_model.set_forecasts(hourly_time_index, keep_expanded=True)
+            self._restore_top_visible_row(anchor)
+        else:
+            self.forecast_model.set_forecasts(hourly_time_index)
+            self.forecast_view.scrollToTop()
 
         # Update the generated time label
         self.hourly_generated_time.setPlainText(f"Hourly forecast generated at {hourly_forecast_generated_time}")
 
     def clear_data(self):
-        self._clear_forecast_rows()
+        self.forecast_model.set_forecasts(HourlyTimeIndex([]))
         self.hourly_generated_time.setPlainText("")
 
-    def _clear_forecast_rows(self):
-        """Clears all the rows currently in the scroll layout."""
-        while self.scroll_layout.count():
-            child = self.scroll_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
+    def _top_visible_row(self):
+        """Returns the key of the row at the top of the view and how far (in pixels) it is scrolled past, or None."""
+        index = self.forecast_view.indexAt(QPoint(0, 0))
+        if not index.isValid():
+            return None
+        return self.forecast_model.row_key(index.row()), self.forecast_view.visualRect(index).top()
+
+    def _restore_top_visible_row(self, anchor):
+        """Scrolls the row with the anchor's key back to the top of the view, or to the top if it is gone."""
+        row = None if anchor is None else self.forecast_model.row_for_key(anchor[0])
+        if row is None:
+            self.forecast_view.scrollToTop()
+            return
+        self.forecast_view.scrollTo(self.forecast_model.index(row), QAbstractItemView.PositionAtTop)
+        scroll_bar = self.forecast_view.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.value() - anchor[1])
+
+
+class HourlyForecastListModel(QAbstractListModel):
+    """
+    A list model of the hourly forecasts with a date header row before each new day.
+    Whether a row's details are expanded is kept here as model state rather than in a widget.
+    """
+
+    ForecastRole = Qt.UserRole + 1
+    IsHeaderRole = Qt.UserRole + 2
+    ExpandedRole = Qt.UserRole + 3
 
-class HourlyForecastHeaderRow(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Each item is either a date string (a header row) or an HourlyForecast
+        self._items = []
+        self._expanded = set()
+
+    def set_forecasts(self, hourly_time_index, keep_expanded=False):
+        """
+        Rebuilds the rows from the days of an HourlyTimeIndex, collapsing every row unless keep_expanded is set, which
+        keeps the periods that were expanded (matched by start time) expanded.
+        """
+        expanded_keys = {self.row_key(row) for row in self._expanded} if keep_expanded else set()
+        self.beginResetModel()
+        self._items = []
+        forecasts = hourly_time_index.forecasts
+        for _, start, end in hourly_time_index.day_ranges():
+            self._items.append(forecasts[start].date)
+            self._items.extend(forecasts[start:end])
+        self._expanded = {row for row in range(len(self._items)) if self.row_key(row) in expanded_keys}
+        self.endResetModel()
+
+    def row_key(self, row):
+        """Identifies a row across updates: its date for a header row, and its start time for a forecast row."""
+        item = self._items[row]
+        return ("header", item) if isinstance(item, str) else ("forecast", item.start_epoch)
+
+    def row_for_key(self, key):
+        """Returns the row with the given key (see row_key), or None."""
+        for row in range(len(self._items)):
+            if self.row_key(row) == key:
+                return row
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        item = self._items[index.row()]
+        is_header = isinstance(item, str)
+        if role == Qt.DisplayRole:
+            return item if is_header else item.time
+        if role == self.ForecastRole:
+            return None if is_header else item
+        if role == self.IsHeaderRole:
+            return is_header
+        if role == self.ExpandedRole:
+            return index.row() in self._expanded
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+    def toggle_expanded(self, row):
+        """Expands or collapses the details of a forecast row."""
+        if row in self._expanded:
+            self._expanded.discard(row)
+        else:
+            self._expanded.add(row)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self.ExpandedRole])
 
-        heading_font = QFont()
-        heading_font.setPixelSize(20)
-
-        self.setFont(heading_font)
-        self.setText("")
-        self.setContentsMargins(5, 5, 5, 5)
-
-    def update_data(self, date):
-        self.setText(date)
 
+class HourlyForecastDelegate(QStyledItemDelegate):
+    """Paints date headers and hourly forecast rows, including the expand/collapse button and details."""
 
-class HourlyForecastRow(QFrame):
-    """A row widget to display hourly forecast data."""
+    ROW_SPACING = 5
+    ROW_PADDING = 5
+    LABEL_PADDING = 4
+    COLUMN_SPACING = 6
+    # Fixed widths of the hour, icon, rain and temperature columns; wind takes the remaining space
+    COLUMN_WIDTHS = (110, 45, 100, 70)
+    BUTTON_SIZE = 30
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Initialize the UI components and set up the layout
-        self.setStyleSheet(f"""
-            HourlyForecastRow {{
-                background-color: {WINDOW_BACKGROUND};
-                border-radius: 4px;
-            }}
-            QLabel {{
-                background-color: {WINDOW_BACKGROUND};
-                padding: 4px;
-            }}
-        """)
-
         self.uniform_font = QFont()
         self.uniform_font.setPixelSize(20)
 
@@ -145,94 +182,110 @@ class HourlyForecastRow(QFrame):
             font_name = "Noto Color Emoji"
 
         self.icon_font = QFont(font_name)
-
         self.icon_font.setPixelSize(20)
 
-        self.is_expanded = False
-
-        # Main row widgets
-        self.hour_label = QLabel("", self)
-        self.icon_label = QLabel("", self)
-        self.rain_label = QLabel("", self)
-        self.temp_label = QLabel("", self)
-        self.wind_label = QLabel("", self)
-        self.show_more_button = QPushButton("+", self)
-        self.show_more_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {WIDGET_BACKGROUND};
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {HIGHLIGHT_BACKGROUND};
-            }}
-        """)
-
-        # Set fixed widths for consistent spacing
-        self.hour_label.setFixedWidth(110)
-        self.icon_label.setFixedWidth(45)
-        self.rain_label.setFixedWidth(100)
-        self.temp_label.setFixedWidth(70)
-        self.show_more_button.setFixedSize(30, 30)
-
-        # Details section (initially hidden)
-        self.details_widget = QWidget()
-        self.details_widget.setVisible(False)
-        self.details_layout = QVBoxLayout(self.details_widget)
-        self.details_layout.setSpacing(0)  # Reduced from default
-        self.details_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Detail labels
-        self.detail_short_forecast = QLabel("", self.details_widget)
-        self.detail_short_forecast.setWordWrap(True)
-        self.detail_dewpoint = QLabel("", self.details_widget)
-        self.detail_humidity = QLabel("", self.details_widget)
-
-        # Set fonts
-        for widget in [self.hour_label, self.rain_label, self.temp_label, self.wind_label, self.detail_short_forecast,
-                      self.detail_dewpoint, self.detail_humidity]:
-            widget.setFont(self.uniform_font)
-
-        self.icon_label.setFont(self.icon_font)
-
-        # Main layout setup
-        self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(5, 5, 5, 5)
-        self.main_layout.setSpacing(0)
-
-        # Top row layout
-        self.top_row = QHBoxLayout()
-        self.top_row.setContentsMargins(0, 0, 5, 0)
-
-        # Add widgets
-        for widget in [self.hour_label, self.icon_label, self.rain_label, self.temp_label, self.wind_label,
-                       self.show_more_button]:
-            self.top_row.addWidget(widget)
-
-        for widget in [self.detail_short_forecast, self.detail_dewpoint, self.detail_humidity]:
-            self.details_layout.addWidget(widget)
-
-        # Add to main layout
-        self.main_layout.addLayout(self.top_row)
-        self.main_layout.addWidget(self.details_widget)
-
-        # Connect button
-        self.show_more_button.clicked.connect(self.toggle_details)
-
-    def toggle_details(self):
-        """Toggle the visibility of the details section."""
-        self.is_expanded = not self.is_expanded
-        self.details_widget.setVisible(self.is_expanded)
-        self.show_more_button.setText("-" if self.is_expanded else "+")
-
-    def update_data(self, forecast):
-        """Populate the row with forecast data"""
-        self.hour_label.setText(forecast.time)
-        self.icon_label.setText(forecast.weather_emoji)
-        self.rain_label.setText(forecast.precipitation_probability)
-        self.temp_label.setText(forecast.temperature_fahrenheit)
-        self.wind_label.setText(forecast.wind)
-
-        self.detail_short_forecast.setText(f"Short Forecast: {forecast.short_forecast}")
-        self.detail_dewpoint.setText(f"Dewpoint: {forecast.dewpoint_fahrenheit}")
-        self.detail_humidity.setText(f"Relative Humidity: {forecast.relative_humidity}")
+        # Last mouse position over the view, used to highlight the button under the cursor
+        self._hover_pos = None
+
+        line_height = QFontMetrics(self.uniform_font).height() + 2 * self.LABEL_PADDING
+        self.header_height = line_height + 2 * self.ROW_PADDING
+        self.line_height = line_height
+        self.row_height = max(line_height, self.BUTTON_SIZE) + 2 * self.ROW_PADDING
+
+    def sizeHint(self, option, index):
+        if index.data(HourlyForecastListModel.IsHeaderRole):
+            return QSize(option.rect.width(), self.header_height)
+
+        height = self.row_height
+        if index.data(HourlyForecastListModel.ExpandedRole):
+            height += 3 * self.line_height
+        return QSize(option.rect.width(), height + self.ROW_SPACING)
+
+    def paint(self, painter, option, index):
+        # Colors come from the current theme at paint time so a theme change applies on the next repaint
+        palette = current_palette()
+        text_color = QColor(palette["text"])
+        painter.save()
+        painter.setRenderHint(painter.Antialiasing)
+        painter.setPen(text_color)
+
+        if index.data(HourlyForecastListModel.IsHeaderRole):
+            painter.setFont(self.uniform_font)
+            text_rect = option.rect.adjusted(self.ROW_PADDING, self.ROW_PADDING, 0, -self.ROW_PADDING)
+            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole))
+            painter.restore()
+            return
+
+        forecast = index.data(HourlyForecastListModel.ForecastRole)
+        row_rect = option.rect.adjusted(0, 0, 0, -self.ROW_SPACING)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(palette["window_background"]))
+        painter.drawRoundedRect(row_rect, 4, 4)
+
+        # Top row columns
+        painter.setPen(text_color)
+        top = row_rect.top() + self.ROW_PADDING
+        line_rect = QRect(row_rect.left() + self.ROW_PADDING + self.COLUMN_SPACING, top, 0, self.row_height - 2 * self.ROW_PADDING)
+        texts = [forecast.time, forecast.weather_emoji, forecast.precipitation_probability,
+                 forecast.temperature_fahrenheit]
+        for column, (text, width) in enumerate(zip(texts, self.COLUMN_WIDTHS)):
+            painter.setFont(self.icon_font if column == 1 else self.uniform_font)
+            line_rect.setWidth(width)
+            painter.drawText(line_rect.adjusted(self.LABEL_PADDING, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, text)
+            line_rect.moveLeft(line_rect.left() + width + self.COLUMN_SPACING)
+
+        button_rect = self.button_rect(option.rect)
+        line_rect.setRight(button_rect.left() - self.COLUMN_SPACING)
+        painter.setFont(self.uniform_font)
+        painter.drawText(line_rect.adjusted(self.LABEL_PADDING, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter,
+                         forecast.wind)
+
+        # Expand/collapse button
+        expanded = index.data(HourlyForecastListModel.ExpandedRole)
+        hovered = bool(option.state & QStyle.State_MouseOver) and self._hover_pos is not None \
+            and button_rect.contains(self._hover_pos)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(palette["highlight_background" if hovered else "widget_background"]))
+        painter.drawRoundedRect(button_rect, 4, 4)
+        painter.setPen(text_color)
+        painter.drawText(button_rect, Qt.AlignCenter, "-" if expanded else "+")
+
+        # Details section
+        if expanded:
+            details = [f"Short Forecast: {forecast.short_forecast}", f"Dewpoint: {forecast.dewpoint_fahrenheit}",
+                       f"Relative Humidity: {forecast.relative_humidity}"]
+            detail_rect = QRect(row_rect.left() + self.ROW_PADDING + self.COLUMN_SPACING + self.LABEL_PADDING,
+                                row_rect.top() + self.row_height - self.ROW_PADDING,
+                                row_rect.width() - 2 * (self.ROW_PADDING + self.COLUMN_SPACING + self.LABEL_PADDING),
+                                self.line_height)
+            metrics = QFontMetrics(self.uniform_font)
+            for text in details:
+                painter.drawText(detail_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                                 metrics.elidedText(text, Qt.ElideRight, detail_rect.width()))
+                detail_rect.translate(0, self.line_height)
+
+        painter.restore()
+
+    def button_rect(self, item_rect):
+        """Returns the rectangle of the expand/collapse button within an item."""
+        left = item_rect.right() - self.ROW_PADDING - 5 - self.BUTTON_SIZE
+        top = item_rect.top() + (self.row_height - self.BUTTON_SIZE) // 2
+        return QRect(left, top, self.BUTTON_SIZE, self.BUTTON_SIZE)
+
+    def editorEvent(self, event, model, option, index):
+        """Toggles a row's details when its button is clicked, and tracks the cursor for the hover highlight."""
+        if event.type() == QEvent.MouseMove:
+            button_rect = self.button_rect(option.rect)
+            was_hovered = self._hover_pos is not None and button_rect.contains(self._hover_pos)
+            self._hover_pos = event.pos()
+            if was_hovered != button_rect.contains(event.pos()) and option.widget is not None:
+                option.widget.viewport().update(option.rect)
+            return False
+
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton \
+                and not index.data(HourlyForecastListModel.IsHeaderRole) \
+                and self.button_rect(option.rect).contains(event.pos()):
+            model.toggle_expanded(index.row())
+            self.sizeHintChanged.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,141 @@
+import time
+from collections import OrderedDict
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, QUrl, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkRequest
+
+
+class _IconDecodeSignals(QObject):
+    """Carries decoded icons from the decode pool back to the GUI thread."""
+
+    # Emits the URL, a {size: QImage or None} dict and the decode time in milliseconds
+    decoded = pyqtSignal(str, object, float)
+
+
+class _IconDecodeTask(QRunnable):
+    """Decodes icon bytes and smooth-scales them to every requested size on a worker thread."""
+
+    def __init__(self, url, data, sizes, signals):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.sizes = sizes
+        self.signals = signals
+
+    def run(self):
+        start = time.perf_counter()
+        image = QImage.fromData(self.data)
+        images = {}
+        for size in self.sizes:
+            images[size] = None if image.isNull() else image.scaled(size, size, Qt.KeepAspectRatio,
+                                                                    Qt.SmoothTransformation)
+        self.signals.decoded.emit(self.url, images, (time.perf_counter() - start) * 1000)
+
+
+class IconLoader(QObject):
+    """
+    An application-wide loader for weather icons.
+    Downloads go through one QNetworkAccessManager backed by a QNetworkDiskCache, scaled pixmaps are kept in a
+    bounded in-memory cache keyed by URL and size, and concurrent requests for the same URL share one download.
+    Icons are decoded and scaled into QImages on a worker pool; only the QImage to QPixmap conversion happens on
+    the GUI thread.
+    """
+
+    def __init__(self, parent=None, cache_directory="data/icon_cache", max_pixmaps=64):
+        super().__init__(parent)
+        self.max_pixmaps = max_pixmaps
+
+        disk_cache = QNetworkDiskCache(self)
+        disk_cache.setCacheDirectory(cache_directory)
+        self.manager = QNetworkAccessManager(self)
+        self.manager.setCache(disk_cache)
+        self.manager.finished.connect(self._on_reply_finished)
+
+        self.decode_pool = QThreadPool(self)
+        self.decode_pool.setMaxThreadCount(2)
+        self._decode_signals = _IconDecodeSignals(self)
+        self._decode_signals.decoded.connect(self._on_icon_decoded)
+
+        # (url, size) -> scaled QPixmap, least recently used first
+        self._pixmaps = OrderedDict()
+        # url -> list of (size, callback) waiting for the download or decode in flight
+        self._pending = {}
+        # url -> decode and scale time in milliseconds, for the most recent decode of each icon
+        self.decode_times = {}
+
+    def request(self, url, size, callback):
+        """
+        Calls callback(url, pixmap) with the icon scaled to fit a size x size box, or callback(url, None) if it
+        could not be loaded. The callback runs immediately when the pixmap is already cached.
+        """
+        key = (url, size)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            callback(url, pixmap)
+            return
+
+        if url in self._pending:
+            # A download for this URL is already in flight; wait for it instead of starting another
+            self._pending[url].append((size, callback))
+            return
+
+        self._pending[url] = [(size, callback)]
+        request = QNetworkRequest(QUrl(url))
+        request.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.PreferCache)
+        request.setAttribute(QNetworkRequest.User, url)
+        self.manager.get(request)
+
+    def _on_reply_finished(self, reply):
+        """Hands the downloaded bytes to the decode pool, or reports the failure to every waiting subscriber."""
+        url = reply.request().attribute(QNetworkRequest.User)
+        failed = bool(reply.error())
+        data = None if failed else bytes(reply.readAll())
+        reply.deleteLater()
+
+        if failed:
+            for _, callback in self._pending.pop(url, []):
+                callback(url, None)
+            return
+
+        sizes = {size for size, _ in self._pending.get(url, [])}
+        self.decode_pool.start(_IconDecodeTask(url, data, sizes, self._decode_signals))
+
+    def _on_icon_decoded(self, url, images, decode_ms):
+        """Converts the decoded images to pixmaps on the GUI thread and hands them to every waiting subscriber."""
+        self.decode_times[url] = decode_ms
+        pixmaps = {}
+        for size, image in images.items():
+            pixmaps[size] = None if image is None else QPixmap.fromImage(image)
+            if pixmaps[size] is not None:
+                self._remember((url, size), pixmaps[size])
+
+        for size, callback in self._pending.pop(url, []):
+            if size in pixmaps:
+                callback(url, pixmaps[size])
+            else:
+                # Subscribed with a new size while the icon was being decoded
+                self.request(url, size, callback)
+
+    def _remember(self, key, pixmap):
+        self._pixmaps[key] = pixmap
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self.max_pixmaps:
+            self._pixmaps.popitem(last=False)
+
+
+_shared_icon_loader = None
+
+
+def get_icon_loader():
+    """Returns the application-wide IconLoader, creating it on first use (must be called on the GUI thread)."""
+    global _shared_icon_loader
+    if _shared_icon_loader is None:
+        _shared_icon_loader = IconLoader()
+    return _shared_icon_loader
+
+
+def set_icon_loader(loader):
+    """Replaces the application-wide IconLoader, e.g. with one that keeps its disk cache in a temporary directory."""
+    global _shared_icon_loader
+    _shared_icon_loader = loader
@@ -1,9 +1,7 @@
 import os
-from services import GeolocatorService
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QWidget, QLineEdit, QPushButton, QHBoxLayout, QMessageBox
-from .colors import HIGHLIGHT_BACKGROUND, WIDGET_BACKGROUND
 
 
 class LocationSearchWidget(QWidget):
@@ -12,9 +10,14 @@ class LocationSearchWidget(QWidget):
     def __init__(self, parent=None):
         """Set up the UI components."""
         super().__init__(parent)
-        self.geo_service = GeolocatorService()
+        # Built on the first search, so geopy is not imported and no Nominatim client is created at startup
+        self._geo_service = None
 
-        self.setStyleSheet(f"background-color: {WIDGET_BACKGROUND}; border: none;")
+        # Each search gets an id; only the result of the latest search is acted on
+        self._search_id = 0
+        self._geocode_workers = set()
+
+        self.setObjectName("LocationSearch")
 
         # Configure Font
         font = QFont()
@@ -25,7 +28,6 @@ class LocationSearchWidget(QWidget):
         self.search_bar.setPlaceholderText("Enter location")
         self.search_bar.setFont(font)
         self.search_bar.setFixedHeight(40)
-        self.search_bar.setStyleSheet("padding-left: 5px; padding-right: 5px")
         self.search_bar.returnPressed.connect(self.search_location)
 
         # Create and Configure Search Button
@@ -33,11 +35,6 @@ class LocationSearchWidget(QWidget):
         self.search_button.setFont(font)
         self.search_button.setFixedSize(80, 40)
         self.search_button.clicked.connect(self.search_location)
-        self.search_button.setStyleSheet(f"""
-            QPushButton:hover {{
-                background-color: {HIGHLIGHT_BACKGROUND};
-            }}
-        """)
 
         # Layout Setup
         layout = QHBoxLayout()
@@ -48,13 +45,41 @@ class LocationSearchWidget(QWidget):
         self.setLayout(layout)
 
     def search_location(self):
-        """Handles location search and emits a signal if confirmed."""
+        """Starts a background location search, superseding any search still in progress."""
         location_text = self.search_bar.text().strip()
         if not location_text:
             QMessageBox.warning(self, "Input Error", "Please enter a location.")
             return
 
-        location = self.geo_service.get_location(location_text)
+        # Ask older searches to stop before they reach the geocoder; their results are ignored either way
+        for worker in self._geocode_workers:
+            worker.requestInterruption()
+
+        # Imported on first use, together with geopy
+        from services import GeocodeWorker
+
+        self._search_id += 1
+        worker = GeocodeWorker(self.geo_service, self._search_id, location_text)
+        worker.geocode_finished.connect(self.handle_geocode_result)
+        worker.finished.connect(lambda: self._release_worker(worker))
+        self._geocode_workers.add(worker)
+        self._set_busy(True)
+        worker.start()
+
+    @property
+    def geo_service(self):
+        """The geocoding service, built on first use."""
+        if self._geo_service is None:
+            from services import GeolocatorService
+            self._geo_service = GeolocatorService()
+        return self._geo_service
+
+    def handle_geocode_result(self, search_id, location_text, location):
+        """Handles a finished search and emits a signal if the location is confirmed."""
+        if search_id != self._search_id:
+            return  # Superseded by a newer search
+
+        self._set_busy(False)
         if location:
             if self._confirm_location(location.address):
                 self._clear_previous_forecast()
@@ -64,13 +89,15 @@ class LocationSearchWidget(QWidget):
             QMessageBox.warning(self, "Location Not Found",
                                 "Could not find the location. Please try a different query.")
 
-    def _geocode_location(self, location_text):
-        """Fetch location data using geopy."""
-        try:
-            return self.geolocator.geocode(location_text)
-        except Exception as e:
-            QMessageBox.critical(self, "Geocoder Error", f"Error accessing geocoding service: {e}")
-            return None
+    def _release_worker(self, worker):
+        """Drops the reference to a finished search worker."""
+        self._geocode_workers.discard(worker)
+        worker.deleteLater()
+
+    def _set_busy(self, busy):
+        """Shows whether a search is in progress (pressing Enter still starts a newer search)."""
+        self.search_button.setEnabled(not busy)
+        self.setCursor(Qt.BusyCursor if busy else Qt.ArrowCursor)
 
     def _confirm_location(self, address):
         """Prompt the user to confirm the found location."""
@@ -79,7 +106,8 @@ class LocationSearchWidget(QWidget):
 
     def _clear_previous_forecast(self):
         """Remove old forecast data files if they exist."""
-        for filename in ['data/daily_forecast_data.csv', 'data/hourly_forecast_data.csv']:
+        for filename in ['data/daily_forecast_data.csv', 'data/hourly_forecast_data.csv',
+                         'data/daily_forecast_data.fcst', 'data/hourly_forecast_data.fcst']:
             try:
                 if os.path.exists(filename):
                     os.remove(filename)
@@ -1,7 +1,7 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout
-from services import ForecastWorker
-from models import DailyForecastManager, HourlyForecastManager
-from .colors import TEXT, WINDOW_BACKGROUND
+import time
+from PyQt5.QtCore import QEvent, Qt
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout
+from services import RefreshScheduler
 from .current_weather import CurrentWeatherWidget
 from .forecast_tabs import ForecastTabsWidget
 from .forecast_heading import ForecastHeadingWidget
@@ -13,10 +13,26 @@ class WeatherMainWindow(QWidget):
         """Sets up the UI layout and widgets."""
         super().__init__(parent)
 
-        self.setStyleSheet(f"background-color: {WINDOW_BACKGROUND}; color: {TEXT};")
+        self.setObjectName("WeatherMainWindow")
 
         self.setFixedSize(600, 800)
 
+        # An optional ForecastExporter (such as services.StoreForecastExporter) that persists the shown forecasts
+        # in the background; off by default, since nothing in the app reads the files back
+        self.forecast_exporter = None
+
+        # Each forecast request gets a generation; only the result of the latest one is shown or exported
+        self._forecast_generation = 0
+        self._forecast_workers = set()
+
+        # The shown location is refreshed in the background once its forecast is expected to have changed upstream
+        self._forecast_location = None
+        self._refreshing = False
+        self.refresh_scheduler = RefreshScheduler(self)
+        self.refresh_scheduler.refreshDue.connect(self.handle_refresh_due)
+        # Refreshes pause while the window is hidden or minimized, or the app is not the active one
+        QApplication.instance().applicationStateChanged.connect(self._update_refresh_pause)
+
         self.search_widget = LocationSearchWidget(self)
         self.search_widget.locationConfirmed.connect(self.handle_location_confirmed)
         self.heading_widget = ForecastHeadingWidget(self)
@@ -36,31 +52,89 @@ class WeatherMainWindow(QWidget):
         """Handles the location confirmation event."""
         self.heading_widget.update_data(location.address)
 
+        # The previous location is no longer shown, so stop refreshing it
+        self.refresh_scheduler.clear()
+        self._forecast_location = location
+        self._start_forecast_worker(location, refreshing=False)
+
+    def handle_refresh_due(self, keys):
+        """Refreshes the shown location when the scheduler finds its forecast stale."""
+        if self._forecast_location is not None and self._location_key(self._forecast_location) in keys:
+            self._start_forecast_worker(self._forecast_location, refreshing=True)
+
+    def _start_forecast_worker(self, location, refreshing):
+        """Starts fetching a location's forecasts as a new generation, superseding any fetch still running."""
+        # Imported on first use, since it brings in requests and the forecast models
+        from services import ForecastWorker
+
+        # Cancel workers still fetching an older location before they make their remaining requests
+        for worker in self._forecast_workers:
+            worker.cancel()
+
         # Start forecast worker thread
-        self.worker = ForecastWorker(location)
-        self.worker.worker_finished.connect(self.handle_forecast_result)
-        self.worker.start()
+        self._refreshing = refreshing
+        self._forecast_generation += 1
+        worker = ForecastWorker(location, self._forecast_generation)
+        worker.worker_finished.connect(self.handle_forecast_result)
+        worker.finished.connect(lambda: self._release_worker(worker))
+        self._forecast_workers.add(worker)
+        worker.start()
+
+    def handle_forecast_result(self, generation, success, message, daily_manager, hourly_manager):
+        """Handles the forecast result update with the forecasts the worker already loaded."""
+        if generation != self._forecast_generation:
+            return  # Superseded by a newer request
 
-    def handle_forecast_result(self, success, message, daily_generated_time, hourly_generated_time):
-        """Handles the forecast result update."""
         print(message)
-        if success:
-            daily_manager = DailyForecastManager("data/daily_forecast_data.csv", daily_generated_time)
-            hourly_manager = HourlyForecastManager("data/hourly_forecast_data.csv", hourly_generated_time)
-
-            if daily_manager.load_forecasts() and hourly_manager.load_forecasts():
-                daily_forecasts = daily_manager.get_forecasts()
-                hourly_forecasts = hourly_manager.get_forecasts()
-                self.current_weather_widget.update_data(hourly_forecasts[0].temperature_fahrenheit,
-                                                        hourly_forecasts[0].short_forecast)
-                self.forecast_tabs_widget.update_data(daily_generated_time, hourly_generated_time, daily_forecasts,
-                                                      hourly_forecasts)
-            else:
-                self.heading_widget.clear_data()
-                self.current_weather_widget.clear_data()
-                self.forecast_tabs_widget.clear_data()
+        if success and daily_manager.get_forecasts() and hourly_manager.get_forecasts():
+            # Only the current location's forecasts are persisted, so a stale worker never overwrites them
+            if self.forecast_exporter is not None:
+                self.forecast_exporter.export(daily_manager.rows, hourly_manager.rows)
+            self.refresh_scheduler.schedule(self._location_key(self._forecast_location), daily_manager, hourly_manager)
+            daily_forecasts = daily_manager.get_forecasts()
+            hourly_forecasts = hourly_manager.get_forecasts()
+            # Show the period in effect now, falling back to the first one if the forecast does not cover now
+            current_forecast = hourly_manager.time_index.period_at(time.time()) or hourly_forecasts[0]
+            self.current_weather_widget.update_data(current_forecast.temperature_fahrenheit,
+                                                    current_forecast.short_forecast)
+            # A background refresh updates the tabs in place, so the user keeps their place in them
+            self.forecast_tabs_widget.update_data(daily_manager.generated_at, hourly_manager.generated_at,
+                                                  daily_forecasts, hourly_manager.time_index, self._refreshing)
+        elif self._refreshing:
+            # A failed background refresh keeps the forecasts already shown and tries again later
+            self.refresh_scheduler.schedule_retry(self._location_key(self._forecast_location))
         else:
             # Data retrieval failed, update UI to show no data
             self.heading_widget.clear_data()
             self.current_weather_widget.clear_data()
             self.forecast_tabs_widget.clear_data()
+
+    def _release_worker(self, worker):
+        """Drops the reference to a finished forecast worker."""
+        self._forecast_workers.discard(worker)
+        worker.deleteLater()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_refresh_pause()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._update_refresh_pause()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._update_refresh_pause()
+
+    def _update_refresh_pause(self, *_):
+        """Pauses background refreshes while nobody can see the forecasts, and resumes them when someone can."""
+        if self.isVisible() and not self.isMinimized() \
+                and QApplication.applicationState() == Qt.ApplicationActive:
+            self.refresh_scheduler.resume()
+        else:
+            self.refresh_scheduler.pause()
+
+    @staticmethod
+    def _location_key(location):
+        return round(location.latitude, 4), round(location.longitude, 4)
@@ -0,0 +1,153 @@
+from PyQt5.QtWidgets import QApplication
+from . import colors
+
+# A palette maps the color roles used by the stylesheet to color values
+DARK_PALETTE = {
+    "text": colors.TEXT,
+    "window_background": colors.WINDOW_BACKGROUND,
+    "widget_background": colors.WIDGET_BACKGROUND,
+    "highlight_background": colors.HIGHLIGHT_BACKGROUND,
+}
+
+LIGHT_PALETTE = {
+    "text": "#1e1f22",
+    "window_background": "#f2f3f5",
+    "widget_background": "#e3e5e8",
+    "highlight_background": "#c9ccd1",
+}
+
+_current_palette = DARK_PALETTE
+
+
+def build_stylesheet(palette):
+    """
+    Builds the single application-level stylesheet from a palette.
+    Widgets pick up their rules through their object names, so none of them needs its own setStyleSheet call.
+    Rules for a widget itself are written as QWidget#Name so they outrank the #Parent QWidget rules above them.
+    """
+    text = palette["text"]
+    window = palette["window_background"]
+    widget = palette["widget_background"]
+    highlight = palette["highlight_background"]
+
+    return f"""
+        QWidget#WeatherMainWindow, #WeatherMainWindow QWidget {{
+            background-color: {window};
+            color: {text};
+        }}
+
+        QWidget#LocationSearch, #LocationSearch QWidget {{
+            background-color: {widget};
+            border: none;
+        }}
+        #LocationSearch QLineEdit {{
+            padding-left: 5px;
+            padding-right: 5px;
+        }}
+        #LocationSearch QPushButton:hover {{
+            background-color: {highlight};
+        }}
+
+        QWidget#CurrentWeather {{
+            background-color: {widget};
+            border: none;
+            padding: 7px;
+        }}
+        #CurrentWeather QLabel {{
+            background-color: transparent;
+            padding: 7px;
+        }}
+
+        #ForecastTabs::pane {{
+            background: {window};
+            border: none;
+            padding-top: 3px;
+        }}
+        #ForecastTabs QTabBar::tab {{
+            background: {widget};
+            min-width: 75px;
+            padding: 5px;
+        }}
+        #ForecastTabs QTabBar::tab:selected {{
+            background: {highlight};
+        }}
+
+        QWidget#DailyForecastTab, #DailyForecastTab QWidget, QWidget#HourlyForecastTab, #HourlyForecastTab QWidget {{
+            background-color: {widget};
+            border: none;
+        }}
+        #DailyForecastTab QTextEdit, #HourlyForecastTab QTextEdit, #HourlyForecastTab QListView {{
+            padding: 5px;
+        }}
+
+        #DailyForecastTab QScrollBar:horizontal {{
+            background: {widget};
+            height: 17px;
+            margin-left: 5px;
+            margin-right: 5px;
+            margin-bottom: 5px;
+            border: none;
+        }}
+        #DailyForecastTab QScrollBar::handle:horizontal {{
+            background: {highlight};
+            min-width: 20px;
+            border-radius: 5px;
+        }}
+        #DailyForecastTab QScrollBar:vertical {{
+            background: {widget};
+            width: 12px;
+            margin: 0px;
+            border: none;
+        }}
+        #DailyForecastTab QScrollBar::handle:vertical {{
+            background: {highlight};
+            min-height: 20px;
+            border-radius: 5px;
+        }}
+        #HourlyForecastTab QScrollBar:vertical {{
+            background: {widget};
+            width: 17px;
+            margin-top: 5px;
+            margin-right: 5px;
+            margin-bottom: 5px;
+            border: none;
+        }}
+        #HourlyForecastTab QScrollBar::handle:vertical {{
+            background: {highlight};
+            min-height: 50px;
+            border-radius: 5px;
+        }}
+        QScrollBar::add-line, QScrollBar::sub-line {{
+            background: none;
+            border: none;
+        }}
+        QScrollBar::add-page, QScrollBar::sub-page {{
+            background: none;
+        }}
+
+        QWidget#DailyForecastCard, #DailyForecastCard QWidget {{
+            background-color: {window};
+        }}
+        #DailyForecastCard QPushButton {{
+            background-color: {widget};
+            border: none;
+            border-radius: 4px;
+            padding: 5px;
+        }}
+        #DailyForecastCard QPushButton:hover {{
+            background-color: {highlight};
+        }}
+    """
+
+
+def current_palette():
+    """Returns the palette of the theme in use, for widgets that paint themselves (e.g. item delegates)."""
+    return _current_palette
+
+
+def apply_theme(palette=None, app=None):
+    """Applies a palette's stylesheet to the whole application; widgets restyle in place without being rebuilt."""
+    global _current_palette
+    _current_palette = palette or _current_palette
+    app = app or QApplication.instance()
+    app.setStyleSheet(build_stylesheet(_current_palette))
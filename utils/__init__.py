@@ -1,14 +1,34 @@
-from .temperature_conversion import celsius_to_fahrenheit, fahrenheit_to_celsius
+from .temperature_conversion import celsius_to_fahrenheit, fahrenheit_to_celsius, celsius_to_fahrenheit_batch, \
+    fahrenheit_to_celsius_batch
 from .formatters import format_temperature, format_precipitation_probability, format_start_time, format_dewpoint, \
-    format_relative_humidity, format_wind
+    format_relative_humidity, format_wind, format_start_epoch, format_number, format_wind_speed, \
+    format_temperature_celsius, format_temperature_fahrenheit, format_dewpoint_celsius, format_dewpoint_fahrenheit, \
+    format_temperatures, format_dewpoints, format_precipitation_probabilities, format_relative_humidities
+from .parsing import parse_number, parse_start_time, parse_wind_speed
 
 __all__ = [
     'celsius_to_fahrenheit',
     'fahrenheit_to_celsius',
+    'celsius_to_fahrenheit_batch',
+    'fahrenheit_to_celsius_batch',
     'format_temperature',
     'format_precipitation_probability',
     'format_start_time',
     'format_dewpoint',
     'format_relative_humidity',
-    'format_wind'
+    'format_wind',
+    'format_start_epoch',
+    'format_number',
+    'format_wind_speed',
+    'format_temperature_celsius',
+    'format_temperature_fahrenheit',
+    'format_dewpoint_celsius',
+    'format_dewpoint_fahrenheit',
+    'format_temperatures',
+    'format_dewpoints',
+    'format_precipitation_probabilities',
+    'format_relative_humidities',
+    'parse_number',
+    'parse_start_time',
+    'parse_wind_speed'
 ]
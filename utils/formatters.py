@@ -1,70 +1,190 @@
-from .temperature_conversion import celsius_to_fahrenheit, fahrenheit_to_celsius
-from datetime import datetime
+from .temperature_conversion import celsius_to_fahrenheit, fahrenheit_to_celsius, celsius_to_fahrenheit_batch, \
+    fahrenheit_to_celsius_batch, as_float_column
+from datetime import datetime, timezone
+from functools import lru_cache
+from .parsing import parse_number, parse_start_time
+
+# Formatters that are wrapped in lru_cache return one shared string per distinct value, since the same few
+# temperatures, percentages, dates and times recur across every period of a forecast
+
+
+def _is_missing(value):
+    """None, empty text and NaN mark a missing value, for the scalar and the batch formatters alike."""
+    return value is None or value == "" or value != value
 
 
 def format_temperature(temperature_value, temperature_unit):
-    if not temperature_value or not temperature_unit:
-        return "N/A", "N/A"
+    return format_temperature_celsius(temperature_value, temperature_unit), \
+        format_temperature_fahrenheit(temperature_value, temperature_unit)
 
-    try:
-        temperature_value = float(temperature_value)
-    except (ValueError, TypeError):
-        return "N/A", "N/A"
 
-    if temperature_unit == "C":
-        temperature_celsius = f"{temperature_value:.1f}°C"
-        temperature_fahrenheit = f"{celsius_to_fahrenheit(temperature_value):.0f}°F"
-    else:
-        temperature_celsius = f"{fahrenheit_to_celsius(temperature_value):.1f}°C"
-        temperature_fahrenheit = f"{temperature_value:.0f}°F"
+def format_temperature_celsius(temperature_value, temperature_unit):
+    return _format_celsius(temperature_value, temperature_unit, "C")
 
-    return temperature_celsius, temperature_fahrenheit
 
+def format_temperature_fahrenheit(temperature_value, temperature_unit):
+    return _format_fahrenheit(temperature_value, temperature_unit, "C")
 
+
+@lru_cache(maxsize=1024)
 def format_precipitation_probability(precipitation_probability_value):
     return f"💧{precipitation_probability_value or '0'}%"
 
 
 def format_start_time(start_time: str):
-    if not start_time:
-        return "N/A", "N/A"
+    start_epoch, utc_offset = parse_start_time(start_time)
+    return format_start_epoch(start_epoch, utc_offset)
 
-    try:
-        dt = datetime.fromisoformat(start_time)
-    except ValueError:
+
+def format_start_epoch(start_epoch, utc_offset=0):
+    if start_epoch is None:
         return "N/A", "N/A"
 
-    date = dt.strftime("%A, %b %d")  # e.g., "Wednesday, Feb 26"
-    time = dt.strftime("%I:%M %p")  # e.g., "08:00 AM"
+    # Date and time strings only depend on the local day and minute, so periods share one cached copy of each
+    local_seconds = start_epoch + utc_offset
+    return _format_local_date(local_seconds // 86400), _format_local_time(local_seconds % 86400 // 60)
+
+
+@lru_cache(maxsize=1024)
+def _format_local_date(local_day):
+    return datetime.fromtimestamp(local_day * 86400, timezone.utc).strftime("%A, %b %d")  # e.g., "Wednesday, Feb 26"
+
 
-    return date, time
+@lru_cache(maxsize=1440)
+def _format_local_time(local_minute):
+    return datetime.fromtimestamp(local_minute * 60, timezone.utc).strftime("%I:%M %p")  # e.g., "08:00 AM"
 
 
 def format_dewpoint(dewpoint_value, dewpoint_unit):
-    if not dewpoint_value or not dewpoint_unit:
-        return "N/A", "N/A"
+    return format_dewpoint_celsius(dewpoint_value, dewpoint_unit), \
+        format_dewpoint_fahrenheit(dewpoint_value, dewpoint_unit)
+
+
+def format_dewpoint_celsius(dewpoint_value, dewpoint_unit):
+    return _format_celsius(dewpoint_value, dewpoint_unit, "wmoUnit:degC")
+
+
+def format_dewpoint_fahrenheit(dewpoint_value, dewpoint_unit):
+    return _format_fahrenheit(dewpoint_value, dewpoint_unit, "wmoUnit:degC")
+
+
+def _parse_degrees(value, unit):
+    if _is_missing(value) or not unit:
+        return None
 
     try:
-        dewpoint_value = float(dewpoint_value)
+        value = float(value)
     except (ValueError, TypeError):
-        return "N/A", "N/A"
+        return None
+    return None if _is_missing(value) else value
 
-    if dewpoint_unit == "wmoUnit:degC":
-        dewpoint_celsius = f"{dewpoint_value:.1f}°C"
-        dewpoint_fahrenheit = f"{celsius_to_fahrenheit(dewpoint_value):.0f}°F"
-    else:
-        dewpoint_celsius = f"{fahrenheit_to_celsius(dewpoint_value):.1f}°C"
-        dewpoint_fahrenheit = f"{dewpoint_value:.0f}°F"
 
-    return dewpoint_celsius, dewpoint_fahrenheit
+@lru_cache(maxsize=1024)
+def _format_celsius(value, unit, celsius_unit):
+    value = _parse_degrees(value, unit)
+    if value is None:
+        return "N/A"
+
+    return _celsius_text(value if unit == celsius_unit else fahrenheit_to_celsius(value))
+
+
+@lru_cache(maxsize=1024)
+def _format_fahrenheit(value, unit, celsius_unit):
+    value = _parse_degrees(value, unit)
+    if value is None:
+        return "N/A"
+
+    return _fahrenheit_text(celsius_to_fahrenheit(value) if unit == celsius_unit else value)
 
 
+def _celsius_text(value):
+    return f"{value:.1f}°C"
+
+
+def _fahrenheit_text(value):
+    return f"{value:.0f}°F"
+
+
+@lru_cache(maxsize=1024)
 def format_relative_humidity(relative_humidity_value):
     return f"{relative_humidity_value or '0'}%"
 
 
+def format_number(value):
+    """Formats a number or numeric text, dropping a whole number's ".0"; missing and invalid values give ""."""
+    number = parse_number(value)
+    if number is None:
+        return ""
+
+    return str(int(number)) if number.is_integer() else str(number)
+
+
+def format_wind_speed(wind_speed_low, wind_speed_high):
+    if wind_speed_high is None:
+        return ""
+
+    if wind_speed_low is None or wind_speed_low == wind_speed_high:
+        return f"{format_number(wind_speed_high)} mph"
+
+    return f"{format_number(wind_speed_low)} to {format_number(wind_speed_high)} mph"
+
+
 def format_wind(wind_speed, wind_direction):
     if not wind_speed and not wind_direction:
         return "N/A"
 
     return f"{wind_speed} {wind_direction}"
+
+
+# Batch variants: each takes a whole column of numbers (a list, array.array, NumPy array or ForecastStore column,
+# with NaN or None for missing values) and returns a list of strings identical to what the scalar formatters give
+
+
+def format_temperatures(temperature_values, temperature_unit):
+    """Formats a column of temperatures in one unit; returns the Celsius and the Fahrenheit strings as two lists."""
+    return _format_degrees_column(temperature_values, temperature_unit, "C")
+
+
+def format_dewpoints(dewpoint_values, dewpoint_unit):
+    """Formats a column of dewpoints in one unit; returns the Celsius and the Fahrenheit strings as two lists."""
+    return _format_degrees_column(dewpoint_values, dewpoint_unit, "wmoUnit:degC")
+
+
+def format_precipitation_probabilities(precipitation_probability_values):
+    return _format_column(as_float_column(precipitation_probability_values),
+                          lambda value: format_precipitation_probability(format_number(value)),
+                          format_precipitation_probability(""))
+
+
+def format_relative_humidities(relative_humidity_values):
+    return _format_column(as_float_column(relative_humidity_values),
+                          lambda value: format_relative_humidity(format_number(value)), format_relative_humidity(""))
+
+
+def _format_degrees_column(values, unit, celsius_unit):
+    values = as_float_column(values)
+    if not unit:
+        return ["N/A"] * len(values), ["N/A"] * len(values)
+
+    # Convert the whole column at once, then format each distinct value only once
+    if unit == celsius_unit:
+        celsius, fahrenheit = values, celsius_to_fahrenheit_batch(values)
+    else:
+        celsius, fahrenheit = fahrenheit_to_celsius_batch(values), values
+
+    return _format_column(celsius, _celsius_text, "N/A"), _format_column(fahrenheit, _fahrenheit_text, "N/A")
+
+
+def _format_column(values, format_value, missing_text):
+    texts = {}
+    formatted = []
+    for value in values.tolist():
+        if _is_missing(value):
+            formatted.append(missing_text)
+            continue
+
+        text = texts.get(value)
+        if text is None:
+            text = texts[value] = format_value(value)
+        formatted.append(text)
+    return formatted
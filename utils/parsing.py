@@ -0,0 +1,45 @@
+import math
+import re
+from datetime import datetime, timezone
+
+_WIND_SPEED_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)(?:\s+to\s+(\d+(?:\.\d+)?))?\s*mph\s*$")
+
+
+def parse_number(value) -> float | None:
+    """Parses a number from an API value or CSV text; empty, invalid and NaN values become None."""
+    if value is None or value == "":
+        return None
+
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return None
+
+    return None if math.isnan(number) else number
+
+
+def parse_start_time(start_time: str) -> tuple[int | None, int]:
+    """Parses an ISO 8601 start time into epoch seconds and its UTC offset in seconds (None, 0 if invalid)."""
+    if not start_time:
+        return None, 0
+
+    try:
+        dt = datetime.fromisoformat(start_time)
+    except (ValueError, TypeError):
+        return None, 0
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return int(dt.timestamp()), int(dt.utcoffset().total_seconds())
+
+
+def parse_wind_speed(wind_speed: str) -> tuple[float | None, float | None]:
+    """Parses "10 mph" or "5 to 10 mph" into the low and high speeds in mph (both None if not understood)."""
+    match = _WIND_SPEED_PATTERN.match(wind_speed or "")
+    if not match:
+        return None, None
+
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    return low, high
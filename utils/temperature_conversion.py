@@ -1,6 +1,74 @@
+from array import array
+
+# NumPy is optional and slow to import, so it is only imported by the first batch conversion (see load_numpy)
+numpy = None
+_numpy_loaded = False
+
+
 def celsius_to_fahrenheit(celsius: float) -> float:
     return (celsius * 9 / 5) + 32
 
 
 def fahrenheit_to_celsius(fahrenheit: float) -> float:
     return (fahrenheit - 32) * 5 / 9
+
+
+def load_numpy():
+    """Imports NumPy on first call and returns it, or None if it is not installed."""
+    global numpy, _numpy_loaded
+    if not _numpy_loaded:
+        _numpy_loaded = True
+        try:
+            import numpy as numpy_module
+        except ImportError:  # The batch functions fall back to array.array
+            numpy_module = None
+        numpy = numpy_module
+    return numpy
+
+
+def celsius_to_fahrenheit_batch(celsius):
+    """
+    Converts a whole column of Celsius values (NaN for missing values) to Fahrenheit.
+    Returns a NumPy float array when NumPy is installed, and an array.array('d') otherwise.
+    """
+    if load_numpy() is not None:
+        return celsius_to_fahrenheit(as_float_column(celsius))
+    return array("d", [celsius_to_fahrenheit(value) for value in as_float_column(celsius)])
+
+
+def fahrenheit_to_celsius_batch(fahrenheit):
+    """
+    Converts a whole column of Fahrenheit values (NaN for missing values) to Celsius.
+    Returns a NumPy float array when NumPy is installed, and an array.array('d') otherwise.
+    """
+    if load_numpy() is not None:
+        return fahrenheit_to_celsius(as_float_column(fahrenheit))
+    return array("d", [fahrenheit_to_celsius(value) for value in as_float_column(fahrenheit)])
+
+
+def as_float_column(values):
+    """
+    Returns values as a column of floats (a NumPy array, or an array.array('d') without NumPy), with None for a
+    missing value becoming NaN. Columns that already hold doubles, such as a ForecastStore column, are not copied
+    when NumPy is installed.
+    """
+    if load_numpy() is not None:
+        if isinstance(values, numpy.ndarray) and values.dtype == numpy.float64:
+            return values
+        if _is_double_buffer(values):
+            return numpy.frombuffer(values, dtype=numpy.float64)
+        # NumPy already turns None into NaN when converting to floats
+        return numpy.asarray(values, dtype=numpy.float64)
+
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    if _is_double_buffer(values):
+        return array("d", values)
+    return array("d", [float("nan") if value is None else value for value in values])
+
+
+def _is_double_buffer(values) -> bool:
+    try:
+        return memoryview(values).format == "d"
+    except TypeError:
+        return False